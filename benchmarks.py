@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from travel_ethiopia import traveling_ethiopia_ifs as ifs
+from travel_ethiopia import traveling_ethiopia_minimax as minimax
+from travel_ethiopia import traveling_ethiopia_ucs as ucs
+from travel_ethiopia import traveling_ethiopia_ufs as ufs
+from travel_ethiopia.road_generator import generate_network
+from travel_ethiopia.stats import SearchStats
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+SEARCH_MODULES = (
+    'travel_ethiopia.traveling_ethiopia_ufs',
+    'travel_ethiopia.traveling_ethiopia_ucs',
+    'travel_ethiopia.traveling_ethiopia_ifs',
+    'travel_ethiopia.traveling_ethiopia_minimax',
+)
+IMPORT_BUDGET_MS = 400.0  # Cold import of every search module, NumPy included
+PLOTTING_MODULES = ('matplotlib', 'networkx')
+
+_IMPORT_PROBE = '''
+import json, sys, time
+began = time.perf_counter()
+for module in sys.argv[1:]:
+    __import__(module)
+elapsed = (time.perf_counter() - began) * 1000
+print(json.dumps({'ms': elapsed, 'plotting': [m for m in %r if m in sys.modules]}))
+''' % (PLOTTING_MODULES,)
+
+
+def _measure(run, queries):
+    """
+    Time ``run(query)`` for every query, then repeat the first one under tracemalloc.
+
+    The latencies are measured without instrumentation; the work counters come from a
+    second pass that runs every query again with a SearchStats.
+
+    Returns:
+        dict: Mean/p95/max latency in ms, peak traced memory in KiB and the summed
+        SearchStats counters (``nodes_expanded``, ``edges_relaxed``, ...).
+    """
+    timings = []
+    for query in queries:
+        began = time.perf_counter()
+        run(query)
+        timings.append((time.perf_counter() - began) * 1000)
+
+    stats = SearchStats()
+    for query in queries:
+        run(query, stats)
+
+    tracemalloc.start()
+    run(queries[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'queries': len(queries),
+        'mean_ms': statistics.fmean(timings),
+        'p95_ms': timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+        'max_ms': timings[-1],
+        'peak_kib': peak / 1024,
+        **{field: value for field, value in stats.as_dict().items() if field != 'elapsed'},
+    }
+
+
+def measure_import_time(modules=SEARCH_MODULES, repeats=5):
+    """
+    Time importing the search modules in fresh interpreters.
+
+    Each run starts a new Python process, so nothing is cached in ``sys.modules``; the
+    fastest of ``repeats`` runs is reported to filter out scheduling noise.
+
+    Args:
+        modules (tuple, optional): Modules to import. Defaults to SEARCH_MODULES.
+        repeats (int, optional): Number of fresh interpreters. Defaults to 5.
+
+    Returns:
+        dict: The best import time in ms, the budget, the plotting modules the import
+        pulled in (should be none) and whether the import stayed within budget.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    plotting = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', _IMPORT_PROBE, *modules], cwd=root,
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+        timings.append(result['ms'])
+        plotting = result['plotting']
+    best = min(timings)
+    return {
+        'import_ms': best,
+        'budget_ms': IMPORT_BUDGET_MS,
+        'plotting_loaded': plotting,
+        'within_budget': best <= IMPORT_BUDGET_MS and not plotting,
+    }
+
+
+def benchmark_size(size, queries=20, goals=8, seed=0):
+    """
+    Benchmark every search engine on one generated network.
+
+    Args:
+        size (int): Number of cities.
+        queries (int, optional): Random queries per algorithm. Defaults to 20.
+        goals (int, optional): Goals per multi-goal query. Defaults to 8.
+        seed (int, optional): Random seed for the network and the queries. Defaults to 0.
+
+    Returns:
+        list: One result dict per algorithm.
+    """
+    network = generate_network(size, seed=seed)
+    rng = random.Random(seed)
+    names = network.cities
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(queries)]
+    tours = [(start, rng.sample(names, goals)) for start, _ in pairs[:max(1, queries // 4)]]
+
+    cities, ufs_roads = network.to_ufs()
+    agent = ufs.TravelEthiopia(cities, ufs_roads, names[0], names[0], strategy="BFS")
+    ucs_agent = ucs.TravelEthiopia(network.to_ucs(), cache_size=0)
+    astar = ifs.AStarSearch(ifs.CityGraph(network.to_ifs()))
+    astar.graph.landmarks  # Preprocessing is not part of the query time
+    decision = minimax.TravelEthiopia(network.to_minimax(seed=seed))
+
+    def uninformed(strategy):
+        def run(pair, stats=None):
+            agent.initial_state, agent.goal_state = pair
+            agent.strategy = strategy
+            agent.search(stats)
+        return run
+
+    def uniform_cost(pair, stats=None):
+        ucs_agent.find_path(*pair, stats=stats)
+
+    def multi_goal(tour, stats=None):
+        ucs_agent.find_path_to_multiple_goals(*tour, stats=stats)
+
+    def a_star(pair, stats=None):
+        astar.search(*pair, stats=stats)
+
+    def best_move(_, stats=None):
+        decision.find_best_move(names[0], stats=stats)
+
+    runs = [
+        ('BFS', uninformed("BFS"), pairs),
+        ('DFS', uninformed("DFS"), pairs),
+        ('BIBFS', uninformed("BIBFS"), pairs),
+        ('UCS', uniform_cost, pairs),
+        ('A*', a_star, pairs),
+        ('multi-goal', multi_goal, tours),
+        ('minimax', best_move, [None]),
+    ]
+    results = []
+    for algorithm, run, inputs in runs:
+        result = {'size': size, 'edges': len(network.edges), 'algorithm': algorithm}
+        result.update(_measure(run, inputs))
+        results.append(result)
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, queries=20, seed=0, output=None):
+    """
+    Benchmark every engine on each network size and optionally write the results as JSON.
+
+    Args:
+        sizes (tuple, optional): Network sizes in cities. Defaults to DEFAULT_SIZES.
+        queries (int, optional): Random queries per algorithm and size. Defaults to 20.
+        seed (int, optional): Random seed. Defaults to 0.
+        output (str, optional): Path of the JSON report. Defaults to not writing one.
+
+    Returns:
+        dict: The report.
+    """
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'import': measure_import_time(),
+        'results': [result for size in sizes for result in benchmark_size(size, queries, seed=seed)],
+    }
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the search engines on synthetic road networks.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="network sizes in cities (up to 1000000)")
+    parser.add_argument('--queries', type=int, default=20, help="random queries per algorithm")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON report path")
+    parser.add_argument('--check-import', action='store_true',
+                        help="only measure the import time, failing if it exceeds the budget")
+    args = parser.parse_args()
+
+    if args.check_import:
+        result = measure_import_time()
+        print(f"import {result['import_ms']:.1f} ms (budget {result['budget_ms']:.0f} ms), "
+              f"plotting modules loaded: {result['plotting_loaded'] or 'none'}")
+        sys.exit(0 if result['within_budget'] else 1)
+
+    report = run_benchmarks(args.sizes, args.queries, args.seed, args.output)
+    for result in report['results']:
+        print(f"{result['size']:>8} {result['algorithm']:<11} {result['mean_ms']:10.2f} ms "
+              f"{result['peak_kib']:10.1f} KiB  expanded={result['nodes_expanded']} "
+              f"relaxed={result['edges_relaxed']} pruned={result['pruned']}")
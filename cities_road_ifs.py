@@ -1,99 +0,0 @@
-cities = [
-    'Kartum', 'Asmera', 'Shire', 'Adigrat', 'Axum', 'Adwa', 'Debarke', 'Mekelle', 'Sekota', 'Metema', 'Gondar',
-    'Kilbet Rasu', 'Fanti Rasu', 'Azezo', 'Debre Tabor', 'Alamata', 'Samara', 'Woldia', 'Lalibela', 'Metekel', 'Bahir Dar',
-    'Finote Selam', 'Injibara', 'Debre Markos', 'Dessie', 'Kemise', 'Debre Sina', 'Gabi Rasu', 'Debre Birhan',
-    'Assosa', 'Dembi Dollo', 'Gimbi', 'Nekemte', 'Ambo', 'Addis Ababa', 'Bedelle', 'Wolkite', 'Buta Jirra',
-    'Adama', 'Matahara', 'Awash', 'Chiro', 'Dire Dawa', 'Harar', 'Babile', 'Jigjiga', 'Dega Habur',
-    'Batu', 'Asella', 'Gambella', 'Gore', 'Jimma', 'Hossana', 'Worabe', 'Tepi', 'Bonga', 'Shashemene',
-    'Assasa', 'Mezan Teferi', 'Dawro', 'Wolaita Sodo', 'Hawassa', 'Dodolla', 'Bale', 'Goba', 'Sof Oumer',
-    'Kebri Dehar', 'Werder', 'Humera',
-    'Juba', 'Bench Maji', 'Basketo', 'Arba Minch', 'Konso', 'Dilla', 'Bule Hora', 'Yabello', 'Moyale',
-    'Liben', 'Gode', 'Dollo', 'Mokadisho',
-    'Nairobi'
-]
-
-roads = {
-    'Kartum': { 'cost': 81, 'neighbors': [('Humera', 21), ('Metema', 19)] },
-    'Humera': {'cost': 65, 'neighbors': [('Shire', 8), ('Gondar', 9)]},
-    'Shire': {'cost': 67, 'neighbors': [('Axum', 2), ('Debarke', 7), ('Humera', 8)]},
-    'Axum': {'cost': 66, 'neighbors': [('Shire', 2), ('Asmera', 5), ('Adwa', 1)]},
-    'Asmera': {'cost': 68, 'neighbors': [('Axum', 5), ('Adigrat', 9)]},
-    'Adigrat': {'cost': 62, 'neighbors': [('Adwa', 4), ('Mekelle', 4), ('Asmera', 9)]},
-    'Metema': {'cost': 62, 'neighbors': [('Kartum', 19), ('Gondar', 7), ('Azezo', 7)]},
-    'Debarke': {'cost': 60, 'neighbors': [('Gondar', 4), ('Shire', 7)]},
-    'Adwa': {'cost': 65, 'neighbors': [('Axum', 1), ('Adigrat', 4), ('Mekelle', 7)]},
-    'Mekelle': {'cost': 58, 'neighbors': [('Adwa', 7), ('Adigrat', 4), ('Sekota', 9), ('Alamata', 5)]},
-    'Gondar': {'cost': 56, 'neighbors': [('Debarke', 4), ('Metema', 7), ('Azezo', 1), ('Debre Tabor', 6)]},
-    'Bahir Dar': {'cost': 48, 'neighbors': [('Azezo', 7), ('Debre Tabor', 4), ('Metekel', 11), ('Injibara', 4), ('Finote Selam', 6)]},
-    'Azezo': {'cost': 55, 'neighbors': [('Gondar', 1), ('Metema', 7), ('Bahir Dar', 7)]},
-    'Debre Tabor': {'cost': 52, 'neighbors': [('Bahir Dar', 4), ('Gondar', 6), ('Lalibela', 8)]},
-    'Lalibela': {'cost': 57, 'neighbors': [('Debre Tabor', 8), ('Sekota', 6), ('Woldia', 7)]},
-    'Sekota': {'cost': 59, 'neighbors': [('Mekelle', 9), ('Alamata', 6), ('Lalibela', 7)]},
-    'Alamata': {'cost': 53, 'neighbors': [('Sekota', 6), ('Mekelle', 5), ('Samara', 11), ('Woldia', 3)]},
-    'Woldia': {'cost': 50, 'neighbors': [('Dessie', 6), ('Alamata', 3), ('Lalibela', 7), ('Samara', 8)]},
-    'Kilbet Rasu': {'cost': 55, 'neighbors': [('Fanti Rasu', 6)]},
-    'Fanti Rasu': {'cost': 49, 'neighbors': [('Samara', 7), ('Kilbet Rasu', 6)]},
-    'Samara': {'cost': 42, 'neighbors': [('Fanti Rasu', 7), ('Alamata', 11), ('Woldia', 8), ('Gabi Rasu', 10)]},
-    'Dessie': {'cost': 44, 'neighbors': [('Woldia', 6), ('Kemise', 4)]},
-    'Kemise': {'cost': 40, 'neighbors': [('Debre Sina', 6), ('Dessie', 4)]},
-    'Debre Sina': {'cost': 33, 'neighbors': [('Kemise', 7), ('Debre Birhan', 2), ('Debre Markos', 17)]},
-    'Metekel': {'cost': 59, 'neighbors': [('Bahir Dar', 11)]},
-    'Injibara': {'cost': 44, 'neighbors': [('Bahir Dar', 4), ('Finote Selam', 2)]},
-    'Finote Selam': {'cost': 42, 'neighbors': [('Bahir Dar', 6), ('Injibara', 2), ('Debre Markos', 3)]},
-    'Debre Markos': {'cost': 39, 'neighbors': [('Finote Selam', 3), ('Debre Sina', 17), ('Debre Sina', 17)]},
-    'Gabi Rasu': {'cost': 32, 'neighbors': [('Samara', 9), ('Awash', 0)]},
-    'Awash': {'cost': 27, 'neighbors': [('Matahara', 1), ('Chiro', 4), ('Addis Ababa', 13)]},
-    'Chiro': {'cost': 31, 'neighbors': [('Awash', 4), ('Dire Dawa', 8)]},
-    'Dire Dawa': {'cost': 31, 'neighbors': [('Chiro', 8), ('Harar', 4)]},
-    'Harar': {'cost': 35, 'neighbors': [('Dire Dawa', 4), ('Babile', 2)]},
-    'Babile': {'cost': 37, 'neighbors': [('Harar', 2), ('Jigjiga', 3), ('Goba', 28)]},
-    'Jigjiga': {'cost': 40, 'neighbors': [('Babile', 3), ('Dega Habur', 5)]},
-    'Dega Habur': {'cost': 45, 'neighbors': [('Jigjiga', 5), ('Kebri Dehar', 6)]},
-    'Assosa': {'cost': 51, 'neighbors': [('Dembi Dollo', 12), ('Gimbi', 8)]},
-    'Dembi Dollo': {'cost': 49, 'neighbors': [('Assosa', 12), ('Gimbi', 6), ('Gambella', 4)]},
-    'Gimbi': {'cost': 43, 'neighbors': [('Assosa', 8), ('Dembi Dollo', 6), ('Nekemte', 4)]},
-    'Nekemte': {'cost': 39, 'neighbors': [('Gimbi', 4), ('Ambo', 8), ('Bedelle', 4)]},
-    'Ambo': {'cost': 31, 'neighbors': [('Nekemte', 8), ('Addis Ababa', 5), ('Wolkite', 6)]},
-    'Gambella': {'cost': 51, 'neighbors': [('Dembi Dollo', 4), ('Gore', 5)]},
-    'Gore': {'cost': 46, 'neighbors': [('Gambella', 5), ('Bedelle', 6), ('Tepi', 9)]},
-    'Tepi': {'cost': 41, 'neighbors': [('Gore', 9), ('Mezan Teferi', 4), ('Bonga', 8)]},
-    'Bonga': {'cost': 33, 'neighbors': [('Tepi', 8), ('Mezan Teferi', 4), ('Jimma', 4), ('Dawro', 10)]},
-    'Mezan Teferi': {'cost': 37, 'neighbors': [('Tepi', 4), ('Bonga', 4)]},
-    'Jimma': {'cost': 33, 'neighbors': [('Bonga', 4), ('Bedelle', 7), ('Wolkite', 8)]},
-    'Bedelle': {'cost': 40, 'neighbors': [('Jimma', 7), ('Gore', 6), ('Nekemte', 4)]},
-    'Wolkite': {'cost': 25, 'neighbors': [('Ambo', 6), ('Jimma', 8), ('Worabe', 5), ('Hossana', 5), ('Buta Jirra', 4)]},
-    'Buta Jirra': {'cost': 21, 'neighbors': [('Worabe', 2), ('Batu', 2), ('Wolkite', 5)]},
-    'Batu': {'cost': 19, 'neighbors': [('Buta Jirra', 2), ('Adama', 4), ('Shashemene', 3)]},
-    'Adama': {'cost': 23, 'neighbors': [('Batu', 4), ('Matahara', 3), ('Asella', 4), ('Addis Ababa', 3)]},
-    'Matahara': {'cost': 26, 'neighbors': [('Awash', 1), ('Adama', 3)]},
-    'Addis Ababa': {'cost': 26, 'neighbors': [('Ambo', 5), ('Adama', 3), ('Debre Birhan', 5), ('Debre Markos', 13)]},
-    'Debre Birhan': {'cost': 31, 'neighbors': [('Addis Ababa', 5), ('Debre Sina', 2)]},
-    'Dawro': {'cost': 23, 'neighbors': [('Wolaita Sodo', 6), ('Bonga', 10)]},
-    'Wolaita Sodo': {'cost': 17, 'neighbors': [('Dawro', 6), ('Hossana', 4), ('Arba Minch', 4)]},
-    'Hossana': {'cost': 21, 'neighbors': [('Wolaita Sodo', 4), ('Worabe', 2), ('Shashemene', 7), ('Wolkite', 5)]},
-    'Worabe': {'cost': 22, 'neighbors': [('Wolkite', 5), ('Buta Jirra', 2), ('Hossana', 2), ('Shashemene', 6)]},
-    'Shashemene': {'cost': 16, 'neighbors': [('Batu', 3), ('Hossana', 7), ('Hawassa', 1), ('Dodolla', 3)]},
-    'Assasa': {'cost': 18, 'neighbors': [('Asella', 4), ('Dodolla', 1)]},
-    'Dodolla': {'cost': 19, 'neighbors': [('Robe', 13), ('Assasa', 1), ('Shashemene', 3)]},
-    'Robe': {'cost': 22, 'neighbors': [('Goba', 18), ('Dodolla', 13), ('Sof Oumer', 23), ('Liben', 11)]},
-    'Goba': {'cost': 40, 'neighbors': [('Babile', 28), ('Sof Oumer', 6), ('Robe', 18)]},
-    'Sof Oumer': {'cost': 45, 'neighbors': [('Goba', 6), ('Robe', 23), ('Gode', 23)]},
-    'Kebri Dehar': {'cost': 40, 'neighbors': [('Weder', 6), ('Gode', 5), ('Dega Habur', 6)]},
-    'Gode': {'cost': 35, 'neighbors': [('Dollo', 17), ('Kebri Dehar', 5), ('Mokadisho', 22), ('Sof Oumer', 23)]},
-    'Bench Maji': {'cost': 28, 'neighbors': [('Juba', 22), ('Basketo', 23)]},
-    'Basketo': {'cost': 23, 'neighbors': [('Bench Maji', 5), ('Arba Minch', 10)]},
-    'Arba Minch': {'cost': 13, 'neighbors': [('Wolaita Sodo', 4), ('Konso', 4), ('Basketo', 10)]},
-    'Konso': {'cost': 9, 'neighbors': [('Arba Minch', 4), ('Yabello', 3)]},
-    'Hawassa': {'cost': 15, 'neighbors': [('Shashemene', 1), ('Dilla', 3)]},
-    'Dilla': {'cost': 12, 'neighbors': [('Hawassa', 3), ('Bule Hora', 4)]},
-    'Bule Hora': {'cost': 8, 'neighbors': [('Dilla', 4), ('Yabello', 2)]},
-    'Yabello': {'cost': 6, 'neighbors': [('Bule Hora', 2), ('Moyale', 6), ('Konso', 3)]},
-    'Moyale': {'cost': 0, 'neighbors': [('Yabello', 6), ('Nairobi', 22), ('Liben', 11), ('Dollo', 18), ('Mokadisho', 40)]},
-    'Liben': {'cost': 11, 'neighbors': [('Moyale', 11), ('Robe', 11)]},
-    'Dollo': {'cost': 18, 'neighbors': [('Gode', 17)]},
-    'Asella': {'cost': 22, 'neighbors': [('Assasa', 4), ('Adama', 4)]},
-    'Werder': {'cost': 46, 'neighbors': [('Kebri Dehar', 6)]},
-    'Juba': {'cost': 50, 'neighbors': [('Bench Maji', 22)]},
-    'Mokadisho': {'cost': 40, 'neighbors': [('Gode', 22), ('Moyale', 40)]},
-    'Nairobi': {'cost': 22, 'neighbors': [('Moyale', 22)]}
-}
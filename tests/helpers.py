@@ -0,0 +1,52 @@
+import heapq
+import random
+from collections import deque
+
+
+def random_roads(num_cities, num_roads, seed, max_weight=9):
+    """
+    Random one-way roads in the ``cities_road_ucs`` layout.
+
+    Roads may repeat and some cities may be unreachable, so the engines see the awkward
+    cases as well.
+    """
+    rng = random.Random(seed)
+    names = [f'City {i}' for i in range(num_cities)]
+    roads = {name: [] for name in names}
+    for _ in range(num_roads):
+        a, b = rng.sample(names, 2)
+        roads[a].append((b, rng.randint(1, max_weight)))
+    return roads
+
+
+def dijkstra(roads, start):
+    """Plain Dijkstra over a road dictionary: the distance of every city reachable from start."""
+    distances = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        distance, city = heapq.heappop(heap)
+        if distance > distances[city]:
+            continue
+        for neighbor, weight in roads[city]:
+            if distance + weight < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance + weight
+                heapq.heappush(heap, (distance + weight, neighbor))
+    return distances
+
+
+def bfs_hops(roads, start):
+    """Plain BFS over a road dictionary: the hop count of every city reachable from start."""
+    hops = {start: 0}
+    queue = deque([start])
+    while queue:
+        city = queue.popleft()
+        for neighbor, _ in roads[city]:
+            if neighbor not in hops:
+                hops[neighbor] = hops[city] + 1
+                queue.append(neighbor)
+    return hops
+
+
+def path_cost(roads, path):
+    """Cost of a path along the cheapest road between consecutive cities; fails on a missing road."""
+    return sum(min(weight for neighbor, weight in roads[a] if neighbor == b) for a, b in zip(path, path[1:]))
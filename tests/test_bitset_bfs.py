@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from helpers import bfs_hops, random_roads
+from travel_ethiopia import bitset_bfs
+from travel_ethiopia.bitset_bfs import hop_matrix
+from travel_ethiopia.road_graph import RoadGraph
+
+# Always push, the default switch, and always pull
+DIRECTIONS = [float('inf'), bitset_bfs.PULL_FRACTION, 0.0]
+
+
+def expected_hops(graph, roads, sources, max_hops=None):
+    """The hop matrix from one plain BFS per source."""
+    hops = np.full((len(sources), len(graph)), -1, dtype=np.int32)
+    for row, source in enumerate(sources):
+        for city, count in bfs_hops(roads, graph.names[source]).items():
+            if max_hops is None or count <= max_hops:
+                hops[row, graph.node(city)] = count
+    return hops
+
+
+@pytest.mark.parametrize('pull_fraction', DIRECTIONS)
+@pytest.mark.parametrize('seed', range(4))
+def test_hops_match_bfs(monkeypatch, pull_fraction, seed):
+    """Batches of up to 64 sources, with repeats, give the same hop counts as plain BFS."""
+    monkeypatch.setattr(bitset_bfs, 'PULL_FRACTION', pull_fraction)
+    roads = random_roads(120, 260, seed)
+    graph = RoadGraph.from_roads(roads)
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, len(graph), size=150).tolist()  # Three batches, with repeated sources
+    assert np.array_equal(hop_matrix(graph, sources), expected_hops(graph, roads, sources))
+
+
+@pytest.mark.parametrize('pull_fraction', DIRECTIONS)
+def test_max_hops_cuts_off_the_search(monkeypatch, pull_fraction):
+    """Nodes further than ``max_hops`` are reported as not reached."""
+    monkeypatch.setattr(bitset_bfs, 'PULL_FRACTION', pull_fraction)
+    roads = random_roads(80, 200, seed=11)
+    graph = RoadGraph.from_roads(roads)
+    sources = list(range(0, 80, 5))
+    for max_hops in (0, 1, 3):
+        assert np.array_equal(hop_matrix(graph, sources, max_hops),
+                              expected_hops(graph, roads, sources, max_hops))
+
+
+@pytest.mark.parametrize('pull_fraction', DIRECTIONS)
+def test_long_chains_need_many_levels(monkeypatch, pull_fraction):
+    """Hop counts past 255 survive the bit-sliced level planes."""
+    monkeypatch.setattr(bitset_bfs, 'PULL_FRACTION', pull_fraction)
+    names = [f'City {i}' for i in range(300)]
+    roads = {name: [(names[i + 1], 1)] if i + 1 < len(names) else [] for i, name in enumerate(names)}
+    graph = RoadGraph.from_roads(roads, cities=names)
+    hops = hop_matrix(graph, [0, 299])
+    assert hops[0].tolist() == list(range(300))
+    assert hops[1].tolist() == [-1] * 299 + [0]
+
+
+def test_no_sources():
+    graph = RoadGraph.from_roads(random_roads(10, 20, seed=0))
+    assert hop_matrix(graph, []).shape == (0, len(graph))
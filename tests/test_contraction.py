@@ -0,0 +1,58 @@
+import pytest
+
+from helpers import dijkstra, path_cost, random_roads
+from travel_ethiopia.contraction import ContractionHierarchy
+from travel_ethiopia.road_graph import RoadGraph
+
+INF = float('inf')
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_queries_match_dijkstra(seed):
+    """Every point-to-point query returns the Dijkstra distance along a real path."""
+    roads = random_roads(30, 70, seed)
+    hierarchy = ContractionHierarchy.build(RoadGraph.from_roads(roads))
+    for start in roads:
+        expected = dijkstra(roads, start)
+        for goal in roads:
+            path, cost = hierarchy.find_path(start, goal)
+            if goal not in expected:
+                assert (path, cost) == (None, INF)
+                continue
+            assert cost == expected[goal]
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(roads, path) == cost
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_many_to_many_matches_dijkstra(seed):
+    """The bucket table and its unpacked paths agree with one Dijkstra per source."""
+    roads = random_roads(40, 100, seed)
+    graph = RoadGraph.from_roads(roads)
+    hierarchy = ContractionHierarchy.build(graph)
+    sources, targets = list(range(0, 40, 3)), list(range(1, 40, 4))
+    table, routes = hierarchy.many_to_many(sources, targets, paths=True)
+    for row, source in enumerate(sources):
+        expected = dijkstra(roads, graph.names[source])
+        for column, target in enumerate(targets):
+            assert table[row, column] == expected.get(graph.names[target], INF)
+            route = routes[row][column]
+            if route is None:
+                assert graph.names[target] not in expected
+            else:
+                assert path_cost(roads, graph.path_names(route)) == table[row, column]
+
+
+def test_saved_hierarchy_answers_the_same(tmp_path):
+    """A hierarchy saved under a name without the .npz suffix loads back from that exact file."""
+    roads = random_roads(25, 60, seed=7)
+    hierarchy = ContractionHierarchy.build(RoadGraph.from_roads(roads))
+    path = tmp_path / 'roads.ch'
+    hierarchy.save(str(path))
+    assert [file.name for file in tmp_path.iterdir()] == ['roads.ch']
+
+    loaded = ContractionHierarchy.load(str(path))
+    assert loaded.fingerprint == hierarchy.fingerprint
+    for start in roads:
+        for goal in roads:
+            assert loaded.find_path(start, goal) == hierarchy.find_path(start, goal)
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from helpers import dijkstra, path_cost, random_roads
+from travel_ethiopia.road_generator import generate_network
+from travel_ethiopia.traveling_ethiopia_ucs import TravelEthiopia
+
+INF = float('inf')
+
+
+class RoadMirror:
+    """The road changes replayed on a plain edge list, to recompute distances from scratch."""
+
+    def __init__(self, roads):
+        self.cities = list(roads)
+        self.edges = [[city, neighbor, weight, False] for city, neighbors in roads.items()
+                      for neighbor, weight in neighbors]
+
+    def change(self, start, goal, both_ways, blocked=None, weight=None):
+        pairs = {(start, goal), (goal, start)} if both_ways else {(start, goal)}
+        for edge in self.edges:
+            if (edge[0], edge[1]) in pairs:
+                if weight is not None:
+                    edge[2] = weight
+                if blocked is not None:
+                    edge[3] = blocked
+
+    def roads(self):
+        roads = {city: [] for city in self.cities}
+        for city, neighbor, weight, blocked in self.edges:
+            if not blocked:
+                roads[city].append((neighbor, weight))
+        return roads
+
+
+def random_changes(roads, count, seed):
+    """Yield ``(method, start, goal, kwargs)`` road changes on existing roads."""
+    rng = random.Random(seed)
+    existing = [(city, neighbor) for city, neighbors in roads.items() for neighbor, _ in neighbors]
+    for _ in range(count):
+        start, goal = rng.choice(existing)
+        kind = rng.choice(('block', 'block', 'unblock', 'set_weight'))
+        yield kind, start, goal, {'weight': rng.randint(1, 12)} if kind == 'set_weight' else {}
+
+
+def apply(engine, mirror, kind, start, goal, both_ways, weight=None):
+    if kind == 'block':
+        engine.block_edge(start, goal, both_ways)
+        mirror.change(start, goal, both_ways, blocked=True)
+    elif kind == 'unblock':
+        engine.unblock_edge(start, goal, both_ways)
+        mirror.change(start, goal, both_ways, blocked=False)
+    else:
+        engine.set_weight(start, goal, weight, both_ways)
+        mirror.change(start, goal, both_ways, weight=weight)
+
+
+@pytest.mark.parametrize('both_ways, seed', [(True, 0), (True, 1), (False, 2), (False, 3)])
+def test_repaired_searches_match_dijkstra(both_ways, seed):
+    """Cached full trees and partial searches, repaired after every change, match a fresh Dijkstra."""
+    roads = generate_network(40, seed=seed).to_ucs() if both_ways else random_roads(35, 90, seed)
+    cities = list(roads)
+    engine = TravelEthiopia(roads)
+    mirror = RoadMirror(roads)
+    rng = random.Random(seed)
+
+    for kind, start, goal, kwargs in random_changes(roads, 25, seed):
+        for root in cities[:4]:
+            engine.shortest_path_tree(root)  # Exhausted searches, repaired in place
+        for _ in range(4):
+            engine.find_path(*rng.sample(cities, 2))  # Partial searches, kept or dropped
+
+        apply(engine, mirror, kind, start, goal, both_ways, **kwargs)
+        current = mirror.roads()
+        for root in cities[:4] + rng.sample(cities, 4):
+            expected = dijkstra(current, root)
+            tree = engine.shortest_path_tree(root)
+            assert [tree.distance(city) for city in cities] == [expected.get(city, INF) for city in cities]
+        for a, b in (rng.sample(cities, 2) for _ in range(10)):
+            path, cost = engine.find_path(a, b)
+            assert cost == dijkstra(current, a).get(b, INF)
+            if path is not None:
+                assert path_cost(current, path) == cost
+
+
+@pytest.mark.parametrize('both_ways, seed', [(True, 4), (False, 5)])
+def test_repaired_all_pairs_match_dijkstra(tmp_path, both_ways, seed):
+    """The all-pairs table, repaired column by column, matches a fresh Dijkstra from every city."""
+    roads = generate_network(30, seed=seed).to_ucs() if both_ways else random_roads(30, 80, seed)
+    cities = list(roads)
+    engine = TravelEthiopia(roads)
+    engine.precompute_all_pairs(cache_dir=str(tmp_path))
+    mirror = RoadMirror(roads)
+    graph = engine.road_graph
+
+    for kind, start, goal, kwargs in random_changes(roads, 20, seed):
+        apply(engine, mirror, kind, start, goal, both_ways, **kwargs)
+        current = mirror.roads()
+        for a in cities:
+            expected = dijkstra(current, a)
+            for b in cities:
+                assert engine.all_pairs.distance(graph.node(a), graph.node(b)) == expected.get(b, INF)
+                path, cost = engine.find_path(a, b)
+                if path is not None:
+                    assert path_cost(current, path) == cost
+
+
+def test_invalid_changes_are_rejected():
+    """Changing a road that does not exist, or to a non-positive cost, raises ValueError."""
+    roads = {'A': [('B', 2)], 'B': [('A', 2)], 'C': []}
+    engine = TravelEthiopia(roads)
+    with pytest.raises(ValueError):
+        engine.block_edge('A', 'C')
+    with pytest.raises(ValueError):
+        engine.set_weight('A', 'B', 0)
+    assert engine.find_path('A', 'B') == (['A', 'B'], 2)
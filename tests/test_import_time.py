@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import benchmarks
+from benchmarks import IMPORT_BUDGET_MS, SEARCH_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_search_modules_import_within_budget():
+    """Importing every search module in a fresh interpreter stays within IMPORT_BUDGET_MS."""
+    result = benchmarks.measure_import_time(SEARCH_MODULES)
+    assert result['import_ms'] <= IMPORT_BUDGET_MS, (
+        f"importing the search modules took {result['import_ms']:.1f} ms, "
+        f"over the {IMPORT_BUDGET_MS:.0f} ms budget")
+
+
+def test_search_modules_do_not_import_plotting():
+    """The plotting modules (PLOTTING_MODULES) are only imported once something is drawn."""
+    result = benchmarks.measure_import_time(SEARCH_MODULES, repeats=1)
+    assert not result['plotting_loaded'], f"importing the search modules loaded {result['plotting_loaded']}"
+
+
+def test_search_modules_import_without_side_effects(tmp_path):
+    """Importing the search modules reads no road data and writes nothing to the cache."""
+    probe = ('import sys\n'
+             'for module in sys.argv[1:]:\n'
+             '    __import__(module)\n'
+             'from travel_ethiopia import cities_road_ifs, cities_road_ucs, cities_road_ufs\n'
+             'print(any("roads" in vars(module) for module in (cities_road_ifs, cities_road_ucs, cities_road_ufs)))\n')
+    env = dict(os.environ, TRAVEL_ETHIOPIA_CACHE=str(tmp_path))
+    output = subprocess.run([sys.executable, '-c', probe, *SEARCH_MODULES, 'travel_ethiopia.service'],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    assert output.strip() == 'False', "importing a search module loaded the road data"
+    assert not os.listdir(tmp_path), f"importing the search modules wrote {os.listdir(tmp_path)}"
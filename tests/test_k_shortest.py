@@ -0,0 +1,53 @@
+import pytest
+
+from helpers import path_cost, random_roads
+from travel_ethiopia.traveling_ethiopia_ucs import TravelEthiopia
+
+
+def simple_paths(roads, start, goal):
+    """Every loopless path from start to goal, by brute-force depth-first enumeration."""
+    paths = []
+
+    def extend(path):
+        if path[-1] == goal:
+            paths.append(list(path))
+            return
+        for neighbor in dict.fromkeys(neighbor for neighbor, _ in roads[path[-1]]):
+            if neighbor not in path:
+                path.append(neighbor)
+                extend(path)
+                path.pop()
+
+    extend([start])
+    return paths
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_routes_match_brute_force(seed):
+    """The k routes are distinct loopless paths whose costs are the k smallest of all loopless paths."""
+    roads = random_roads(9, 24, seed, max_weight=5)
+    engine = TravelEthiopia(roads)
+    cities = list(roads)
+    for start in cities[:3]:
+        for goal in cities:
+            if goal == start:
+                continue
+            costs = sorted(path_cost(roads, path) for path in simple_paths(roads, start, goal))
+            for k in (1, 3, 8):
+                routes = engine.find_k_shortest_paths(start, goal, k)
+                assert [cost for _, cost in routes] == costs[:k]
+                paths = [tuple(path) for path, _ in routes]
+                assert len(set(paths)) == len(paths)
+                for path, cost in routes:
+                    assert path[0] == start and path[-1] == goal
+                    assert len(set(path)) == len(path)
+                    assert path_cost(roads, path) == cost
+
+
+def test_unknown_and_trivial_queries():
+    """A route to the start itself is the one-city path; unknown cities give no routes."""
+    roads = random_roads(5, 10, seed=0)
+    engine = TravelEthiopia(roads)
+    assert engine.find_k_shortest_paths('City 0', 'City 0', 3) == [(['City 0'], 0)]
+    assert engine.find_k_shortest_paths('City 0', 'Nowhere', 3) == []
+    assert engine.find_k_shortest_paths('City 0', 'City 1', 0) == []
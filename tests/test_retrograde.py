@@ -0,0 +1,97 @@
+import random
+from functools import lru_cache
+
+import pytest
+
+from travel_ethiopia.retrograde import RetrogradeSolver
+from travel_ethiopia.road_graph import RoadGraph
+
+
+def random_game(num_cities, seed):
+    """A random acyclic road game in the ``cities_road_minimax`` layout: roads only lead to later cities."""
+    rng = random.Random(seed)
+    names = [f'City {i}' for i in range(num_cities)]
+    roads = {}
+    for i, name in enumerate(names):
+        later = names[i + 1:]
+        children = rng.sample(later, min(len(later), rng.randint(0, 3)))
+        roads[name] = {
+            'utility': rng.randint(-5, 10),
+            'neighbors': [(child, rng.random() < 0.2) for child in children],
+            'terminal': rng.random() < 0.15,
+        }
+    return roads
+
+
+def brute_force(roads, blocked):
+    """Plain recursive minimax over the acyclic game, with ``blocked`` the set of closed roads."""
+
+    @lru_cache(maxsize=None)
+    def value(city, maximizing):
+        children = [] if roads[city]['terminal'] else [
+            child for child, _ in roads[city]['neighbors'] if (city, child) not in blocked]
+        if not children:
+            return roads[city]['utility']
+        scores = [value(child, not maximizing) for child in children]
+        return max(scores) if maximizing else min(scores)
+
+    return value
+
+
+def blocked_roads(roads):
+    return {(city, child) for city, data in roads.items() for child, is_blocked in data['neighbors'] if is_blocked}
+
+
+def assert_solution(solver, roads, blocked):
+    value = brute_force(roads, blocked)
+    for city in roads:
+        for maximizing in (True, False):
+            assert solver.value(city, maximizing) == value(city, maximizing)
+            move, move_value = solver.best_move(city, maximizing)
+            assert move_value == value(city, maximizing)
+            if move is not None:
+                assert (city, move) not in blocked
+                assert value(move, not maximizing) == move_value
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_values_match_brute_force_minimax(seed):
+    """Every (city, side to move) value and best move agrees with plain minimax."""
+    roads = random_game(40, seed)
+    solver = RetrogradeSolver(RoadGraph.from_roads(roads))
+    assert_solution(solver, roads, blocked_roads(roads))
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_block_and_unblock_resolve_like_brute_force(seed):
+    """After each block or unblock, the partial re-solve agrees with minimax on the changed roads."""
+    roads = random_game(35, seed)
+    solver = RetrogradeSolver(RoadGraph.from_roads(roads))
+    blocked = blocked_roads(roads)
+    rng = random.Random(seed)
+    edges = [(city, child) for city, data in roads.items() for child, _ in data['neighbors']]
+    for _ in range(20):
+        road = rng.choice(edges)
+        if road in blocked:
+            solver.unblock_edge(*road)
+            blocked.discard(road)
+        else:
+            solver.block_edge(*road)
+            blocked.add(road)
+        assert_solution(solver, roads, blocked)
+
+
+def test_cycles_score_the_draw_value():
+    """A game both players can keep going forever is worth the draw value when neither wants to leave."""
+    roads = {
+        'A': {'utility': 0, 'neighbors': [('B', False), ('C', False)], 'terminal': False},
+        'B': {'utility': 0, 'neighbors': [('A', False), ('T', False)], 'terminal': False},
+        'C': {'utility': 1, 'neighbors': [], 'terminal': True},
+        'T': {'utility': 5, 'neighbors': [], 'terminal': True},
+    }
+    graph = RoadGraph.from_roads(roads)
+    # MIN at B returns to A rather than concede 5, so MAX settles for C.
+    assert RetrogradeSolver(graph, draw_value=0).best_move('A') == ('C', 1)
+    # With the draw worth 3, both players prefer to cycle.
+    assert RetrogradeSolver(graph, draw_value=3).best_move('A') == ('B', 3)
+    assert RetrogradeSolver(graph, draw_value=3).value('B', maximizing_player=False) == 3
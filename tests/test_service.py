@@ -0,0 +1,135 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from helpers import bfs_hops, dijkstra, path_cost, random_roads
+from travel_ethiopia.road_generator import generate_network
+from travel_ethiopia.service import RouteService
+
+INF = float('inf')
+
+
+def serve_lines(service, lines):
+    """Feed request lines through ``RouteService.serve`` and return the decoded responses."""
+    written = []
+
+    async def run():
+        reader = asyncio.StreamReader()
+        for line in lines:
+            reader.feed_data((line + '\n').encode('utf-8'))
+        reader.feed_eof()
+        await service.serve(reader, written.append)
+
+    asyncio.run(run())
+    return [json.loads(line) for line in b''.join(written).decode('utf-8').splitlines()]
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_routes_match_plain_searches(symmetric):
+    """UCS and A* answers cost the Dijkstra distance and BFS answers take the fewest roads."""
+    roads = generate_network(30, seed=1).to_ucs() if symmetric else random_roads(30, 70, seed=1)
+    service = RouteService(roads, batch_window=0)
+    assert service.symmetric == symmetric
+    rng = random.Random(0)
+    for start, goal in (rng.sample(list(roads), 2) for _ in range(40)):
+        distances, hops = dijkstra(roads, start), bfs_hops(roads, start)
+        for algorithm in ('ucs', 'astar', 'bfs'):
+            path, cost, _ = service.route(algorithm, start, goal)
+            if goal not in distances:
+                assert (path, cost) == (None, INF)
+                continue
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(roads, path) == cost
+            if algorithm == 'bfs':
+                assert len(path) - 1 == hops[goal]
+            else:
+                assert cost == distances[goal]
+
+
+def test_cached_answers_keep_the_callers_direction():
+    """A repeated query, or on symmetric roads the reversed one, is served from the cache."""
+    roads = generate_network(20, seed=2).to_ucs()
+    service = RouteService(roads, batch_window=0)
+    path, cost, cached = service.route('ucs', 'City 3', 'City 17')
+    assert not cached
+    assert service.route('ucs', 'City 3', 'City 17') == (path, cost, True)
+    assert service.route('ucs', 'City 17', 'City 3') == (path[::-1], cost, True)
+    assert service.stats()['hits'] == 2
+
+
+def test_bad_requests_are_answered():
+    """Every line gets a response: malformed or invalid requests get an error, and the stream goes on."""
+    roads = generate_network(15, seed=3).to_ucs()
+    service = RouteService(roads)
+    responses = serve_lines(service, [
+        'not json',
+        '[1, 2]',
+        '{"id": 1, "algorithm": "teleport", "start": "City 1", "goal": "City 2"}',
+        '{"id": 2, "goal": "City 2"}',
+        '{"id": 3, "algorithm": "multi", "start": "City 1"}',
+        '{"id": 4, "algorithm": "ucs", "start": "City 1", "goal": "City 2"}',
+    ])
+    by_id = {response['id']: response for response in responses if response['id'] is not None}
+    anonymous = [response for response in responses if response['id'] is None]
+
+    assert len(responses) == 6
+    assert len(anonymous) == 2 and all('error' in response for response in anonymous)
+    assert any(response['error'].startswith('TypeError') for response in anonymous)
+    assert by_id[1]['error'].startswith('ValueError')
+    assert by_id[2]['error'].startswith('KeyError')
+    assert by_id[3]['error'].startswith('ValueError')
+    assert 'error' not in by_id[4]
+    assert by_id[4]['cost'] == dijkstra(roads, 'City 1')['City 2']
+
+
+def test_unexpected_errors_are_answered(monkeypatch):
+    """An exception the request handler does not expect still answers that request by id."""
+    service = RouteService(generate_network(10, seed=4).to_ucs())
+
+    def broken_stats():
+        raise RuntimeError('stats are broken')
+
+    monkeypatch.setattr(service, 'stats', broken_stats)
+    responses = serve_lines(service, ['{"id": 7, "op": "stats"}',
+                                      '{"id": 8, "start": "City 1", "goal": "City 2"}'])
+    by_id = {response['id']: response for response in responses}
+    assert by_id[7] == {'id': 7, 'error': 'RuntimeError: stats are broken'}
+    assert 'path' in by_id[8]
+
+
+def test_batched_requests_share_searches():
+    """Concurrent UCS misses from a few starts are answered correctly with one search per start."""
+    roads = random_roads(40, 100, seed=5)
+    service = RouteService(roads, cache_size=0, batch_window=0.05)
+    rng = random.Random(5)
+    starts = rng.sample(list(roads), 3)
+    queries = [(start, goal) for start in starts for goal in rng.sample(list(roads), 12)]
+
+    async def run():
+        return await asyncio.gather(*(service.route_async('ucs', start, goal) for start, goal in queries))
+
+    for (start, goal), (path, cost, cached) in zip(queries, asyncio.run(run())):
+        assert not cached
+        assert cost == dijkstra(roads, start).get(goal, INF)
+        if path is not None:
+            assert path[0] == start and path[-1] == goal
+            assert path_cost(roads, path) == cost
+    assert service.batcher.requests == len(queries)
+    assert service.batcher.searches == len(starts)
+
+
+def test_batched_reverse_requests_keep_their_direction():
+    """On symmetric roads, batched answers are cached once and returned in each caller's direction."""
+    roads = generate_network(25, seed=6).to_ucs()
+    service = RouteService(roads, batch_window=0.05)
+    queries = [('City 2', 'City 20'), ('City 20', 'City 2'), ('City 2', 'City 11')]
+
+    async def run():
+        return await asyncio.gather(*(service.route_async('ucs', start, goal) for start, goal in queries))
+
+    for (start, goal), (path, cost, _) in zip(queries, asyncio.run(run())):
+        assert path[0] == start and path[-1] == goal
+        assert cost == dijkstra(roads, start)[goal]
+    assert service.route('ucs', 'City 20', 'City 2')[2]
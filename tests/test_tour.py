@@ -0,0 +1,72 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from helpers import dijkstra, path_cost, random_roads
+from travel_ethiopia.road_generator import generate_network
+from travel_ethiopia.tour import nearest_neighbor, solve_tour, tour_cost
+from travel_ethiopia.traveling_ethiopia_ucs import TravelEthiopia
+
+
+def brute_force_cost(matrix):
+    """Cheapest open tour from point 0 through every other point, over all visiting orders."""
+    return min(tour_cost(matrix, (0,) + order) for order in permutations(range(1, len(matrix))))
+
+
+def random_matrix(size, seed, symmetric):
+    rng = np.random.default_rng(seed)
+    matrix = rng.integers(1, 50, size=(size, size)).astype(float)
+    if symmetric:
+        matrix = np.minimum(matrix, matrix.T)
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+
+def assert_valid(order, size):
+    assert order[0] == 0 and sorted(order) == list(range(size))
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+@pytest.mark.parametrize('seed', range(8))
+def test_exact_tours_match_brute_force(seed, symmetric):
+    """Held-Karp finds the cheapest visiting order of up to seven goals."""
+    size = 2 + seed % 7
+    matrix = random_matrix(size, seed, symmetric)
+    order, cost = solve_tour(matrix)
+    assert_valid(order, size)
+    assert cost == tour_cost(matrix, order) == brute_force_cost(matrix)
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+@pytest.mark.parametrize('seed', range(4))
+def test_local_search_improves_nearest_neighbour(seed, symmetric):
+    """Past the exact limit, the refined tour is a valid order no worse than nearest neighbour."""
+    matrix = random_matrix(30, seed, symmetric)
+    order, cost = solve_tour(matrix, exact_limit=0, time_budget=0.2)
+    assert_valid(order, 30)
+    assert cost == tour_cost(matrix, order)
+    assert cost <= tour_cost(matrix, nearest_neighbor(matrix))
+
+
+@pytest.mark.parametrize('symmetric', [True, False])
+def test_multi_goal_paths_are_optimal(symmetric):
+    """Itineraries visit every goal along real roads at the brute-force optimal cost."""
+    roads = generate_network(40, seed=3).to_ucs() if symmetric else random_roads(40, 160, seed=3)
+    engine = TravelEthiopia(roads)
+    cities = list(roads)
+    start = cities[0]
+    reachable = dijkstra(roads, start)
+    goals = [city for city in cities[1:] if city in reachable][:6]
+    distances = {city: dijkstra(roads, city) for city in [start] + goals}
+    points = [start] + goals
+    matrix = np.array([[distances[a].get(b, np.inf) for b in points] for a in points])
+
+    path, cost = engine.find_path_to_multiple_goals(start, goals)
+    assert cost == brute_force_cost(matrix)
+    assert path[0] == start and set(goals) <= set(path)
+    assert path_cost(roads, path) == cost
+
+    path, cost = engine.find_path_to_multiple_goals(start, goals, optimize=False)
+    assert path[0] == start and set(goals) <= set(path)
+    assert path_cost(roads, path) == cost >= brute_force_cost(matrix)
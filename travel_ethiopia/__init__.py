@@ -0,0 +1,13 @@
+"""
+Search algorithms for traveling between Ethiopian cities.
+
+The search modules (``traveling_ethiopia_ufs``, ``traveling_ethiopia_ucs``,
+``traveling_ethiopia_ifs``, ``traveling_ethiopia_minimax``) only need the standard library
+and NumPy to answer queries; NetworkX and matplotlib are imported the first time a graph
+is drawn. Importing the package itself loads nothing beyond the compiled graph types.
+"""
+
+from .road_graph import RoadGraph, SearchTree
+from .stats import SearchStats
+
+__all__ = ['RoadGraph', 'SearchStats', 'SearchTree']
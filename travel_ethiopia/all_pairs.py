@@ -0,0 +1,169 @@
+import os
+import tempfile
+
+import numpy as np
+
+from .shortest_paths import DijkstraSearch
+
+# Generated files (all-pairs tables, compiled road graphs, layouts) live in a per-user cache,
+# never inside the installed package; TRAVEL_ETHIOPIA_CACHE overrides the location.
+CACHE_DIR = os.environ.get('TRAVEL_ETHIOPIA_CACHE') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'travel_ethiopia')
+FLOYD_WARSHALL_LIMIT = 512  # Above this many cities, run one Dijkstra per source instead
+
+
+def floyd_warshall(graph):
+    """
+    All-pairs shortest paths with Floyd-Warshall, vectorized over whole matrix rows.
+
+    Args:
+        graph (RoadGraph): The graph.
+
+    Returns:
+        tuple: ``(distances, next_hops)``; ``next_hops[i, j]`` is the node after ``i`` on a
+        shortest path to ``j``, or -1 if ``j`` is unreachable.
+    """
+    n = len(graph)
+    offsets, targets, weights = graph.to_numpy()
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+
+    distances = np.full((n, n), np.inf)
+    np.minimum.at(distances, (sources, targets), weights)
+    np.fill_diagonal(distances, 0.0)
+    next_hops = np.where(np.isfinite(distances), np.arange(n)[None, :], -1)
+
+    for k in range(n):
+        through = distances[:, k, None] + distances[None, k, :]
+        better = through < distances
+        distances = np.where(better, through, distances)
+        next_hops = np.where(better, next_hops[:, k, None], next_hops)
+
+    return distances, next_hops
+
+
+def repeated_dijkstra(graph):
+    """
+    All-pairs shortest paths with one Dijkstra search per source, for large sparse graphs.
+
+    Returns:
+        tuple: ``(distances, next_hops)`` in the same layout as ``floyd_warshall``.
+    """
+    n = len(graph)
+    nodes = np.arange(n)
+    distances = np.empty((n, n))
+    next_hops = np.empty((n, n), dtype=np.int64)
+
+    for source in range(n):
+        tree = DijkstraSearch(graph, source).tree()
+        parents = np.frombuffer(tree.parents, dtype=np.int64)
+        distances[source] = np.frombuffer(tree.distances, dtype=np.float64)
+
+        # The first hop towards v is the ancestor of v whose parent is the source;
+        # find it for every node at once by pointer jumping up the tree.
+        hops = np.where((parents == source) | (parents < 0), nodes, parents)
+        while True:
+            jumped = hops[hops]
+            if np.array_equal(jumped, hops):
+                break
+            hops = jumped
+        hops[~np.isfinite(distances[source])] = -1
+        hops[source] = source
+        next_hops[source] = hops
+
+    return distances, next_hops
+
+
+class AllPairs:
+    """
+    Precomputed shortest distances and next hops between every pair of cities.
+
+    Once built, every shortest-path query is an O(1) distance lookup plus one step per
+    city on the returned path.
+
+    Attributes:
+        graph (RoadGraph): The graph the table was computed for.
+        distances (numpy.ndarray): ``distances[i, j]`` is the shortest distance from i to j.
+        next_hops (numpy.ndarray): ``next_hops[i, j]`` is the node after i on that path.
+    """
+
+    def __init__(self, graph, distances, next_hops):
+        self.graph = graph
+        self.distances = distances
+        self.next_hops = next_hops
+
+    @classmethod
+    def compute(cls, graph, method='auto'):
+        """
+        Compute the table in memory.
+
+        Args:
+            graph (RoadGraph): The graph.
+            method (str, optional): ``'floyd-warshall'``, ``'dijkstra'`` or ``'auto'``, which
+                picks Floyd-Warshall up to FLOYD_WARSHALL_LIMIT cities. Defaults to 'auto'.
+
+        Returns:
+            AllPairs: The computed table.
+        """
+        if method == 'auto':
+            method = 'floyd-warshall' if len(graph) <= FLOYD_WARSHALL_LIMIT else 'dijkstra'
+        if method == 'floyd-warshall':
+            distances, next_hops = floyd_warshall(graph)
+        elif method == 'dijkstra':
+            distances, next_hops = repeated_dijkstra(graph)
+        else:
+            raise ValueError("Invalid all-pairs method! Use 'floyd-warshall', 'dijkstra' or 'auto'.")
+        return cls(graph, distances, next_hops.astype(np.int32 if len(graph) < 2 ** 31 else np.int64))
+
+    @classmethod
+    def load(cls, graph, cache_dir=CACHE_DIR, method='auto'):
+        """
+        Load the table for a graph from the on-disk cache, computing and saving it first
+        if the road data has no cached table yet.
+
+        The files are named after ``graph.fingerprint()`` and opened with ``mmap_mode='r'``,
+        so worker processes share one copy through the page cache and unchanged roads are
+        never recomputed.
+
+        Args:
+            graph (RoadGraph): The graph.
+            cache_dir (str, optional): Directory holding the ``.npy`` files. Defaults to CACHE_DIR.
+            method (str, optional): Passed to ``compute`` on a cache miss. Defaults to 'auto'.
+
+        Returns:
+            AllPairs: The table, backed by read-only memory maps.
+        """
+        key = graph.fingerprint()
+        paths = [os.path.join(cache_dir, f'{key}.{name}.npy') for name in ('distances', 'next_hops')]
+
+        if not all(os.path.exists(path) for path in paths):
+            table = cls.compute(graph, method)
+            os.makedirs(cache_dir, exist_ok=True)
+            for path, matrix in zip(paths, (table.distances, table.next_hops)):
+                # Write to a temporary file and rename, so concurrent workers never
+                # map a half-written matrix.
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.npy')
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, matrix)
+                os.replace(tmp_path, path)
+
+        distances, next_hops = (np.load(path, mmap_mode='r') for path in paths)
+        return cls(graph, distances, next_hops)
+
+    def distance(self, source, target):
+        """Return the shortest distance between two node ids (``inf`` if unreachable)."""
+        return float(self.distances[source, target])
+
+    def path(self, source, target):
+        """
+        Rebuild the shortest path between two node ids from the next-hop matrix.
+
+        Returns:
+            list or None: Node ids from source to target, or None if target is unreachable.
+        """
+        if self.next_hops[source, target] < 0:
+            return None
+        path = [source]
+        while source != target:
+            source = int(self.next_hops[source, target])
+            path.append(source)
+        return path
@@ -0,0 +1,164 @@
+import numpy as np
+
+PULL_FRACTION = 1 / 16  # Pull along incoming edges once the frontier has this share of all edges
+
+
+def hop_matrix(graph, sources, max_hops=None):
+    """
+    Hop counts from many sources at once, with a level-synchronous BFS over bitsets.
+
+    Sources are taken 64 at a time: source ``j`` of a batch owns bit ``j`` of a 64-bit
+    word, so the sources that have reached a node are one word and each level advances
+    the whole batch together. A level is computed in one of two directions:
+    - push, while the frontier is small: the words of the frontier nodes are copied
+      along their outgoing edges, sorted by target and merged per target;
+    - pull, once the frontier's edges exceed PULL_FRACTION of the graph: every node ORs
+      the frontier words of its in-neighbours. Nodes are relabelled by decreasing
+      in-degree, so the ``k``-th in-neighbours of all nodes with more than ``k`` of them
+      form one contiguous block, and a pull is one gather and OR per in-degree.
+    Bits already seen are masked off. Hop counts are kept bit-sliced: the bits a level
+    sets are ORed into plane ``b`` for every bit ``b`` of the level number, so recording a
+    level costs a few word operations per node, and the planes are expanded into hop
+    counts with ``unpackbits`` once per batch.
+
+    Args:
+        graph (RoadGraph): The graph (edges are followed in their direction, weights ignored).
+        sources (list): Node ids of the sources; repeats are allowed.
+        max_hops (int, optional): Stop after this many levels. Defaults to no limit.
+
+    Returns:
+        numpy.ndarray: A ``(len(sources), len(graph))`` int32 matrix of hop counts, -1 where a
+        node is not reached (within ``max_hops``).
+    """
+    n = len(graph)
+    sources = np.asarray(sources, dtype=np.int64)
+    hops = np.full((len(sources), n), -1, dtype=np.int32)
+    if len(sources) == 0 or n == 0:
+        return hops
+
+    layout = _Layout(graph)
+    for start in range(0, len(sources), 64):
+        batch = layout.rank[sources[start:start + 64]]
+        hops[start:start + len(batch)] = _batch_hops(layout, batch, max_hops)[layout.rank].T
+    return hops
+
+
+class _Layout:
+    """
+    The graph with its nodes relabelled by decreasing in-degree, shared by every batch.
+
+    Attributes:
+        offsets (numpy.ndarray): CSR row offsets, by original node id.
+        targets (numpy.ndarray): Relabelled target of every edge.
+        order (numpy.ndarray): Original node id of every relabelled node.
+        rank (numpy.ndarray): Relabelled id of every original node.
+        in_degrees (numpy.ndarray): In-degree of every relabelled node.
+        out_degrees (numpy.ndarray): Out-degree of every relabelled node.
+    """
+
+    def __init__(self, graph):
+        offsets, targets, _ = graph.to_numpy()
+        in_degrees = np.bincount(targets, minlength=len(graph))
+        self.order = np.argsort(-in_degrees, kind='stable')
+        self.rank = np.empty(len(graph), dtype=np.int64)
+        self.rank[self.order] = np.arange(len(graph))
+        self.offsets = offsets
+        self.targets = self.rank[targets]
+        self.in_degrees = in_degrees[self.order]
+        self.out_degrees = np.diff(offsets)[self.order]
+        self._columns = None
+
+    @property
+    def columns(self):
+        """list: ``columns[k][i]`` is the ``k``-th in-neighbour of node ``i``, for the nodes with more than ``k``."""
+        if self._columns is None:
+            sources = np.repeat(self.rank, np.diff(self.offsets))
+            neighbors = sources[np.argsort(self.targets, kind='stable')]
+            degrees = self.in_degrees
+            starts = np.cumsum(degrees) - degrees
+            self._columns = [neighbors[starts[:int((degrees > k).sum())] + k]
+                             for k in range(int(degrees.max(initial=0)))]
+        return self._columns
+
+
+def _batch_hops(layout, sources, max_hops):
+    """
+    Run the bitset BFS for up to 64 relabelled sources.
+
+    Returns:
+        numpy.ndarray: A ``(len(graph), len(sources))`` int32 matrix over relabelled nodes.
+    """
+    offsets, targets, order, out_degrees = layout.offsets, layout.targets, layout.order, layout.out_degrees
+    n, m, count = len(order), len(targets), len(sources)
+
+    nodes, inverse = np.unique(sources, return_inverse=True)
+    bits = np.zeros(len(nodes), dtype='<u8')
+    np.bitwise_or.at(bits, inverse, np.left_shift(np.uint64(1), np.arange(count, dtype=np.uint64)))
+    visited = np.zeros(n, dtype='<u8')
+    visited[nodes] = bits
+    frontier = None  # Dense frontier words, kept between consecutive pull levels
+    spare = scratch = None
+    planes = []  # planes[b][v]: the sources that reached v at a level with bit b set
+
+    level = 0
+    while len(nodes) and (max_hops is None or level < max_hops):
+        level += 1
+        while level >> len(planes):
+            planes.append(np.zeros(n, dtype='<u8'))
+        degrees = out_degrees[nodes]
+        total = int(degrees.sum())
+        if total == 0:
+            break
+
+        if total < PULL_FRACTION * m:
+            # Edge ids of every frontier node, laid out node after node.
+            starts = offsets[order[nodes]]
+            edges = np.repeat(starts - np.cumsum(degrees) + degrees, degrees) + np.arange(total)
+            reached = targets[edges]
+            sort = np.argsort(reached, kind='stable')
+            reached = reached[sort]
+            first = np.flatnonzero(np.r_[True, reached[1:] != reached[:-1]])
+            nodes = reached[first]
+            bits = np.bitwise_or.reduceat(np.repeat(bits, degrees)[sort], first) & ~visited[nodes]
+            keep = bits != 0
+            nodes, bits = nodes[keep], bits[keep]
+            visited[nodes] |= bits
+            for bit, plane in enumerate(planes):
+                if level >> bit & 1:
+                    plane[nodes] |= bits
+            continue
+
+        columns = layout.columns
+        if spare is None:
+            spare = np.empty(n, dtype='<u8')
+            scratch = np.empty(n, dtype='<u8')
+        if frontier is None:
+            frontier = np.zeros(n, dtype='<u8')
+            frontier[nodes] = bits
+        merged = spare
+        covered = len(columns[0])  # Nodes with at least one in-neighbour
+        np.take(frontier, columns[0], out=merged[:covered])
+        merged[covered:] = 0
+        for column in columns[1:]:
+            merged[:len(column)] |= np.take(frontier, column, out=scratch[:len(column)])
+        merged &= np.invert(visited, out=scratch)
+        nodes = np.flatnonzero(merged)
+        visited |= merged
+        for bit, plane in enumerate(planes):
+            if level >> bit & 1:
+                plane |= merged
+        # Stay dense while the next level is still worth a pull; the old frontier becomes the spare buffer.
+        spare = frontier
+        if int(out_degrees[nodes].sum()) >= PULL_FRACTION * m:
+            frontier = merged
+        else:
+            frontier, bits = None, merged[nodes]
+
+    def unpack(words):
+        return np.unpackbits(words.view(np.uint8).reshape(n, 8), axis=1, count=count, bitorder='little')
+
+    hops = np.zeros((n, count), dtype=np.int32)
+    for bit, plane in enumerate(planes):
+        hops += unpack(plane).astype(np.int32) << bit
+    hops[unpack(visited) == 0] = -1
+    return hops
@@ -0,0 +1,20 @@
+import os
+
+from .road_data import DATA_DIR, RoadData
+
+# The roads are read on first use (see ``__getattr__``), so importing this module, or a
+# search engine that imports it, reads and writes no files.
+
+
+def _load():
+    """Read the canonical network and publish it as module globals."""
+    global cities, roads
+    data = RoadData.load(os.path.join(DATA_DIR, 'ethiopia.json'))
+    cities, roads = list(data.cities), data.to_ucs()
+
+
+def __getattr__(name):
+    if name in ('cities', 'roads'):
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
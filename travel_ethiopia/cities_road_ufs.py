@@ -0,0 +1,33 @@
+import os
+
+from .road_data import DATA_DIR, RoadData
+
+# The roads are read on first use (see ``__getattr__``), so importing this module, or a
+# search engine that imports it, reads and writes no files.
+
+
+def _load():
+    """Read the canonical network without weights and publish it as module globals."""
+    global cities, roads
+    data = RoadData.load(os.path.join(DATA_DIR, 'ethiopia.json'))
+    cities, roads = data.to_ufs()
+
+
+def __getattr__(name):
+    if name in ('cities', 'roads'):
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    _load()
+
+    # Find cities that are in the list but not in the road dictionary
+    cities_not_in_roads = set(cities) - set(roads.keys())
+
+    # Find cities that are in the roads dictionary but not in the cities list
+    roads_not_in_cities = set(roads.keys()) - set(cities)
+
+    print("Cities in 'cities' but missing in 'roads':", cities_not_in_roads)
+    print("Cities in 'roads' but missing in 'cities':", roads_not_in_cities)
@@ -0,0 +1,344 @@
+from array import array
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+WITNESS_SETTLE_LIMIT = 64  # Witness searches give up (and keep the shortcut) after this many nodes
+
+
+class ContractionHierarchy:
+    """
+    Contraction-hierarchy index over a RoadGraph for fast point-to-point queries.
+
+    Preprocessing contracts cities one at a time in order of edge difference (shortcuts
+    added minus edges removed). When a city is contracted, every in-neighbor/out-neighbor
+    pair whose only shortest connection runs through it gets a shortcut edge remembering
+    the contracted middle city. A query then runs two small Dijkstra searches that only
+    climb to higher-ranked cities, and unpacks shortcuts back into original roads.
+
+    Upward edges are stored in CSR form: ``up_*`` holds, for each city, the edges to
+    higher-ranked cities it leaves by, and ``down_*`` the edges from higher-ranked cities
+    that arrive at it (walked backwards by the reverse search). ``*_middles`` is -1 for
+    original roads and the contracted city for shortcuts.
+
+    Attributes:
+        names (list): City names, indexed by node id.
+        index (dict): Mapping from city name to node id.
+        rank (array): Contraction order of every node.
+        integral (bool): Whether every road weight is integral.
+        fingerprint (str): Hash of the road data the hierarchy was built from.
+    """
+
+    def __init__(self, names, rank, up, down, integral, fingerprint):
+        """
+        Initialize the hierarchy from compiled buffers.
+
+        Args:
+            names (list): City names, indexed by node id.
+            rank (array): Contraction order of every node.
+            up (tuple): ``(offsets, targets, weights, middles)`` of the upward out-edges.
+            down (tuple): ``(offsets, sources, weights, middles)`` of the upward in-edges.
+            integral (bool): Whether every road weight is integral.
+            fingerprint (str): Hash of the road data.
+        """
+        self.names = names
+        self.index = {name: node for node, name in enumerate(names)}
+        self.rank = rank
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = up
+        self.down_offsets, self.down_sources, self.down_weights, self.down_middles = down
+        self.integral = integral
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, graph):
+        """
+        Contract every city of a graph.
+
+        Args:
+            graph (RoadGraph): The graph to preprocess.
+
+        Returns:
+            ContractionHierarchy: The hierarchy.
+        """
+        n = len(graph)
+        outgoing = [{} for _ in range(n)]
+        incoming = [{} for _ in range(n)]
+        for u in range(n):
+            for edge in range(graph.offsets[u], graph.offsets[u + 1]):
+                v, weight = graph.targets[edge], graph.weights[edge]
+                if v != u and weight < outgoing[u].get(v, (float('inf'),))[0]:
+                    outgoing[u][v] = (weight, -1)
+                    incoming[v][u] = (weight, -1)
+
+        contracted = bytearray(n)
+        deleted_neighbors = [0] * n
+        rank = array('q', [0]) * n
+        up_edges = [None] * n
+        down_edges = [None] * n
+
+        def shortcuts(node):
+            """The shortcuts contracting ``node`` now would need."""
+            needed = []
+            targets = outgoing[node]
+            for u, (w_in, _) in incoming[node].items():
+                limit = max((w_in + w_out for w, (w_out, _) in targets.items() if w != u), default=None)
+                if limit is None:
+                    continue
+                witness = _witness_distances(outgoing, u, node, limit)
+                for w, (w_out, _) in targets.items():
+                    if w != u and witness.get(w, float('inf')) > w_in + w_out:
+                        needed.append((u, w, w_in + w_out))
+            return needed
+
+        def priority(node):
+            removed = len(incoming[node]) + len(outgoing[node])
+            return len(shortcuts(node)) - removed + deleted_neighbors[node]
+
+        queue = [(priority(node), node) for node in range(n)]
+        heapify(queue)
+        order = 0
+
+        while queue:
+            _, node = heappop(queue)
+            if contracted[node]:
+                continue
+            current = priority(node)
+            if queue and current > queue[0][0]:
+                heappush(queue, (current, node))  # Lazy update: its priority went stale
+                continue
+
+            new_edges = shortcuts(node)
+            up_edges[node] = [(w, weight, middle) for w, (weight, middle) in outgoing[node].items()]
+            down_edges[node] = [(u, weight, middle) for u, (weight, middle) in incoming[node].items()]
+            for w in outgoing[node]:
+                del incoming[w][node]
+                deleted_neighbors[w] += 1
+            for u in incoming[node]:
+                del outgoing[u][node]
+                deleted_neighbors[u] += 1
+            outgoing[node], incoming[node] = {}, {}
+            for u, w, weight in new_edges:
+                if weight < outgoing[u].get(w, (float('inf'),))[0]:
+                    outgoing[u][w] = (weight, node)
+                    incoming[w][u] = (weight, node)
+
+            contracted[node] = 1
+            rank[node] = order
+            order += 1
+
+        return cls(list(graph.names), rank, _to_csr(up_edges), _to_csr(down_edges),
+                   graph.integral, graph.fingerprint())
+
+    def save(self, path):
+        """
+        Write the hierarchy in ``.npz`` format.
+
+        The file is written through an open handle, so it lands at ``path`` exactly;
+        ``np.savez`` would otherwise append ``.npz`` to a name without that suffix.
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, 'wb') as file:
+            np.savez(file, names=np.array(self.names), rank=np.frombuffer(self.rank, dtype=np.int64),
+                     up_offsets=self.up_offsets, up_targets=self.up_targets,
+                     up_weights=self.up_weights, up_middles=self.up_middles,
+                     down_offsets=self.down_offsets, down_sources=self.down_sources,
+                     down_weights=self.down_weights, down_middles=self.down_middles,
+                     integral=self.integral, fingerprint=self.fingerprint)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a hierarchy written by ``save``.
+
+        Args:
+            path (str): The ``.npz`` file.
+
+        Returns:
+            ContractionHierarchy: The hierarchy.
+        """
+        with np.load(path) as data:
+            def buffer(key, typecode):
+                return array(typecode, data[key].tobytes())
+
+            return cls(data['names'].tolist(), buffer('rank', 'q'),
+                       (buffer('up_offsets', 'q'), buffer('up_targets', 'q'),
+                        buffer('up_weights', 'd'), buffer('up_middles', 'q')),
+                       (buffer('down_offsets', 'q'), buffer('down_sources', 'q'),
+                        buffer('down_weights', 'd'), buffer('down_middles', 'q')),
+                       bool(data['integral']), str(data['fingerprint']))
+
+    def find_path(self, start, goal):
+        """
+        Find the shortest path from start to goal with a bidirectional upward search.
+
+        Args:
+            start (str): The initial state.
+            goal (str): The goal state.
+
+        Returns:
+            tuple: The shortest path as a list of nodes and its total cost, like
+            ``TravelEthiopia.find_path``.
+        """
+        if start not in self.index or goal not in self.index:
+            return ([start], 0) if start == goal else (None, float('inf'))
+        path, cost = self.query(self.index[start], self.index[goal])
+        if path is None:
+            return None, float('inf')
+        return [self.names[node] for node in path], int(cost) if self.integral else cost
+
+    def query(self, source, target):
+        """
+        Shortest path between two node ids.
+
+        Returns:
+            tuple: The unpacked path as node ids and its cost, or ``(None, inf)``.
+        """
+        forward = _upward_search(self.up_offsets, self.up_targets, self.up_weights, source)
+        backward = _upward_search(self.down_offsets, self.down_sources, self.down_weights, target)
+        best, meeting = float('inf'), -1
+        for node, (distance, _) in forward.items():
+            other = backward.get(node)
+            if other is not None and distance + other[0] < best:
+                best, meeting = distance + other[0], node
+        if meeting < 0:
+            return None, float('inf')
+        return self._assemble(source, forward, backward, meeting), best
+
+    def many_to_many(self, sources, targets, paths=False):
+        """
+        Shortest distances between every source and every target with buckets.
+
+        One backward upward search per target leaves ``(target, distance)`` entries in a
+        bucket at every node it reaches. One forward upward search per source then only
+        scans the buckets of the nodes it reaches, so the cost grows with
+        ``len(sources) + len(targets)`` searches instead of their product.
+
+        Args:
+            sources (list): Node ids of the sources (rows).
+            targets (list): Node ids of the targets (columns).
+            paths (bool, optional): Whether to unpack the paths as well. Defaults to False.
+
+        Returns:
+            tuple: ``(table, routes)`` like ``shortest_paths.distance_table``.
+        """
+        inf = float('inf')
+        backward = [_upward_search(self.down_offsets, self.down_sources, self.down_weights, target)
+                    for target in targets]
+        buckets = {}
+        for column, labels in enumerate(backward):
+            for node, (distance, _) in labels.items():
+                buckets.setdefault(node, []).append((column, distance))
+
+        table = np.full((len(sources), len(targets)), np.inf)
+        routes = [] if paths else None
+        for row, source in enumerate(sources):
+            forward = _upward_search(self.up_offsets, self.up_targets, self.up_weights, source)
+            best = [inf] * len(targets)
+            meetings = [-1] * len(targets)
+            for node, (distance, _) in forward.items():
+                for column, other in buckets.get(node, ()):
+                    if distance + other < best[column]:
+                        best[column], meetings[column] = distance + other, node
+            table[row] = best
+            if paths:
+                routes.append([self._assemble(source, forward, backward[column], meeting) if meeting >= 0 else None
+                               for column, meeting in enumerate(meetings)])
+        return table, routes
+
+    def _assemble(self, source, forward, backward, meeting):
+        """Unpack the upward chain to ``meeting`` and the downward chain after it into original roads."""
+        up_chain = [meeting]
+        while forward[up_chain[-1]][1] >= 0:
+            up_chain.append(forward[up_chain[-1]][1])
+        up_chain.reverse()
+        down_chain = [meeting]
+        while backward[down_chain[-1]][1] >= 0:
+            down_chain.append(backward[down_chain[-1]][1])
+
+        chain = up_chain + down_chain[1:]
+        path = [source]
+        for a, b in zip(chain, chain[1:]):
+            self._unpack(a, b, path)
+        return path
+
+    def _unpack(self, a, b, path):
+        """Append the original roads behind the overlay edge a -> b (without a) to path."""
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            middle = self._middle(a, b)
+            if middle < 0:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def _middle(self, a, b):
+        """Return the middle city of the cheapest overlay edge a -> b (-1 for a road)."""
+        if self.rank[a] < self.rank[b]:
+            offsets, ends, weights, middles, row, end = (self.up_offsets, self.up_targets,
+                                                          self.up_weights, self.up_middles, a, b)
+        else:
+            offsets, ends, weights, middles, row, end = (self.down_offsets, self.down_sources,
+                                                          self.down_weights, self.down_middles, b, a)
+        best, middle = float('inf'), -1
+        for edge in range(offsets[row], offsets[row + 1]):
+            if ends[edge] == end and weights[edge] < best:
+                best, middle = weights[edge], middles[edge]
+        return middle
+
+
+def _witness_distances(outgoing, source, excluded, limit):
+    """Bounded Dijkstra from source over the remaining graph, avoiding one node."""
+    distances = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap and settled < WITNESS_SETTLE_LIMIT:
+        cost, node = heappop(heap)
+        if cost > distances.get(node, float('inf')):
+            continue
+        if cost > limit:
+            break
+        settled += 1
+        for neighbor, (weight, _) in outgoing[node].items():
+            if neighbor == excluded:
+                continue
+            new_cost = cost + weight
+            if new_cost < distances.get(neighbor, float('inf')):
+                distances[neighbor] = new_cost
+                heappush(heap, (new_cost, neighbor))
+    return distances
+
+
+def _upward_search(offsets, ends, weights, source):
+    """Full Dijkstra over upward edges; returns {node: (distance, parent)}."""
+    labels = {source: (0.0, -1)}
+    done = set()
+    heap = [(0.0, source)]
+    while heap:
+        cost, node = heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbor = ends[edge]
+            new_cost = cost + weights[edge]
+            if neighbor not in labels or new_cost < labels[neighbor][0]:
+                labels[neighbor] = (new_cost, node)
+                heappush(heap, (new_cost, neighbor))
+    return labels
+
+
+def _to_csr(rows):
+    """Pack per-node lists of (end, weight, middle) into CSR arrays."""
+    offsets = array('q', [0])
+    ends, weights, middles = array('q'), array('d'), array('q')
+    for row in rows:
+        for end, weight, middle in row:
+            ends.append(end)
+            weights.append(weight)
+            middles.append(middle)
+        offsets.append(len(ends))
+    return offsets, ends, weights, middles
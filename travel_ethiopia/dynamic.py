@@ -0,0 +1,210 @@
+import math
+from array import array
+from heapq import heapify, heappop, heappush
+
+
+def repair_tree(distances, parents, grow, back, weights, a, b, old_weight, new_weight):
+    """
+    Ramalingam-Reps repair of a shortest-path tree after the weight of one edge changed.
+
+    The tree grows away from its root along ``grow``, and ``a -> b`` is the changed edge
+    in that direction.
+    - A decrease that shortens the way to ``b`` lowers ``b`` and is propagated by a
+      Dijkstra search that only visits nodes that improve.
+    - An increase of a tree edge invalidates the subtree below ``b``. Its nodes are
+      relabelled from their best neighbour outside the subtree and settled again by a
+      Dijkstra search, which can only improve nodes inside the subtree.
+    Any other change leaves the tree as it is.
+
+    Args:
+        distances: Per-node distances (array or NumPy vector), updated in place.
+        parents: Per-node tree parents, -1 when unreached, updated in place.
+        grow (tuple): ``(offsets, ends, edges)`` CSR of the edges leading away from the root.
+        back (tuple): The same CSR with every edge turned around.
+        weights (array): Current weight of every edge id, ``inf`` for blocked edges.
+        a (int): Tail of the changed edge, in the tree's direction.
+        b (int): Head of the changed edge, in the tree's direction.
+        old_weight (float): Weight of the edge before the change.
+        new_weight (float): Weight of the edge after the change.
+
+    Returns:
+        set: The nodes whose distance or parent changed.
+    """
+    inf = float('inf')
+    offsets, ends, edges = grow
+    changed = set()
+
+    if new_weight < old_weight:
+        cost = distances[a] + new_weight
+        if cost >= distances[b]:
+            return changed
+        distances[b] = cost
+        parents[b] = a
+        heap = [(cost, b)]
+    else:
+        if new_weight == old_weight or parents[b] != a:
+            return changed
+        subtree = [b]
+        inside = {b}
+        for node in subtree:
+            for slot in range(offsets[node], offsets[node + 1]):
+                child = ends[slot]
+                if parents[child] == node and child not in inside:
+                    inside.add(child)
+                    subtree.append(child)
+        for node in subtree:
+            distances[node] = inf
+            parents[node] = -1
+
+        back_offsets, back_ends, back_edges = back
+        heap = []
+        for node in subtree:
+            best, parent = inf, -1
+            for slot in range(back_offsets[node], back_offsets[node + 1]):
+                neighbor = back_ends[slot]
+                if neighbor not in inside:
+                    cost = distances[neighbor] + weights[back_edges[slot]]
+                    if cost < best:
+                        best, parent = cost, neighbor
+            if parent >= 0:
+                distances[node] = best
+                parents[node] = parent
+                heap.append((best, node))
+        heapify(heap)
+        changed.update(subtree)
+
+    while heap:
+        cost, node = heappop(heap)
+        if cost > distances[node]:
+            continue  # Stale entry, the node was lowered again since
+        changed.add(node)
+        for slot in range(offsets[node], offsets[node + 1]):
+            neighbor = ends[slot]
+            new_cost = cost + weights[edges[slot]]
+            if new_cost < distances[neighbor]:
+                distances[neighbor] = new_cost
+                parents[neighbor] = node
+                heappush(heap, (new_cost, neighbor))
+    return changed
+
+
+class DynamicRoads:
+    """
+    Road closures and weight changes applied in place to a RoadGraph.
+
+    A blocked edge keeps its flag in ``graph.blocked`` and gets the weight ``inf``, so
+    every search already skips it without testing the flag; its real weight stays in
+    ``base_weights`` for when it is unblocked. Both directions of the CSR are kept with
+    their edge ids, which is what repairing source trees (Dijkstra searches) and target
+    trees (columns of an all-pairs table) walks.
+
+    Attributes:
+        graph (RoadGraph): The graph being changed.
+        base_weights (array): Weight of every edge while it is not blocked.
+        forward (tuple): ``(offsets, targets, edges)`` of the outgoing edges of every node.
+        backward (tuple): ``(offsets, sources, edges)`` of the incoming edges of every node.
+    """
+
+    def __init__(self, graph):
+        """
+        Initialize the DynamicRoads, giving the edges already blocked in the graph the weight ``inf``.
+
+        Args:
+            graph (RoadGraph): The graph to change in place.
+        """
+        self.graph = graph
+        self.base_weights = array('d', graph.weights)
+        for edge, blocked in enumerate(graph.blocked):
+            if blocked:
+                graph.weights[edge] = float('inf')
+        self.forward = (graph.offsets, graph.targets, array('q', range(graph.num_edges)))
+        self.backward = graph.incoming()
+
+    def edges(self, source, target):
+        """Return the ids of the edges from one node id to another."""
+        graph = self.graph
+        return [edge for edge in range(graph.offsets[source], graph.offsets[source + 1])
+                if graph.targets[edge] == target]
+
+    def set_weight(self, edge, weight):
+        """
+        Change the weight of an edge; a blocked edge keeps weighing ``inf`` until unblocked.
+
+        Returns:
+            float: The weight the searches saw before the change.
+
+        Raises:
+            ValueError: If the weight is not a positive finite number.
+        """
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) \
+                or not math.isfinite(weight) or weight <= 0:
+            raise ValueError(f"Invalid road weight {weight!r}.")
+        graph = self.graph
+        old_weight = graph.weights[edge]
+        self.base_weights[edge] = weight
+        if not graph.blocked[edge]:
+            graph.weights[edge] = weight
+        if not float(weight).is_integer():
+            graph.integral = False
+        return old_weight
+
+    def block(self, edge):
+        """Block an edge and return the weight the searches saw before."""
+        graph = self.graph
+        old_weight = graph.weights[edge]
+        graph.blocked[edge] = 1
+        graph.weights[edge] = float('inf')
+        return old_weight
+
+    def unblock(self, edge):
+        """Unblock an edge and return the weight the searches saw before."""
+        graph = self.graph
+        old_weight = graph.weights[edge]
+        graph.blocked[edge] = 0
+        graph.weights[edge] = self.base_weights[edge]
+        return old_weight
+
+    def repair_search(self, search, source, target, edge, old_weight):
+        """
+        Repair an exhausted DijkstraSearch after the edge source -> target changed.
+
+        Returns:
+            int: The number of cities relabelled.
+        """
+        changed = repair_tree(search.distances, search.parents, self.forward, self.backward,
+                              self.graph.weights, source, target, old_weight, self.graph.weights[edge])
+        inf = float('inf')
+        for node in changed:
+            search.settled[node] = search.distances[node] != inf
+        return len(changed)
+
+    def repair_all_pairs(self, table, source, target, edge, old_weight):
+        """
+        Repair an AllPairs table after the edge source -> target changed.
+
+        Column ``t`` of the next-hop matrix is a shortest-path tree towards ``t`` (the
+        parent of ``x`` is its next hop), so only the columns that used the edge, or that
+        it now shortens, are repaired, each as a tree on the reversed roads. Memory-mapped
+        tables are read-only and are copied into memory on the first change.
+
+        Returns:
+            int: The number of (city, destination) entries relabelled.
+        """
+        import numpy as np
+
+        if not table.distances.flags.writeable or not table.next_hops.flags.writeable:
+            table.distances = np.array(table.distances)
+            table.next_hops = np.array(table.next_hops)
+        weights = self.graph.weights
+        weight = weights[edge]
+        if weight < old_weight:
+            columns = np.flatnonzero(weight + table.distances[target] < table.distances[source])
+        else:
+            columns = np.flatnonzero(table.next_hops[source] == target)
+
+        repaired = 0
+        for column in columns:
+            repaired += len(repair_tree(table.distances[:, column], table.next_hops[:, column],
+                                        self.backward, self.forward, weights, target, source,
+                                        old_weight, weight))
+        return repaired
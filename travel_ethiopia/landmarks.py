@@ -0,0 +1,109 @@
+from array import array
+
+from .shortest_paths import DijkstraSearch
+
+
+class LandmarkHeuristic:
+    """
+    Goal-agnostic A* lower bounds from landmark (ALT) preprocessing.
+
+    A few landmarks are picked, and the shortest distances from every landmark to every
+    city and from every city to every landmark are stored. By the triangle inequality,
+    for any landmark L:
+
+        d(v, goal) >= d(L, goal) - d(L, v)   and   d(v, goal) >= d(v, L) - d(goal, L)
+
+    The largest of these bounds is an admissible, consistent heuristic for any goal.
+
+    Attributes:
+        graph (RoadGraph): The graph the landmarks were picked on.
+        landmarks (list): Node ids of the landmarks.
+        from_landmark (array): ``from_landmark[i * n + v]`` is d(landmarks[i], v).
+        to_landmark (array): ``to_landmark[i * n + v]`` is d(v, landmarks[i]).
+    """
+
+    def __init__(self, graph, count=4):
+        """
+        Pick landmarks by farthest selection and store their distance arrays.
+
+        Each new landmark is the city farthest (by summed distance) from the landmarks
+        already chosen, which spreads them around the edge of the network.
+
+        Args:
+            graph (RoadGraph): The graph.
+            count (int, optional): How many landmarks to pick. Defaults to 4.
+        """
+        self.graph = graph
+        self.landmarks = []
+        self.from_landmark = array('d')
+        self.to_landmark = array('d')
+
+        n = len(graph)
+        if n == 0:
+            return
+        reverse = graph.reversed()
+        spread = [0.0] * n
+        candidate = max(range(n), key=graph.degree)
+
+        for _ in range(min(count, n)):
+            self.landmarks.append(candidate)
+            forward = DijkstraSearch(graph, candidate).tree().distances
+            backward = DijkstraSearch(reverse, candidate).tree().distances
+            self.from_landmark.extend(forward)
+            self.to_landmark.extend(backward)
+
+            for node in range(n):
+                if forward[node] != float('inf'):
+                    spread[node] += forward[node]
+            chosen = set(self.landmarks)
+            candidate = max((node for node in range(n) if node not in chosen), key=spread.__getitem__,
+                            default=None)
+            if candidate is None:
+                break
+
+    def bound(self, node, goal):
+        """
+        Return a lower bound on the shortest distance from node to goal.
+
+        Args:
+            node (int): Node id of the city.
+            goal (int): Node id of the destination.
+
+        Returns:
+            float: The triangle-inequality lower bound (0 when no landmark helps).
+        """
+        return self.heuristic(goal)(node)
+
+    def heuristic(self, goal):
+        """
+        Return the heuristic function for one destination.
+
+        The goal's own landmark distances are read once here, so each call of the
+        returned function only does two array reads per landmark.
+
+        Args:
+            goal (int): Node id of the destination.
+
+        Returns:
+            callable: ``h(node)`` giving a lower bound on d(node, goal).
+        """
+        n = len(self.graph)
+        inf = float('inf')
+        from_landmark, to_landmark = self.from_landmark, self.to_landmark
+        rows = []
+        for i in range(len(self.landmarks)):
+            offset = i * n
+            rows.append((offset, from_landmark[offset + goal], to_landmark[offset + goal]))
+
+        def h(node):
+            best = 0.0
+            for offset, landmark_to_goal, goal_to_landmark in rows:
+                landmark_to_node = from_landmark[offset + node]
+                if landmark_to_goal != inf and landmark_to_node != inf:
+                    best = max(best, landmark_to_goal - landmark_to_node)
+                node_to_landmark = to_landmark[offset + node]
+                if node_to_landmark != inf and goal_to_landmark != inf:
+                    best = max(best, node_to_landmark - goal_to_landmark)
+            return best
+
+        return h
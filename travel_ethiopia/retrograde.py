@@ -0,0 +1,211 @@
+from array import array
+from collections import deque
+
+MAX_TO_MOVE, MIN_TO_MOVE = 0, 1
+
+
+class RetrogradeSolver:
+    """
+    Whole-graph backward induction for the minimax road game.
+
+    Every (node, side to move) pair is a state; state ``2 * node + side`` holds its game
+    value and best move in two flat arrays, so any start node is answered in O(1).
+
+    Rules: moving along an unblocked road hands the turn to the other player; terminal
+    nodes, and non-terminal nodes without unblocked roads, end the game with their
+    utility; a game that never ends scores ``draw_value``. Positions carry no memory of
+    the path, so cycles are ordinary repeated states rather than a special case.
+
+    Values are found threshold by threshold. For each candidate value t (every leaf
+    utility plus the draw value), MAX can guarantee at least t when
+    - t <= draw_value: MIN cannot force the game into a leaf worth less than t, and
+    - t > draw_value: MAX can force the game into a leaf worth t or more,
+    both of which are attractor computations over predecessor lists. A state's value is
+    the largest t MAX can guarantee.
+
+    Attributes:
+        graph (RoadGraph): The compiled minimax graph.
+        draw_value (float): Score of a game that never ends.
+        blocked (array): This solver's own copy of the blocked flags.
+        values (array): Game value of every state.
+        best (array): Best next node of every state, -1 for leaves.
+    """
+
+    def __init__(self, graph, draw_value=0):
+        """
+        Solve every state of the graph.
+
+        Args:
+            graph (RoadGraph): The compiled minimax graph (with 'utility' and 'terminal').
+            draw_value (float, optional): Score of a game that never ends. Defaults to 0.
+        """
+        n = len(graph)
+        self.graph = graph
+        self.draw_value = draw_value
+        self.blocked = array('b', graph.blocked)
+        self.values = array('d', [0.0]) * (2 * n)
+        self.best = array('q', [-1]) * (2 * n)
+        self._reverse = graph.reversed()
+        self._solve(range(n))
+
+    def value(self, name, maximizing_player=True):
+        """Return the game value with the given player to move at a city."""
+        return self.values[2 * self.graph.node(name) + (MAX_TO_MOVE if maximizing_player else MIN_TO_MOVE)]
+
+    def best_move(self, name, maximizing_player=True):
+        """
+        Return the best move and game value with the given player to move at a city.
+
+        Returns:
+            tuple: The best next city (None at a leaf) and the game value.
+        """
+        state = 2 * self.graph.node(name) + (MAX_TO_MOVE if maximizing_player else MIN_TO_MOVE)
+        move = self.best[state]
+        return (self.graph.names[move] if move >= 0 else None), self.values[state]
+
+    def block_edge(self, source, target):
+        """
+        Block the road source -> target and re-solve only the states it can affect.
+
+        Returns:
+            int: The number of cities whose states were recomputed.
+        """
+        return self._set_blocked(source, target, 1)
+
+    def unblock_edge(self, source, target):
+        """
+        Unblock the road source -> target and re-solve only the states it can affect.
+
+        Returns:
+            int: The number of cities whose states were recomputed.
+        """
+        return self._set_blocked(source, target, 0)
+
+    def _set_blocked(self, source, target, flag):
+        graph = self.graph
+        u, v = graph.node(source), graph.node(target)
+        changed = False
+        for edge in range(graph.offsets[u], graph.offsets[u + 1]):
+            if graph.targets[edge] == v and self.blocked[edge] != flag:
+                self.blocked[edge] = flag
+                changed = True
+        if not changed:
+            return 0
+
+        # Only cities that can reach ``u`` see the change; every other state keeps its value.
+        reverse = self._reverse
+        affected = bytearray(len(graph))
+        affected[u] = 1
+        queue = deque([u])
+        while queue:
+            node = queue.popleft()
+            for edge in range(reverse.offsets[node], reverse.offsets[node + 1]):
+                predecessor = reverse.targets[edge]
+                if not affected[predecessor]:
+                    affected[predecessor] = 1
+                    queue.append(predecessor)
+        nodes = [node for node in range(len(graph)) if affected[node]]
+        self._solve(nodes)
+        return len(nodes)
+
+    def _solve(self, nodes):
+        """
+        Solve the states of ``nodes``, treating every state outside them as a fixed
+        outcome with its current value.
+        """
+        graph = self.graph
+        offsets, targets, blocked = graph.offsets, graph.targets, self.blocked
+        terminal, utility = graph.attributes['terminal'], graph.attributes['utility']
+        values, best = self.values, self.best
+        draw = self.draw_value
+
+        free = set()        # Non-leaf states being solved
+        outcome = {}        # Fixed-outcome states reachable from them: leaves and outside states
+        successors = {}
+        predecessors = {}
+        for node in nodes:
+            children = [] if terminal[node] else [targets[edge] for edge in range(offsets[node], offsets[node + 1])
+                                                  if not blocked[edge]]
+            for side in (MAX_TO_MOVE, MIN_TO_MOVE):
+                state = 2 * node + side
+                if not children:
+                    values[state] = utility[node]
+                    best[state] = -1
+                    continue
+                free.add(state)
+                successors[state] = [2 * child + 1 - side for child in children]
+                for successor in successors[state]:
+                    predecessors.setdefault(successor, []).append(state)
+
+        for state in free:
+            for successor in successors[state]:
+                if successor not in free:
+                    outcome[successor] = values[successor]
+        if not free:
+            return
+
+        thresholds = sorted(set(outcome.values()) | {draw})
+        value = dict.fromkeys(free, thresholds[0])
+        entry_move = {}
+
+        for threshold in thresholds[1:]:
+            if threshold <= draw:
+                # MIN tries to force an outcome below the threshold; MAX wins where it cannot.
+                reached = self._attractor(free, outcome, successors, predecessors, MIN_TO_MOVE,
+                                          lambda score: score < threshold)
+                for state in free:
+                    if state not in reached:
+                        value[state] = threshold
+                    elif state not in entry_move and reached[state] >= 0:
+                        entry_move[state] = reached[state]
+            else:
+                # MAX tries to force an outcome at or above the threshold.
+                reached = self._attractor(free, outcome, successors, predecessors, MAX_TO_MOVE,
+                                          lambda score: score >= threshold)
+                for state in reached:
+                    if state in free:
+                        value[state] = threshold
+                        if reached[state] >= 0:
+                            entry_move[state] = reached[state]
+
+        for state, state_value in value.items():
+            values[state] = state_value
+
+        for state in free:
+            side = state & 1
+            state_value = value[state]
+            winning = state_value > draw if side == MAX_TO_MOVE else state_value < draw
+            move = entry_move.get(state) if winning else None
+            if move is None:
+                if side == MAX_TO_MOVE:
+                    move = max(successors[state], key=values.__getitem__)
+                else:
+                    move = min(successors[state], key=values.__getitem__)
+            best[state] = move >> 1
+
+    @staticmethod
+    def _attractor(free, outcome, successors, predecessors, player, is_target):
+        """
+        States from which ``player`` can force reaching a target outcome.
+
+        Returns:
+            dict: Every attracted state, mapped to the successor the player moves to
+            (-1 for targets and for states where the opponent is forced in).
+        """
+        reached = {state: -1 for state, score in outcome.items() if is_target(score)}
+        remaining = {state: len(successors[state]) for state in free if state & 1 != player}
+        queue = deque(reached)
+        while queue:
+            state = queue.popleft()
+            for predecessor in predecessors.get(state, ()):
+                if predecessor in reached or predecessor not in free:
+                    continue
+                if predecessor & 1 == player:
+                    reached[predecessor] = state
+                    queue.append(predecessor)
+                else:
+                    remaining[predecessor] -= 1
+                    if remaining[predecessor] == 0:
+                        reached[predecessor] = -1
+                        queue.append(predecessor)
+        return reached
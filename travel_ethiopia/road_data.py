@@ -0,0 +1,317 @@
+import hashlib
+import json
+import math
+import os
+import struct
+import tempfile
+from array import array
+
+from .all_pairs import CACHE_DIR
+from .road_graph import RoadGraph
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+BINARY_MAGIC = b'TEROADS1'
+_HEADER = struct.Struct('<8sQQQQ')  # magic, cities, edges, bytes of names, attributes
+_ATTRIBUTE = struct.Struct('<Qc')  # bytes of key, typecode
+
+
+class RoadDataError(ValueError):
+    """Raised when road data is inconsistent (unknown cities, bad weights, conflicting copies)."""
+
+
+class RoadData:
+    """
+    A validated, undirected road network: the canonical on-disk road format.
+
+    On disk this is a JSON file listing every road once::
+
+        {
+          "cities": ["Addis Ababa", "Adama", ...],
+          "roads": [["Addis Ababa", "Adama", 3], ...],
+          "attributes": {"cost": {"Addis Ababa": 26, ...}}
+        }
+
+    Every road is usable in both directions with the same weight. Loading checks that
+    every road joins two distinct, listed cities with a positive finite weight, drops
+    exact duplicates, and rejects roads listed twice with different weights.
+
+    Attributes:
+        cities (list): City names.
+        roads (list): ``(city, city, weight)`` triples, one per road.
+        attributes (dict): Per-city values by attribute name, e.g. 'cost' for A*.
+        duplicates (int): Duplicate road listings dropped while loading.
+    """
+
+    def __init__(self, cities, roads, attributes=None):
+        """
+        Validate and deduplicate a road list.
+
+        Args:
+            cities (list): City names.
+            roads (iterable): ``(city, city, weight)`` triples.
+            attributes (dict, optional): ``{name: {city: value}}``. Defaults to none.
+
+        Raises:
+            RoadDataError: If a city is repeated or unknown, a weight is not a positive
+                finite number, or a road is listed twice with different weights.
+        """
+        known = set()
+        for city in cities:
+            if city in known:
+                raise RoadDataError(f"City {city!r} is listed twice.")
+            known.add(city)
+
+        weights = {}
+        self.roads = []
+        self.duplicates = 0
+        for a, b, weight in roads:
+            for city in (a, b):
+                if city not in known:
+                    raise RoadDataError(f"Road {a!r} - {b!r} uses unknown city {city!r}.")
+            if a == b:
+                raise RoadDataError(f"Road {a!r} - {b!r} is a loop.")
+            if isinstance(weight, bool) or not isinstance(weight, (int, float)) \
+                    or not math.isfinite(weight) or weight <= 0:
+                raise RoadDataError(f"Road {a!r} - {b!r} has invalid weight {weight!r}.")
+            pair = (a, b) if a < b else (b, a)
+            if pair in weights:
+                if weights[pair] != weight:
+                    raise RoadDataError(f"Road {a!r} - {b!r} is listed with weights {weights[pair]} and {weight}.")
+                self.duplicates += 1
+                continue
+            weights[pair] = weight
+            self.roads.append((a, b, weight))
+
+        for name, values in (attributes or {}).items():
+            for city in values:
+                if city not in known:
+                    raise RoadDataError(f"Attribute {name!r} is set for unknown city {city!r}.")
+        self.cities = list(cities)
+        self.attributes = {name: dict(values) for name, values in (attributes or {}).items()}
+
+    @classmethod
+    def from_adjacency(cls, roads, cities=None, attributes=None):
+        """
+        Import a ``{city: [(neighbor, weight), ...]}`` dictionary, checking its symmetry.
+
+        A road listed under only one of its cities is taken as given; a road listed under
+        both must have the same weight both ways.
+
+        Args:
+            roads (dict): The adjacency dictionary.
+            cities (list, optional): City names. Defaults to every city in ``roads``.
+            attributes (dict, optional): ``{name: {city: value}}``. Defaults to none.
+
+        Returns:
+            RoadData: The validated network.
+
+        Raises:
+            RoadDataError: If the two directions of a road disagree, or as in ``__init__``.
+        """
+        directed = {}
+        for city, neighbors in roads.items():
+            for neighbor, weight in neighbors:
+                previous = directed.setdefault((city, neighbor), weight)
+                if previous != weight:
+                    raise RoadDataError(f"Road {city!r} -> {neighbor!r} is listed with weights {previous} and {weight}.")
+        for (a, b), weight in directed.items():
+            reverse = directed.get((b, a))
+            if reverse is not None and reverse != weight:
+                raise RoadDataError(f"Road {a!r} - {b!r} weighs {weight} one way and {reverse} the other.")
+
+        if cities is None:
+            cities = list(dict.fromkeys([city for pair in directed for city in pair] + list(roads)))
+        return cls(cities, [(a, b, weight) for (a, b), weight in directed.items()], attributes)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a road network from its JSON file.
+
+        A file with an ``"extends"`` key is an overlay on another network file (a path
+        relative to its own): its ``cities`` and ``roads`` are added to the base network's
+        and its attributes are merged in. Overlay roads go through the same checks, so an
+        overlay cannot give a base road a different weight.
+
+        Args:
+            path (str): The JSON file.
+
+        Returns:
+            RoadData: The validated network.
+
+        Raises:
+            RoadDataError: If the network, or the overlay applied to its base, is inconsistent.
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        cities = data.get('cities', [])
+        roads = [tuple(road) for road in data.get('roads', [])]
+        attributes = data.get('attributes') or {}
+        if 'extends' in data:
+            base = cls.load(os.path.join(os.path.dirname(path), data['extends']))
+            cities = base.cities + cities
+            roads = base.roads + roads
+            merged = {name: dict(values) for name, values in base.attributes.items()}
+            for name, values in attributes.items():
+                merged.setdefault(name, {}).update(values)
+            attributes = merged
+        return cls(cities, roads, attributes)
+
+    def save(self, path):
+        """
+        Write the network as JSON, one road per line.
+
+        Args:
+            path (str): Destination file.
+        """
+        lines = ['{', f'  "cities": {json.dumps(self.cities, ensure_ascii=False)},', '  "roads": [']
+        lines.append(',\n'.join(f'    {json.dumps(list(road), ensure_ascii=False)}' for road in self.roads))
+        lines.append('  ],')
+        lines.append(f'  "attributes": {json.dumps(self.attributes, ensure_ascii=False)}')
+        lines.append('}')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def adjacency(self):
+        """
+        Return both directions of every road, in file order.
+
+        Returns:
+            dict: ``{city: [(neighbor, weight), ...]}`` for every city.
+        """
+        adjacency = {city: [] for city in self.cities}
+        for a, b, weight in self.roads:
+            adjacency[a].append((b, weight))
+            adjacency[b].append((a, weight))
+        return adjacency
+
+    def to_ufs(self):
+        """Export as ``(cities, roads)`` in the ``cities_road_ufs`` layout (weights dropped)."""
+        return list(self.cities), {city: [(neighbor, 0) for neighbor, _ in neighbors]
+                                   for city, neighbors in self.adjacency().items()}
+
+    def to_ucs(self):
+        """Export as ``{city: [(neighbor, weight), ...]}`` in the ``cities_road_ucs`` layout."""
+        return self.adjacency()
+
+    def to_ifs(self):
+        """Export as ``{city: {'cost': h, 'neighbors': [...]}}`` in the ``cities_road_ifs`` layout."""
+        costs = self.attributes.get('cost', {})
+        return {city: {'cost': costs.get(city, 0), 'neighbors': neighbors}
+                for city, neighbors in self.adjacency().items()}
+
+    def compile(self):
+        """
+        Compile into a RoadGraph with both directions of every road.
+
+        Returns:
+            RoadGraph: The graph, with every attribute as a per-node array.
+        """
+        graph = RoadGraph.from_roads(self.adjacency(), self.cities)
+        for name, values in self.attributes.items():
+            column = [values.get(city, 0) for city in graph.names]
+            typecode = 'q' if all(isinstance(value, int) for value in column) else 'd'
+            graph.attributes[name] = array(typecode, column)
+        return graph
+
+
+def write_binary(graph, path):
+    """
+    Write a RoadGraph as one contiguous binary file.
+
+    The layout is a fixed header, the NUL-separated city names, then the raw CSR buffers
+    and attribute arrays, so ``read_binary`` needs a single read and no parsing.
+
+    Args:
+        graph (RoadGraph): The graph.
+        path (str): Destination file.
+    """
+    names = '\0'.join(graph.names).encode('utf-8')
+    parts = [_HEADER.pack(BINARY_MAGIC, len(graph), len(graph.targets), len(names), len(graph.attributes)),
+             names, graph.offsets.tobytes(), graph.targets.tobytes(), graph.weights.tobytes(),
+             graph.blocked.tobytes()]
+    for key, values in graph.attributes.items():
+        encoded = key.encode('utf-8')
+        parts += [_ATTRIBUTE.pack(len(encoded), values.typecode.encode('ascii')), encoded, values.tobytes()]
+    with open(path, 'wb') as f:
+        f.write(b''.join(parts))
+
+
+def read_binary(path):
+    """
+    Read a RoadGraph written by ``write_binary`` with a single read.
+
+    Args:
+        path (str): The binary file.
+
+    Returns:
+        RoadGraph: The graph.
+
+    Raises:
+        RoadDataError: If the file is not a road-graph cache.
+    """
+    with open(path, 'rb') as f:
+        data = memoryview(f.read())
+    magic, n, m, names_size, attribute_count = _HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise RoadDataError(f"{path} is not a road-graph cache.")
+    position = _HEADER.size
+
+    def take(typecode, count):
+        nonlocal position
+        values = array(typecode)
+        size = count * values.itemsize
+        values.frombytes(data[position:position + size])
+        position += size
+        return values
+
+    names = bytes(data[position:position + names_size]).decode('utf-8').split('\0') if n else []
+    position += names_size
+    offsets, targets, weights, blocked = take('q', n + 1), take('q', m), take('d', m), take('b', m)
+    attributes = {}
+    for _ in range(attribute_count):
+        key_size, typecode = _ATTRIBUTE.unpack_from(data, position)
+        position += _ATTRIBUTE.size
+        key = bytes(data[position:position + key_size]).decode('utf-8')
+        position += key_size
+        attributes[key] = take(typecode.decode('ascii'), n)
+    return RoadGraph(names, offsets, targets, weights, blocked, attributes)
+
+
+def load_road_graph(path, cache_dir=CACHE_DIR):
+    """
+    Load a JSON road network as a RoadGraph, through a binary cache.
+
+    The first load validates and compiles the JSON and writes the compiled graph to
+    ``cache_dir``; later loads of the unchanged file (same path, size and modification
+    time) read the cache in one go instead. If the cache cannot be written, the graph
+    is still returned.
+
+    Args:
+        path (str): The JSON file.
+        cache_dir (str, optional): Directory of the binary cache. Defaults to CACHE_DIR.
+
+    Returns:
+        RoadGraph: The compiled graph.
+    """
+    status = os.stat(path)
+    key = f'{os.path.abspath(path)}\0{status.st_size}\0{status.st_mtime_ns}'
+    cache_path = os.path.join(cache_dir, f'{hashlib.sha256(key.encode("utf-8")).hexdigest()}.roads.bin')
+    if os.path.exists(cache_path):
+        return read_binary(cache_path)
+
+    graph = RoadData.load(path).compile()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.bin')
+        os.close(fd)
+        try:
+            write_binary(graph, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass  # An unwritable cache only means the next load parses the JSON again
+    return graph
+
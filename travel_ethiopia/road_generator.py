@@ -0,0 +1,209 @@
+import math
+import random
+from collections import deque
+
+import numpy as np
+
+# Rough outline of Ethiopia as (longitude, latitude) pairs, used to place synthetic cities.
+ETHIOPIA_OUTLINE = [
+    (36.5, 14.3), (37.9, 14.9), (39.1, 14.7), (40.1, 14.5), (41.7, 13.0), (42.4, 12.5),
+    (43.3, 11.9), (42.9, 11.0), (44.0, 9.0), (47.9, 8.0), (45.0, 5.0), (43.0, 4.2),
+    (41.9, 3.9), (40.8, 4.2), (39.5, 3.4), (38.0, 3.6), (36.8, 4.4), (35.9, 4.6),
+    (35.3, 5.4), (34.7, 6.6), (33.0, 7.9), (33.9, 8.4), (34.1, 10.6), (35.3, 12.5),
+    (36.1, 12.7),
+]
+KM_PER_DEGREE = 111.0
+KM_PER_UNIT = 50.0  # Road weights are in units of 50 km, like the hand-written data
+MOYALE = (39.06, 3.52)
+
+
+class RoadNetwork:
+    """
+    A synthetic, Ethiopia-shaped road network that can be exported in every road format
+    used by the search modules.
+
+    Attributes:
+        cities (list): City names.
+        coordinates (numpy.ndarray): ``(longitude, latitude)`` of every city.
+        edges (list): Undirected roads as ``(u, v, weight)`` index triples.
+        goal (int): Index of the city the 'cost' heuristics measure towards.
+    """
+
+    def __init__(self, cities, coordinates, edges, goal):
+        self.cities = cities
+        self.coordinates = coordinates
+        self.edges = edges
+        self.goal = goal
+
+    def _adjacency(self):
+        adjacency = [[] for _ in self.cities]
+        for u, v, weight in self.edges:
+            adjacency[u].append((v, weight))
+            adjacency[v].append((u, weight))
+        return adjacency
+
+    def to_ufs(self):
+        """
+        Export in the ``cities_road_ufs`` format.
+
+        Returns:
+            tuple: ``(cities, roads)`` with ``roads = {city: [(neighbor, 0), ...]}``.
+        """
+        names = self.cities
+        return list(names), {names[u]: [(names[v], 0) for v, _ in neighbors]
+                             for u, neighbors in enumerate(self._adjacency())}
+
+    def to_ucs(self):
+        """
+        Export in the ``cities_road_ucs`` format.
+
+        Returns:
+            dict: ``{city: [(neighbor, weight), ...]}``.
+        """
+        names = self.cities
+        return {names[u]: [(names[v], weight) for v, weight in neighbors]
+                for u, neighbors in enumerate(self._adjacency())}
+
+    def to_ifs(self):
+        """
+        Export in the ``cities_road_ifs`` format, with 'cost' as the straight-line
+        distance to the goal city (rounded down, so it never overestimates).
+
+        Returns:
+            dict: ``{city: {'cost': h, 'neighbors': [(neighbor, weight), ...]}}``.
+        """
+        names = self.cities
+        straight = _distance_km(self.coordinates, self.coordinates[self.goal]) / KM_PER_UNIT
+        return {names[u]: {'cost': int(straight[u]), 'neighbors': [(names[v], weight) for v, weight in neighbors]}
+                for u, neighbors in enumerate(self._adjacency())}
+
+    def to_minimax(self, start=0, blocked_ratio=0.1, seed=0):
+        """
+        Export a decision graph in the ``cities_road_minimax`` format.
+
+        Roads are oriented away from ``start`` along a BFS tree, so every city is reached
+        once; leaves are terminal with a random utility from 1 to 10, and a share of the
+        roads is marked as blocked.
+
+        Args:
+            start (int, optional): Index of the root city. Defaults to 0.
+            blocked_ratio (float, optional): Share of blocked roads. Defaults to 0.1.
+            seed (int, optional): Random seed. Defaults to 0.
+
+        Returns:
+            dict: ``{city: {'utility': u, 'neighbors': [(neighbor, is_blocked), ...], 'terminal': t}}``.
+        """
+        rng = random.Random(seed)
+        names = self.cities
+        adjacency = self._adjacency()
+        children = [[] for _ in names]
+        seen = bytearray(len(names))
+        seen[start] = 1
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for neighbor, _ in adjacency[node]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    children[node].append(neighbor)
+                    queue.append(neighbor)
+
+        roads = {}
+        for node, name in enumerate(names):
+            terminal = not children[node]
+            roads[name] = {
+                'utility': rng.randint(1, 10) if terminal else 0,
+                'neighbors': [(names[child], rng.random() < blocked_ratio) for child in children[node]],
+                'terminal': terminal,
+            }
+        return roads
+
+
+def generate_network(num_cities, neighbors=3, seed=0):
+    """
+    Generate a connected road network of cities scattered over Ethiopia.
+
+    Cities are sampled uniformly inside ETHIOPIA_OUTLINE and each is joined to its
+    ``neighbors`` nearest cities (found through a uniform grid, so generation stays
+    near-linear up to millions of cities). Remaining components are chained together.
+    Road weights are the length in 50 km units times a random detour factor, rounded up.
+
+    Args:
+        num_cities (int): Number of cities.
+        neighbors (int, optional): Roads per city to its nearest cities. Defaults to 3.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        RoadNetwork: The generated network.
+    """
+    rng = np.random.default_rng(seed)
+    coordinates = _sample_outline(num_cities, rng)
+    goal = int(np.argmin(_distance_km(coordinates, np.array(MOYALE))))
+    cities = [f'City {i}' for i in range(num_cities)]
+    cities[goal] = 'Moyale'
+
+    lon_min, lat_min = coordinates.min(axis=0)
+    cell = math.sqrt(2.0 * (np.ptp(coordinates[:, 0]) * np.ptp(coordinates[:, 1]) or 1.0) / max(num_cities, 1))
+    cells = {}
+    keys = np.floor((coordinates - (lon_min, lat_min)) / cell).astype(np.int64).tolist()
+    for city, key in enumerate(keys):
+        cells.setdefault(tuple(key), []).append(city)
+
+    points = coordinates.tolist()
+    detours = rng.uniform(1.0, 1.4, size=num_cities).tolist()
+    pairs = set()
+    for city, (cx, cy) in enumerate(keys):
+        x, y = points[city]
+        candidates = []
+        ring = 1
+        while len(candidates) < neighbors + 1 and ring <= 8:
+            candidates = [other for dx in range(-ring, ring + 1) for dy in range(-ring, ring + 1)
+                          for other in cells.get((cx + dx, cy + dy), ())]
+            ring += 1
+        candidates.sort(key=lambda other: (points[other][0] - x) ** 2 + (points[other][1] - y) ** 2)
+        for other in candidates[1:neighbors + 1]:
+            pairs.add((min(city, other), max(city, other)))
+
+    parent = list(range(num_cities))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for u, v in pairs:
+        parent[find(u)] = find(v)
+    roots = sorted({find(city) for city in range(num_cities)}, key=lambda city: points[city])
+    pairs.update((min(u, v), max(u, v)) for u, v in zip(roots, roots[1:]))
+
+    edges = []
+    for u, v in sorted(pairs):
+        length = math.dist(points[u], points[v]) * KM_PER_DEGREE * detours[u]
+        edges.append((u, v, max(1, math.ceil(length / KM_PER_UNIT))))
+    return RoadNetwork(cities, coordinates, edges, goal)
+
+
+def _sample_outline(count, rng):
+    """Uniform points inside ETHIOPIA_OUTLINE by vectorized rejection sampling."""
+    outline = np.array(ETHIOPIA_OUTLINE)
+    low, high = outline.min(axis=0), outline.max(axis=0)
+    accepted = []
+    total = 0
+    while total < count:
+        batch = rng.uniform(low, high, size=(max(2 * (count - total), 64), 2))
+        inside = np.zeros(len(batch), dtype=bool)
+        x, y = batch[:, 0], batch[:, 1]
+        for (x1, y1), (x2, y2) in zip(outline, np.roll(outline, -1, axis=0)):
+            crosses = (y1 > y) != (y2 > y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                at = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            inside ^= crosses & (x < at)
+        accepted.append(batch[inside])
+        total += int(inside.sum())
+    return np.concatenate(accepted)[:count]
+
+
+def _distance_km(coordinates, point):
+    """Straight-line distance in km from every coordinate to one point."""
+    return np.hypot(*(coordinates - point).T) * KM_PER_DEGREE
@@ -0,0 +1,383 @@
+import hashlib
+from array import array
+
+
+class RoadGraph:
+    """
+    A compiled, integer-indexed representation of a road network.
+
+    City names are interned to consecutive integers once, and the adjacency is stored in
+    compressed sparse row (CSR) form: the outgoing edges of node ``u`` are the slots
+    ``offsets[u]:offsets[u + 1]`` of the flat ``targets`` and ``weights`` buffers.
+    Per-node fields found in the road dictionaries (``cost``, ``utility``, ``terminal``)
+    are kept in flat arrays as well, so search loops never hash strings or build tuples.
+
+    Attributes:
+        names (list): City names, indexed by node id.
+        index (dict): Mapping from city name to node id.
+        offsets (array): CSR row offsets, of length ``len(names) + 1``.
+        targets (array): Target node id of every edge.
+        weights (array): Weight of every edge.
+        blocked (array): 1 for every edge marked as blocked, 0 otherwise.
+        attributes (dict): Mapping from attribute name to a per-node array.
+    """
+
+    def __init__(self, names, offsets, targets, weights, blocked=None, attributes=None):
+        """
+        Initialize the RoadGraph from already compiled buffers.
+
+        Args:
+            names (list): City names, indexed by node id.
+            offsets (array): CSR row offsets.
+            targets (array): Target node id of every edge.
+            weights (array): Weight of every edge.
+            blocked (array, optional): Blocked flag of every edge. Defaults to no blocked edges.
+            attributes (dict, optional): Per-node attribute arrays. Defaults to none.
+        """
+        self.names = names
+        self.index = {name: node for node, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.blocked = blocked if blocked is not None else array('b', bytes(len(targets)))
+        self.attributes = attributes or {}
+        self.integral = all(weight.is_integer() for weight in weights)
+
+    @classmethod
+    def from_roads(cls, roads, cities=None):
+        """
+        Compile any of the road dictionaries used in this project.
+
+        Three layouts are understood:
+        - ``{city: [(neighbor, weight), ...]}`` (``cities_road_ufs``, ``cities_road_ucs``)
+        - ``{city: {'cost': h, 'neighbors': [(neighbor, weight), ...]}}`` (``cities_road_ifs``)
+        - ``{city: {'utility': u, 'terminal': t, 'neighbors': [(neighbor, is_blocked), ...]}}``
+          (``cities_road_minimax``)
+
+        Neighbors may also be plain city names, in which case the edge weight is 1.
+        The edges of a city keep the order in which they are listed.
+
+        Args:
+            roads (dict): The road dictionary.
+            cities (list, optional): City names to intern first, in this order.
+
+        Returns:
+            RoadGraph: The compiled graph.
+        """
+        names = []
+        index = {}
+
+        def intern(name):
+            node = index.get(name)
+            if node is None:
+                node = index[name] = len(names)
+                names.append(name)
+            return node
+
+        for city in cities or ():
+            intern(city)
+
+        sources = array('q')
+        targets = array('q')
+        weights = array('d')
+        blocked = array('b')
+        fields = {}
+
+        for city, entry in roads.items():
+            node = intern(city)
+            if isinstance(entry, dict):
+                neighbors = entry.get('neighbors', ())
+                for key, value in entry.items():
+                    if key != 'neighbors':
+                        fields.setdefault(key, {})[node] = value
+            else:
+                neighbors = entry
+
+            for neighbor in neighbors:
+                if isinstance(neighbor, str):
+                    neighbor, weight = neighbor, 1
+                else:
+                    neighbor, weight = neighbor
+                sources.append(node)
+                targets.append(intern(neighbor))
+                if isinstance(weight, bool):
+                    weights.append(1.0)
+                    blocked.append(weight)
+                else:
+                    weights.append(float(weight))
+                    blocked.append(False)
+
+        attributes = {}
+        for key, values in fields.items():
+            typecode = 'q' if all(isinstance(value, int) for value in values.values()) else 'd'
+            column = array(typecode, bytes(8 * len(names)))
+            for node, value in values.items():
+                column[node] = value
+            attributes[key] = column
+
+        return cls._from_edges(names, sources, targets, weights, blocked, attributes)
+
+    @classmethod
+    def _from_edges(cls, names, sources, targets, weights, blocked, attributes):
+        """
+        Build the CSR buffers from parallel edge arrays with a stable counting sort,
+        so every node keeps its edges in their original order.
+        """
+        n = len(names)
+        offsets = array('q', bytes(8 * (n + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(n):
+            offsets[node + 1] += offsets[node]
+
+        m = len(sources)
+        slot = array('q', offsets[:n])
+        csr_targets = array('q', bytes(8 * m))
+        csr_weights = array('d', bytes(8 * m))
+        csr_blocked = array('b', bytes(m))
+        for edge in range(m):
+            source = sources[edge]
+            position = slot[source]
+            slot[source] = position + 1
+            csr_targets[position] = targets[edge]
+            csr_weights[position] = weights[edge]
+            csr_blocked[position] = blocked[edge]
+
+        return cls(names, offsets, csr_targets, csr_weights, csr_blocked, attributes)
+
+    def reversed(self):
+        """
+        Return the graph with every edge turned around, for searches towards a target.
+
+        Returns:
+            RoadGraph: The transposed graph, sharing names and node attributes.
+        """
+        n = len(self.names)
+        sources = array('q')
+        for node in range(n):
+            sources.extend([node] * (self.offsets[node + 1] - self.offsets[node]))
+        return self._from_edges(self.names, self.targets, sources, self.weights, self.blocked,
+                                self.attributes)
+
+    def incoming(self):
+        """
+        Return the incoming edges of every node in CSR form.
+
+        Unlike ``reversed``, the edges keep their ids, so weights changed in place are
+        seen through ``weights[edge]``.
+
+        Returns:
+            tuple: ``(offsets, sources, edges)``; the edges into node ``v`` are the slots
+            ``offsets[v]:offsets[v + 1]``, with their source node and edge id.
+        """
+        n, m = len(self.names), len(self.targets)
+        offsets = array('q', bytes(8 * (n + 1)))
+        for target in self.targets:
+            offsets[target + 1] += 1
+        for node in range(n):
+            offsets[node + 1] += offsets[node]
+
+        slot = array('q', offsets[:n])
+        sources = array('q', bytes(8 * m))
+        edges = array('q', bytes(8 * m))
+        for node in range(n):
+            for edge in range(self.offsets[node], self.offsets[node + 1]):
+                target = self.targets[edge]
+                position = slot[target]
+                slot[target] = position + 1
+                sources[position] = node
+                edges[position] = edge
+        return offsets, sources, edges
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    @property
+    def num_edges(self):
+        """int: The number of directed edges."""
+        return len(self.targets)
+
+    def node(self, name):
+        """
+        Return the node id of a city.
+
+        Raises:
+            KeyError: If the city is not part of the graph.
+        """
+        return self.index[name]
+
+    def degree(self, node):
+        """Return the number of outgoing edges of a node."""
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def neighbors(self, node):
+        """Return the target node ids of the outgoing edges of a node."""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def edges(self, node):
+        """
+        Iterate over the outgoing edges of a node.
+
+        Yields:
+            tuple: ``(neighbor, weight, is_blocked)`` for every outgoing edge.
+        """
+        for edge in range(self.offsets[node], self.offsets[node + 1]):
+            yield self.targets[edge], self.weights[edge], bool(self.blocked[edge])
+
+    def adjacency(self):
+        """
+        Export the graph as a road dictionary, every node with its edges in CSR order.
+
+        Returns:
+            dict: ``{city: [(neighbor, weight), ...]}``, with weights as returned by ``cost``.
+        """
+        names, offsets, targets, weights = self.names, self.offsets, self.targets, self.weights
+        return {names[node]: [(names[targets[edge]], self.cost(weights[edge]))
+                              for edge in range(offsets[node], offsets[node + 1])]
+                for node in range(len(names))}
+
+    def is_symmetric(self):
+        """
+        Return whether every road u -> v of weight w has a matching road v -> u of weight w.
+
+        On a symmetric graph the shortest path from b to a is the reverse of the one from
+        a to b, so results can be shared between the two directions.
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        roads = set()
+        for u in range(len(self.names)):
+            for edge in range(offsets[u], offsets[u + 1]):
+                roads.add((u, targets[edge], weights[edge]))
+        return all((v, u, weight) in roads for u, v, weight in roads)
+
+    def attribute(self, key, node):
+        """Return a per-node attribute (e.g. ``'cost'`` or ``'utility'``) of a node."""
+        return self.attributes[key][node]
+
+    def cost(self, value):
+        """Return a path cost as an int when every edge weight is integral."""
+        if self.integral and value != float('inf'):
+            return int(value)
+        return value
+
+    def path_names(self, nodes):
+        """Translate a sequence of node ids into city names."""
+        names = self.names
+        return [names[node] for node in nodes]
+
+    def fingerprint(self):
+        """
+        Return a hash of the road data, usable as a cache key for precomputed results.
+
+        Returns:
+            str: Hex SHA-256 digest of the city names, CSR buffers and blocked flags.
+        """
+        digest = hashlib.sha256()
+        digest.update('\0'.join(self.names).encode('utf-8'))
+        for buffer in (self.offsets, self.targets, self.weights, self.blocked):
+            digest.update(buffer.tobytes())
+        return digest.hexdigest()
+
+    def to_numpy(self):
+        """
+        Return zero-copy NumPy views of the CSR buffers.
+
+        Returns:
+            tuple: ``(offsets, targets, weights)`` as NumPy arrays.
+        """
+        import numpy as np
+
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.weights, dtype=np.float64))
+
+
+class SearchTree:
+    """
+    A search tree rooted at a single source, stored as flat per-node arrays.
+
+    Every search that settles nodes from one source (BFS levels, Dijkstra distances)
+    can hand its result back as a SearchTree, which then answers "distance to" and
+    "path to" for any reached city without repeating the search.
+
+    Attributes:
+        graph (RoadGraph): The graph the tree was grown on.
+        source (int): Node id of the root.
+        distances (array): Distance (or hop count) of every node, ``inf`` when unreached.
+        parents (array): Parent node id of every node, -1 for the root and unreached nodes.
+    """
+
+    def __init__(self, graph, source, distances, parents, integral=None):
+        """
+        Initialize the SearchTree.
+
+        Args:
+            graph (RoadGraph): The graph the tree was grown on.
+            source (int): Node id of the root.
+            distances (array): Per-node distances.
+            parents (array): Per-node parent ids.
+            integral (bool, optional): Report distances as ints. Defaults to ``graph.integral``.
+        """
+        self.graph = graph
+        self.source = source
+        self.distances = distances
+        self.parents = parents
+        self.integral = graph.integral if integral is None else integral
+
+    def reached(self, name):
+        """Return True if the city was reached from the root."""
+        node = self.graph.index.get(name)
+        return node is not None and self.distances[node] != float('inf')
+
+    def distance(self, name):
+        """
+        Return the distance from the root to a city.
+
+        Returns:
+            int or float: The distance, or ``inf`` if the city was not reached.
+        """
+        node = self.graph.index.get(name)
+        if node is None:
+            return float('inf')
+        distance = self.distances[node]
+        if self.integral and distance != float('inf'):
+            return int(distance)
+        return distance
+
+    def parent(self, name):
+        """Return the parent of a city in the tree, or None for the root and unreached cities."""
+        parent = self.parents[self.graph.node(name)]
+        return self.graph.names[parent] if parent >= 0 else None
+
+    def path_nodes(self, node):
+        """
+        Rebuild the root-to-node path by following parent pointers.
+
+        Returns:
+            list or None: Node ids from the root to ``node``, or None if it was not reached.
+        """
+        if self.distances[node] == float('inf'):
+            return None
+        parents = self.parents
+        path = [node]
+        while node != self.source:
+            node = parents[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    def path_to(self, name):
+        """
+        Return the tree path from the root to a city.
+
+        Returns:
+            list or None: City names from the root to ``name``, or None if it was not reached.
+        """
+        node = self.graph.index.get(name)
+        if node is None:
+            return None
+        path = self.path_nodes(node)
+        return self.graph.path_names(path) if path is not None else None
@@ -0,0 +1,401 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import OrderedDict, deque
+
+from . import cities_road_ucs
+from .road_data import load_road_graph
+from .shortest_paths import DijkstraSearch
+from .traveling_ethiopia_ifs import AStarSearch, CityGraph
+from .traveling_ethiopia_ucs import TravelEthiopia
+from .traveling_ethiopia_ufs import TravelEthiopia as UninformedTravelEthiopia
+
+ALGORITHMS = ('bfs', 'ucs', 'astar', 'multi')
+LATENCY_WINDOW = 10000  # Latencies kept per algorithm for the percentile stats
+BATCH_WINDOW = 0.002  # Seconds the batcher collects UCS requests before answering them
+
+
+class SourceBatcher:
+    """
+    Coalesces concurrent shortest-path requests that share a source.
+
+    Requests are collected for ``window`` seconds and grouped by source. Each group runs
+    a single Dijkstra search that stops once every requested target is settled, and all
+    of the group's requests are answered from that one tree. Under bursty load with
+    popular sources this replaces many independent searches with a few.
+
+    Attributes:
+        engine (TravelEthiopia): The UCS engine whose graph is searched.
+        window (float): Collection window in seconds.
+        requests (int): Requests answered so far.
+        searches (int): Dijkstra searches run so far.
+    """
+
+    def __init__(self, engine, window=BATCH_WINDOW):
+        self.engine = engine
+        self.window = window
+        self.requests = 0
+        self.searches = 0
+        self._pending = {}  # Source node id -> [(target node id, future), ...]
+        self._flush_handle = None
+
+    async def find_path(self, start, goal):
+        """
+        Find the shortest path from start to goal, sharing the search with every other
+        request from the same start that arrives within the window.
+
+        Returns:
+            tuple: The shortest path and its cost, like ``TravelEthiopia.find_path``.
+        """
+        graph = self.engine.road_graph
+        if start not in graph or goal not in graph:
+            return self.engine.find_path(start, goal)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(graph.node(start), []).append((graph.node(goal), future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        """Answer every pending request with one search per source."""
+        pending, self._pending, self._flush_handle = self._pending, {}, None
+        graph = self.engine.road_graph
+        for source, waiting in pending.items():
+            search = DijkstraSearch(graph, source)
+            self.searches += 1
+            remaining = {target for target, _ in waiting}
+            while remaining:
+                target = search.settle_until(remaining)
+                if target is None:
+                    break  # The other targets are unreachable
+                remaining.discard(target)
+
+            for target, future in waiting:
+                self.requests += 1
+                if future.cancelled():
+                    continue
+                path = search.path(target)
+                if path is None:
+                    future.set_result((None, float('inf')))
+                else:
+                    future.set_result((graph.path_names(path), graph.cost(search.distances[target])))
+
+
+class RouteService:
+    """
+    Resident route-query service: the road data is compiled once and every request is
+    answered from the same engines, with a bounded LRU cache of results in front.
+
+    Requests and responses are JSON objects, one per line::
+
+        {"id": 1, "algorithm": "ucs", "start": "Addis Ababa", "goal": "Lalibela"}
+        {"id": 2, "algorithm": "multi", "start": "Addis Ababa", "goals": ["Axum", "Jimma"]}
+        {"id": 3, "op": "stats"}
+
+    Answers echo the ``id`` and carry ``path``, ``cost`` and whether they came from the
+    cache, or an ``error``. Concurrent UCS misses go through a SourceBatcher, so requests
+    sharing a start city within the batch window share one search. Point-to-point results are cached under
+    ``(algorithm, start, goal)``; when every road has a twin of the same weight in the
+    opposite direction, the pair is put in a fixed order so that (a, b) and (b, a) share
+    one entry, and the cached path is reversed for the other direction.
+
+    Attributes:
+        engine (TravelEthiopia): UCS engine, also used for multi-goal itineraries.
+        uninformed (traveling_ethiopia_ufs.TravelEthiopia): BFS agent, searching the engine's graph.
+        astar (AStarSearch): A* engine with landmark heuristics.
+        symmetric (bool): Whether results can be shared between the two directions.
+        cache_size (int): Maximum number of cached results.
+        batcher (SourceBatcher): Coalescer for UCS requests, None when batching is off.
+    """
+
+    def __init__(self, graph=None, cache_size=1024, batch_window=BATCH_WINDOW, road_graph=None):
+        """
+        Compile the road data and build every engine.
+
+        Args:
+            graph (dict, optional): Roads in the ``cities_road_ucs`` layout. Defaults to its sample data.
+            cache_size (int, optional): Maximum number of cached results. Defaults to 1024.
+            batch_window (float, optional): Seconds to collect UCS requests for one batch;
+                0 answers every request on its own. Defaults to BATCH_WINDOW.
+            road_graph (RoadGraph, optional): ``graph`` already compiled, for the UCS engine.
+                Defaults to compiling it.
+        """
+        if graph is None:
+            graph = cities_road_ucs.roads
+        self.engine = TravelEthiopia(graph, road_graph=road_graph)
+        self.uninformed = UninformedTravelEthiopia(list(self.engine.road_graph.names), graph, None, None,
+                                                   strategy="BFS")
+        # The agent treats every road as two-way; search the engine's graph so one-way roads stay one-way.
+        self.uninformed.road_graph = self.engine.road_graph
+        self.astar = AStarSearch(CityGraph({city: {'neighbors': neighbors} for city, neighbors in graph.items()}))
+        self.symmetric = self.engine.road_graph.is_symmetric()
+        self.batcher = SourceBatcher(self.engine, batch_window) if batch_window > 0 else None
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._latencies = {algorithm: deque(maxlen=LATENCY_WINDOW) for algorithm in ALGORITHMS}
+
+    @classmethod
+    def from_file(cls, path, cache_size=1024, batch_window=BATCH_WINDOW):
+        """
+        Build the service from a JSON road file, through the binary graph cache.
+
+        Args:
+            path (str): The JSON road file (see ``road_data.RoadData``).
+            cache_size (int, optional): Maximum number of cached results. Defaults to 1024.
+            batch_window (float, optional): Seconds to collect UCS requests for one batch. Defaults to BATCH_WINDOW.
+
+        Returns:
+            RouteService: The service.
+        """
+        road_graph = load_road_graph(path)
+        return cls(road_graph.adjacency(), cache_size, batch_window, road_graph)
+
+    def route(self, algorithm, start, goal=None, goals=None):
+        """
+        Answer one route query, from the cache when possible.
+
+        Args:
+            algorithm (str): One of ALGORITHMS.
+            start (str): The starting city.
+            goal (str, optional): The destination, for 'bfs', 'ucs' and 'astar'.
+            goals (list, optional): The cities to visit, for 'multi'.
+
+        Returns:
+            tuple: ``(path, cost, cached)``; the path is None when there is none.
+
+        Raises:
+            ValueError: If the algorithm is unknown or its arguments are missing.
+        """
+        key, flipped = self._key(algorithm, start, goal, goals)
+        began = time.perf_counter()
+        result = self._lookup(key)
+        cached = result is not None
+        if not cached:
+            result = self._store(key, self._compute(*key))
+        return self._answer(key, result, flipped, cached, began)
+
+    async def route_async(self, algorithm, start, goal=None, goals=None):
+        """
+        Like ``route``, but UCS cache misses wait for the batcher instead of searching alone.
+        """
+        key, flipped = self._key(algorithm, start, goal, goals)
+        began = time.perf_counter()
+        result = self._lookup(key)
+        cached = result is not None
+        if not cached:
+            if algorithm == 'ucs' and self.batcher is not None:
+                # Batch by the caller's own start city, then store in the key's direction
+                path, cost = await self.batcher.find_path(start, goal)
+                result = (path[::-1] if flipped and path is not None else path), cost
+            else:
+                result = self._compute(*key)
+            result = self._store(key, result)
+        return self._answer(key, result, flipped, cached, began)
+
+    def _key(self, algorithm, start, goal, goals):
+        """Return the cache key of a query and whether it is stored in the other direction."""
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; use one of {', '.join(ALGORITHMS)}.")
+        if algorithm == 'multi':
+            if not goals:
+                raise ValueError("'multi' needs a non-empty 'goals' list.")
+            return (algorithm, start, tuple(goals)), False
+        if goal is None:
+            raise ValueError(f"{algorithm!r} needs a 'goal'.")
+        flipped = self.symmetric and goal < start
+        return ((algorithm, goal, start) if flipped else (algorithm, start, goal)), flipped
+
+    def _lookup(self, key):
+        """Return the cached result for a key (marking it recently used), or None."""
+        result = self._cache.get(key)
+        if result is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._cache.move_to_end(key)
+        return result
+
+    def _store(self, key, result):
+        """Cache a result, evicting the least recently used one when full."""
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _answer(self, key, result, flipped, cached, began):
+        """Orient a result for the caller and record the query's latency."""
+        path, cost = result
+        if flipped and path is not None:
+            path = path[::-1]
+        self._latencies[key[0]].append((time.perf_counter() - began) * 1000)
+        return path, cost, cached
+
+    def _compute(self, algorithm, start, target):
+        """Run one engine; ``target`` is the goal, or the tuple of goals for 'multi'."""
+        engine = self.engine
+        if algorithm == 'ucs':
+            return engine.find_path(start, target)
+        if algorithm == 'multi':
+            return engine.find_path_to_multiple_goals(start, list(target))
+        if start not in engine.road_graph:
+            return None, float('inf')
+        if algorithm == 'bfs':
+            self.uninformed.initial_state, self.uninformed.goal_state = start, target
+            path = self.uninformed.search()
+        else:
+            path = self.astar.search(start, target)
+        return path, (self._path_cost(path) if path is not None else float('inf'))
+
+    def _path_cost(self, path):
+        """Sum the cheapest road between each pair of consecutive cities."""
+        graph = self.engine.road_graph
+        total = 0
+        for a, b in zip(path, path[1:]):
+            u, v = graph.node(a), graph.node(b)
+            total += min(weight for neighbor, weight, _ in graph.edges(u) if neighbor == v)
+        return graph.cost(total)
+
+    def stats(self):
+        """
+        Return cache and latency statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate, cache fill, and per-algorithm request count and
+            mean/p50/p95/max latency in ms over the last LATENCY_WINDOW requests.
+        """
+        requests = self._hits + self._misses
+        latency = {}
+        for algorithm, timings in self._latencies.items():
+            if not timings:
+                continue
+            ordered = sorted(timings)
+            latency[algorithm] = {
+                'requests': len(ordered),
+                'mean_ms': statistics.fmean(ordered),
+                'p50_ms': ordered[len(ordered) // 2],
+                'p95_ms': ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))],
+                'max_ms': ordered[-1],
+            }
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / requests if requests else 0.0,
+            'cached': len(self._cache),
+            'cache_size': self.cache_size,
+            'symmetric': self.symmetric,
+            'batched_requests': self.batcher.requests if self.batcher else 0,
+            'batched_searches': self.batcher.searches if self.batcher else 0,
+            'latency': latency,
+        }
+
+    async def handle(self, request):
+        """
+        Answer one decoded request.
+
+        Args:
+            request: The decoded request; anything but a JSON object gets an error response.
+
+        Returns:
+            dict: The response object.
+        """
+        if not isinstance(request, dict):
+            return {'id': None, 'error': f"TypeError: request must be a JSON object, not {type(request).__name__}"}
+        response = {'id': request.get('id')}
+        try:
+            if request.get('op') == 'stats':
+                response['stats'] = self.stats()
+                return response
+            path, cost, cached = await self.route_async(request.get('algorithm', 'ucs'), request['start'],
+                                                        request.get('goal'), request.get('goals'))
+        except (KeyError, TypeError, ValueError) as error:
+            response['error'] = f"{type(error).__name__}: {error}"
+            return response
+        response.update(path=path, cost=cost if path is not None else None, cached=cached)
+        return response
+
+    async def serve(self, reader, write):
+        """
+        Answer JSON-lines requests from a stream until it closes.
+
+        Every line is handled in its own task, so responses are written as they finish
+        and may come back out of order; match them by ``id``.
+
+        Args:
+            reader (asyncio.StreamReader): Source of request lines.
+            write (callable): Called with every encoded response line.
+        """
+        tasks = set()
+
+        async def respond(line):
+            request = None
+            try:
+                request = json.loads(line)
+                response = await self.handle(request)
+            except Exception as error:  # One bad request must still be answered and must not stop the stream
+                request_id = request.get('id') if isinstance(request, dict) else None
+                response = {'id': request_id, 'error': f"{type(error).__name__}: {error}"}
+            write((json.dumps(response) + '\n').encode('utf-8'))
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if line.strip():
+                task = asyncio.create_task(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+async def serve_stdio(service):
+    """Serve JSON-lines requests from stdin, writing responses to stdout."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    def write(data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    await service.serve(reader, write)
+
+
+async def serve_tcp(service, host, port):
+    """Serve JSON-lines requests on a local TCP socket, one stream per connection."""
+    async def connection(reader, writer):
+        await service.serve(reader, writer.write)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answer JSON-lines route queries over stdin/stdout or TCP.")
+    parser.add_argument('--cache-size', type=int, default=1024, help="maximum number of cached results")
+    parser.add_argument('--batch-window', type=float, default=BATCH_WINDOW * 1000,
+                        help="milliseconds to coalesce UCS requests by source (0 disables)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="serve on this TCP port instead of stdin/stdout")
+    parser.add_argument('--roads', help="JSON road file to serve instead of the sample UCS roads")
+    args = parser.parse_args()
+
+    if args.roads is None:
+        route_service = RouteService(cache_size=args.cache_size, batch_window=args.batch_window / 1000)
+    else:
+        route_service = RouteService.from_file(args.roads, args.cache_size, args.batch_window / 1000)
+    if args.port is None:
+        asyncio.run(serve_stdio(route_service))
+    else:
+        asyncio.run(serve_tcp(route_service, args.host, args.port))
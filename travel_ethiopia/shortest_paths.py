@@ -0,0 +1,433 @@
+from array import array
+from heapq import heappop, heappush, nsmallest
+from time import perf_counter
+
+from .road_graph import SearchTree
+
+
+class DijkstraSearch:
+    """
+    A resumable Dijkstra (uniform cost) search from a single source over a RoadGraph.
+
+    The frontier is a plain ``heapq`` list of ``(cost, tiebreak, node)`` entries, so no
+    lock is taken and equal costs never fall back to comparing paths. Improved labels are
+    pushed again and outdated entries are skipped when popped (lazy deletion). Distances
+    and predecessors live in flat per-node arrays; paths are rebuilt from the predecessors.
+
+    The search can be stopped when a target is settled and resumed later, so several
+    queries from the same source share one expansion.
+
+    Attributes:
+        graph (RoadGraph): The graph being searched.
+        source (int): Node id of the source.
+        distances (array): Best known distance of every node, ``inf`` when not labelled yet.
+        parents (array): Predecessor of every node on its best known path, -1 if none.
+        settled (bytearray): 1 for every node whose distance is final.
+    """
+
+    def __init__(self, graph, source):
+        """
+        Initialize the search with only the source on the frontier.
+
+        Args:
+            graph (RoadGraph): The graph to search.
+            source (int): Node id of the source.
+        """
+        n = len(graph)
+        self.graph = graph
+        self.source = source
+        self.distances = array('d', [float('inf')]) * n
+        self.parents = array('q', [-1]) * n
+        self.settled = bytearray(n)
+        self.distances[source] = 0.0
+        self._heap = [(0.0, 0, source)]
+        self._pushes = 1
+
+    @property
+    def exhausted(self):
+        """bool: True once every node reachable from the source has been settled."""
+        return not self._heap
+
+    def settle_until(self, targets=None, stats=None):
+        """
+        Settle nodes in order of distance until one of ``targets`` is settled.
+
+        Args:
+            targets (container, optional): Node ids to stop at. Defaults to running the
+                search to exhaustion.
+            stats (SearchStats, optional): Receives the work done by this call. Defaults to None.
+
+        Returns:
+            int or None: The target that was settled, or None if the frontier ran out first.
+        """
+        graph = self.graph
+        offsets, edge_targets, weights = graph.offsets, graph.targets, graph.weights
+        distances, parents, settled = self.distances, self.parents, self.settled
+        heap = self._heap
+        pushes = self._pushes
+        found = None
+        on_expand = on_push = None
+        if stats is not None:
+            began = perf_counter()
+            on_expand, on_push = stats.on_expand, stats.on_push
+
+        while heap:
+            if stats is not None and len(heap) > stats.frontier_peak:
+                stats.frontier_peak = len(heap)
+            cost, _, node = heappop(heap)
+            if settled[node]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue  # Stale entry, the node was settled through a cheaper one
+            settled[node] = 1
+            if stats is not None:
+                stats.nodes_expanded += 1
+                stats.edges_relaxed += offsets[node + 1] - offsets[node]
+                if on_expand is not None:
+                    on_expand(node)
+
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = edge_targets[edge]
+                if settled[neighbor]:
+                    continue
+                new_cost = cost + weights[edge]
+                if new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parents[neighbor] = node
+                    heappush(heap, (new_cost, pushes, neighbor))
+                    pushes += 1
+                    if on_push is not None:
+                        on_push(neighbor, new_cost)
+
+            if targets is not None and node in targets:
+                found = node
+                break
+
+        if stats is not None:
+            stats.heap_pushes += pushes - self._pushes
+            stats.elapsed += perf_counter() - began
+        self._pushes = pushes
+        return found
+
+    def distance(self, node, stats=None):
+        """
+        Return the shortest distance to a node, searching further if it is not settled yet.
+
+        Args:
+            node (int): Node id.
+            stats (SearchStats, optional): Receives the work of any further search. Defaults to None.
+
+        Returns:
+            float: The distance, or ``inf`` if the node is unreachable.
+        """
+        if not self.settled[node]:
+            self.settle_until((node,), stats)
+        return self.distances[node]
+
+    def path(self, node):
+        """
+        Return the shortest path to a node, searching further if it is not settled yet.
+
+        Returns:
+            list or None: Node ids from the source to ``node``, or None if it is unreachable.
+        """
+        if self.distance(node) == float('inf'):
+            return None
+        parents = self.parents
+        path = [node]
+        while node != self.source:
+            node = parents[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    def tree(self):
+        """
+        Run the search to exhaustion and return the full shortest-path tree.
+
+        Returns:
+            SearchTree: Distances and predecessors of every node reachable from the source.
+        """
+        self.settle_until()
+        return SearchTree(self.graph, self.source, self.distances, self.parents)
+
+
+def bidirectional_dijkstra(graph, reverse, source, target, stats=None):
+    """
+    Shortest path by growing Dijkstra frontiers from both ends until they meet.
+
+    The forward search runs on ``graph`` from the source and the backward search on
+    ``reverse`` from the target. Every edge that reaches a node labelled by the other side
+    proposes a meeting point; the search stops once the two smallest frontier keys add
+    up to at least the best meeting cost ``mu``, since no undiscovered path can be shorter.
+    The side with the smaller frontier key is expanded next.
+
+    Args:
+        graph (RoadGraph): The graph.
+        reverse (RoadGraph): The same graph with every edge turned around.
+        source (int): Node id of the source.
+        target (int): Node id of the target.
+        stats (SearchStats, optional): Receives the work done by both sides. Defaults to None.
+
+    Returns:
+        tuple: The path as node ids and its cost, or ``(None, inf)`` if there is no path.
+    """
+    if source == target:
+        return [source], 0.0
+    on_expand = on_push = None
+    if stats is not None:
+        began = perf_counter()
+        on_expand, on_push = stats.on_expand, stats.on_push
+
+    inf = float('inf')
+    n = len(graph)
+    distances = (array('d', [inf]) * n, array('d', [inf]) * n)
+    parents = (array('q', [-1]) * n, array('q', [-1]) * n)
+    settled = (bytearray(n), bytearray(n))
+    heaps = ([(0.0, 0, source)], [(0.0, 0, target)])
+    graphs = (graph, reverse)
+    distances[0][source] = 0.0
+    distances[1][target] = 0.0
+    pushes = 1
+    best, meeting = inf, None  # meeting is the (side, node, neighbor) edge joining both trees
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        heap, dist, parent, done = heaps[side], distances[side], parents[side], settled[side]
+        other_dist = distances[1 - side]
+
+        if stats is not None and len(heaps[0]) + len(heaps[1]) > stats.frontier_peak:
+            stats.frontier_peak = len(heaps[0]) + len(heaps[1])
+        cost, _, node = heappop(heap)
+        if done[node]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        done[node] = 1
+
+        current = graphs[side]
+        offsets, targets, weights = current.offsets, current.targets, current.weights
+        if stats is not None:
+            stats.nodes_expanded += 1
+            stats.edges_relaxed += offsets[node + 1] - offsets[node]
+            if on_expand is not None:
+                on_expand(node)
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < dist[neighbor] and not done[neighbor]:
+                dist[neighbor] = new_cost
+                parent[neighbor] = node
+                heappush(heap, (new_cost, pushes, neighbor))
+                pushes += 1
+                if on_push is not None:
+                    on_push(neighbor, new_cost)
+            through = new_cost + other_dist[neighbor]
+            if through < best:
+                best, meeting = through, (side, node, neighbor)
+
+    if stats is not None:
+        stats.heap_pushes += pushes - 1
+        stats.elapsed += perf_counter() - began
+    if meeting is None:
+        return None, inf
+
+    side, node, neighbor = meeting
+    forward_end, backward_start = (node, neighbor) if side == 0 else (neighbor, node)
+    path = []
+    node = forward_end
+    while node >= 0:
+        path.append(node)
+        node = parents[0][node]
+    path.reverse()
+    node = backward_start
+    while node >= 0:
+        path.append(node)
+        node = parents[1][node]
+    return path, best
+
+
+def distance_table(graph, sources, targets, paths=False):
+    """
+    Shortest distances from every source to every target, with one truncated Dijkstra
+    per source that stops as soon as all targets are settled.
+
+    Args:
+        graph (RoadGraph): The graph.
+        sources (list): Node ids of the sources (rows).
+        targets (list): Node ids of the targets (columns).
+        paths (bool, optional): Whether to rebuild the paths as well. Defaults to False.
+
+    Returns:
+        tuple: ``(table, routes)``: a ``(len(sources), len(targets))`` NumPy matrix with
+        ``inf`` where a target is unreachable, and per source a list of node-id paths
+        (None where unreachable), or None when ``paths`` is not set.
+    """
+    import numpy as np
+
+    table = np.full((len(sources), len(targets)), np.inf)
+    routes = [] if paths else None
+    wanted = set(targets)
+    for row, source in enumerate(sources):
+        search = DijkstraSearch(graph, source)
+        remaining = set(wanted)
+        while remaining:
+            target = search.settle_until(remaining)
+            if target is None:
+                break  # The other targets are unreachable
+            remaining.discard(target)
+        table[row] = [search.distances[target] for target in targets]
+        if paths:
+            routes.append([search.path(target) for target in targets])
+    return table, routes
+
+
+def k_shortest_paths(graph, source, target, k, reverse_tree=None):
+    """
+    The k shortest loopless paths from source to target, with Yen's algorithm.
+
+    Every spur search is an A* search guided by the target's shortest-path tree on the
+    reversed graph. Its distances stay admissible when root nodes and edges are removed,
+    and a spur search stops as soon as it pops a city whose tree path to the target avoids
+    them, since that path completes the search. The edges to ban at a root are kept per
+    root prefix, and, following Lawler, a path only spurs from the node where it
+    deviated from its parent, since the roots before it were already spurred with the same
+    bans.
+
+    Args:
+        graph (RoadGraph): The graph.
+        source (int): Node id of the source.
+        target (int): Node id of the target.
+        k (int): How many paths to find.
+        reverse_tree (SearchTree, optional): Shortest-path tree of ``target`` on the reversed
+            graph. Defaults to computing it.
+
+    Returns:
+        list: Up to k ``(path, cost)`` tuples in order of cost, with paths as node ids.
+    """
+    if k <= 0:
+        return []
+    if reverse_tree is None:
+        reverse_tree = DijkstraSearch(graph.reversed(), target).tree()
+    to_target, next_hop = reverse_tree.distances, reverse_tree.parents
+    if to_target[source] == float('inf'):
+        return []
+
+    path = [source]
+    while path[-1] != target:
+        path.append(next_hop[path[-1]])
+    found = [(path, to_target[source], 0)]  # (path, cost, index where it left its parent)
+    branches = {}   # root prefix -> next nodes taken after it by found paths
+    seen = {tuple(path)}
+    candidates = []
+    pushes = 0
+
+    while len(found) < k:
+        path, cost, deviation = found[-1]
+        for i in range(len(path) - 1):
+            branches.setdefault(tuple(path[:i + 1]), set()).add(path[i + 1])
+
+        # Only the cheapest k - len(found) candidates can still be returned, so a spur whose
+        # lower bound is no better than the current cut-off needs no search.
+        needed = k - len(found)
+        cutoff = nsmallest(needed, candidates)[-1][0] if len(candidates) >= needed else float('inf')
+        root_cost = 0.0
+        for i in range(len(path) - 1):
+            removed, banned = set(path[:i]), branches[tuple(path[:i + 1])]
+            if i >= deviation and root_cost + _spur_bound(graph, path[i], removed, banned, to_target) < cutoff:
+                spur_path, spur_cost = _spur_search(graph, path[i], target, removed, banned, to_target, next_hop)
+                if spur_path is not None:
+                    candidate = path[:i] + spur_path
+                    key = tuple(candidate)
+                    if key not in seen:
+                        seen.add(key)
+                        heappush(candidates, (root_cost + spur_cost, pushes, candidate, i))
+                        pushes += 1
+            root_cost += _edge_weight(graph, path[i], path[i + 1])
+
+        if not candidates:
+            break
+        cost, _, path, deviation = heappop(candidates)
+        found.append((path, cost, deviation))
+
+    return [(path, cost) for path, cost, _ in found]
+
+
+def _edge_weight(graph, source, target):
+    """Return the weight of the cheapest edge between two node ids."""
+    return min(graph.weights[edge] for edge in range(graph.offsets[source], graph.offsets[source + 1])
+               if graph.targets[edge] == target)
+
+
+def _spur_bound(graph, spur, removed, banned, to_target):
+    """Return a lower bound on the spur path cost: its best first edge plus the remaining tree distance."""
+    bound = float('inf')
+    for edge in range(graph.offsets[spur], graph.offsets[spur + 1]):
+        neighbor = graph.targets[edge]
+        if neighbor not in removed and neighbor not in banned:
+            bound = min(bound, graph.weights[edge] + to_target[neighbor])
+    return bound
+
+
+def _spur_search(graph, spur, target, removed, banned, to_target, next_hop):
+    """
+    A* from the spur node to the target that avoids the ``removed`` root nodes and the
+    spur's edges towards the ``banned`` nodes, with the reverse-tree distances as heuristic.
+
+    Returns:
+        tuple: The spur path as node ids and its cost, or ``(None, inf)``.
+    """
+    inf = float('inf')
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    clear = {target: True}  # Whether a city's tree path reaches the target avoiding the root
+
+    def tree_clear(node):
+        trail = []
+        while node not in clear:
+            if node in removed or node == spur:
+                clear[node] = False
+                break
+            trail.append(node)
+            node = next_hop[node]
+        result = clear[node]
+        for visited in trail:
+            clear[visited] = result
+        return result
+
+    costs = {spur: 0.0}
+    parents = {spur: -1}
+    closed = set()
+    heap = [(to_target[spur], 0, spur)]
+    pushes = 1
+    while heap:
+        _, _, node = heappop(heap)
+        if node in closed:
+            continue
+        closed.add(node)
+        cost = costs[node]
+
+        hop = next_hop[node]
+        if node == target or ((node != spur or hop not in banned) and tree_clear(hop)):
+            path = []
+            step = node
+            while step >= 0:
+                path.append(step)
+                step = parents[step]
+            path.reverse()
+            while path[-1] != target:
+                path.append(next_hop[path[-1]])
+            return path, cost + to_target[node]
+
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[edge]
+            if neighbor in removed or (node == spur and neighbor in banned) or to_target[neighbor] == inf:
+                continue
+            new_cost = cost + weights[edge]
+            if new_cost < costs.get(neighbor, inf):
+                costs[neighbor] = new_cost
+                parents[neighbor] = node
+                heappush(heap, (new_cost + to_target[neighbor], pushes, neighbor))
+                pushes += 1
+    return None, inf
@@ -0,0 +1,56 @@
+class SearchStats:
+    """
+    Counters describing the work done by one or more searches.
+
+    Pass a SearchStats as ``stats=`` to any search (BFS/DFS, UCS, A*, minimax) and the
+    search adds its work to it; counters accumulate, so one object can total a batch of
+    queries. Searches called without ``stats`` only pay a test for None per expanded node
+    and per frontier insertion.
+
+    ``on_expand(node)`` is called with the node id of every expanded node, and
+    ``on_push(node, priority)`` for every frontier insertion (the priority is the cost or
+    f-value for heap searches, the level for BFS and the stack size for DFS; minimax only
+    calls ``on_expand``), so hot spots can be traced in production without a profiler.
+
+    Attributes:
+        nodes_expanded (int): Nodes whose outgoing roads were examined.
+        edges_relaxed (int): Roads examined from expanded nodes.
+        heap_pushes (int): Frontier insertions (heap pushes, or queue/stack appends).
+        stale_pops (int): Frontier entries skipped because the node was already settled
+            or improved since they were pushed.
+        frontier_peak (int): Largest frontier size seen.
+        pruned (int): Moves cut off without being searched (alpha-beta cutoffs).
+        elapsed (float): Wall time spent in the searches, in seconds.
+        on_expand (callable): Called as ``on_expand(node)``, or None.
+        on_push (callable): Called as ``on_push(node, priority)``, or None.
+    """
+
+    FIELDS = ('nodes_expanded', 'edges_relaxed', 'heap_pushes', 'stale_pops', 'frontier_peak', 'pruned', 'elapsed')
+
+    __slots__ = FIELDS + ('on_expand', 'on_push')
+
+    def __init__(self, on_expand=None, on_push=None):
+        """
+        Initialize the SearchStats with every counter at zero.
+
+        Args:
+            on_expand (callable, optional): Hook called for every expanded node. Defaults to None.
+            on_push (callable, optional): Hook called for every frontier insertion. Defaults to None.
+        """
+        self.nodes_expanded = 0
+        self.edges_relaxed = 0
+        self.heap_pushes = 0
+        self.stale_pops = 0
+        self.frontier_peak = 0
+        self.pruned = 0
+        self.elapsed = 0.0
+        self.on_expand = on_expand
+        self.on_push = on_push
+
+    def as_dict(self):
+        """Return the counters as a plain dictionary."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        counters = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.FIELDS)
+        return f'SearchStats({counters})'
@@ -0,0 +1,226 @@
+import heapq
+import time
+
+from . import cities_road_ifs
+from .landmarks import LandmarkHeuristic
+from .road_graph import RoadGraph
+from .shortest_paths import distance_table
+from .visualization import cached_layout
+
+
+class CityGraph:
+    def __init__(self, roads_data, landmark_count=4):
+        self.roads_data = roads_data
+        self.road_graph = RoadGraph.from_roads(roads_data)
+        self.landmark_count = landmark_count
+        self._graph = None
+        self._landmarks = None
+
+    @property
+    def graph(self):
+        """NetworkX copy of the roads, built on first use (only the visualizer needs it)."""
+        if self._graph is None:
+            self._graph = self._create_graph()
+        return self._graph
+
+    def _create_graph(self):
+        """Creates a NetworkX graph from the roads data."""
+        import networkx as nx
+
+        G = nx.Graph()
+        for city, data in self.roads_data.items():
+            for neighbor, distance in data['neighbors']:
+                G.add_edge(city, neighbor, weight=distance)
+        return G
+
+    def get_neighbors(self, city):
+        """Returns the neighbors of a given city."""
+        graph = self.road_graph
+        return [(graph.names[neighbor], graph.cost(weight))
+                for neighbor, weight, _ in graph.edges(graph.node(city))]
+
+    @property
+    def landmarks(self):
+        """Landmark distance tables, built on first use."""
+        if self._landmarks is None:
+            self._landmarks = LandmarkHeuristic(self.road_graph, self.landmark_count)
+        return self._landmarks
+
+    def get_heuristic(self, city, goal=None):
+        """
+        Returns the heuristic for a city.
+
+        With a goal, this is the landmark lower bound on the distance to that goal, which
+        is admissible for any destination. Without one, it is the stored per-city 'cost'
+        (straight-line distance), which only holds for the destination it was measured to.
+        """
+        graph = self.road_graph
+        if goal is None:
+            return graph.attribute('cost', graph.node(city))
+        return self.landmarks.bound(graph.node(city), graph.node(goal))
+
+
+class AStarSearch:
+    def __init__(self, graph, heuristic='landmarks'):
+        """
+        'landmarks' bounds distances to any goal with the graph's landmark tables;
+        'cost' uses the per-city 'cost' field, which is only valid for its own destination.
+        """
+        if heuristic not in ('landmarks', 'cost'):
+            raise ValueError("Invalid heuristic! Use 'landmarks' or 'cost'.")
+        self.graph = graph
+        self.heuristic = heuristic
+
+    def search(self, start, goal, epsilon=1.0, return_expansions=False, stats=None):
+        """
+        Performs A* search to find the optimal path from start to goal.
+
+        Expanded cities go into a closed set, and heap entries that are outdated by a
+        cheaper path or point at a closed city are skipped when popped (lazy deletion).
+        Ties on f are broken towards the larger g, i.e. the entry closer to the goal.
+        With epsilon > 1 this is weighted A* (f = g + epsilon * h): it expands fewer cities
+        and returns a path at most epsilon times longer than optimal.
+
+        Returns the path, or (path, expansions) when return_expansions is set. A SearchStats
+        passed as stats receives the work done and drives its on_expand/on_push hooks.
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1.")
+        graph = self.graph.road_graph
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        start, goal = graph.node(start), graph.index.get(goal)
+        if goal is None:
+            return (None, 0) if return_expansions else None
+        if self.heuristic == 'landmarks':
+            heuristic = self.graph.landmarks.heuristic(goal)
+        else:
+            heuristic = graph.attributes['cost'].__getitem__
+
+        # Entries are (f, -g, tiebreak, city): equal f pops the larger g first.
+        open_set = []
+        heapq.heappush(open_set, (epsilon * heuristic(start), 0, 0, start))
+        pushes = 1
+
+        g_costs = {start: 0}
+        came_from = {}
+        closed = bytearray(len(graph))
+        expansions = 0
+        path = None
+        on_expand = on_push = None
+        if stats is not None:
+            began = time.perf_counter()
+            on_expand, on_push = stats.on_expand, stats.on_push
+
+        while open_set:
+            if stats is not None and len(open_set) > stats.frontier_peak:
+                stats.frontier_peak = len(open_set)
+            _, negative_g, _, current_city = heapq.heappop(open_set)
+            if closed[current_city] or -negative_g > g_costs[current_city]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue  # Stale entry
+            closed[current_city] = 1
+
+            if current_city == goal:
+                path = graph.path_names(self._reconstruct_path(came_from, current_city))
+                break
+            expansions += 1
+            if stats is not None:
+                stats.edges_relaxed += offsets[current_city + 1] - offsets[current_city]
+                if on_expand is not None:
+                    on_expand(current_city)
+
+            current_g = g_costs[current_city]
+            for edge in range(offsets[current_city], offsets[current_city + 1]):
+                neighbor = targets[edge]
+                if closed[neighbor]:
+                    continue
+                tentative_g_cost = current_g + weights[edge]
+
+                if neighbor not in g_costs or tentative_g_cost < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g_cost
+                    f_cost = tentative_g_cost + epsilon * heuristic(neighbor)
+                    heapq.heappush(open_set, (f_cost, -tentative_g_cost, pushes, neighbor))
+                    pushes += 1
+                    came_from[neighbor] = current_city
+                    if on_push is not None:
+                        on_push(neighbor, f_cost)
+
+        if stats is not None:
+            stats.nodes_expanded += expansions
+            stats.heap_pushes += pushes - 1
+            stats.elapsed += time.perf_counter() - began
+        return (path, expansions) if return_expansions else path
+
+    def distance_table(self, sources, targets, paths=False):
+        """
+        Returns the matrix of shortest distances from every source to every target.
+
+        A* targets one goal at a time, so this runs one Dijkstra per source instead, cut
+        off once all targets are settled. With paths, also returns the rows of paths.
+        """
+        graph = self.graph.road_graph
+        table, routes = distance_table(graph, [graph.node(city) for city in sources],
+                                       [graph.node(city) for city in targets], paths)
+        if not paths:
+            return table
+        return table, [[graph.path_names(path) if path is not None else None for path in row] for row in routes]
+
+    def _reconstruct_path(self, came_from, current):
+        """Reconstructs the optimal path from the 'came_from' data."""
+        path = []
+        while current in came_from:
+            path.append(current)
+            current = came_from[current]
+        path.append(current)
+        path.reverse()
+        return path
+
+
+class AStarVisualizer:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def visualize(self, path):
+        """Visualizes the graph and highlights the found path."""
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        pos = cached_layout(self.graph.road_graph)
+        plt.figure(figsize=(15, 10))
+
+        nx.draw(self.graph.graph, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=500, font_size=10)
+
+        path_edges = [(path[i], path[i + 1]) for i in range(len(path) - 1)]
+        nx.draw_networkx_edges(self.graph.graph, pos, edgelist=path_edges, edge_color='red', width=2)
+        nx.draw_networkx_nodes(self.graph.graph, pos, nodelist=path, node_color='orange')
+
+        edge_labels = nx.get_edge_attributes(self.graph.graph, 'weight')
+        nx.draw_networkx_edge_labels(self.graph.graph, pos, edge_labels=edge_labels)
+
+        plt.title("A* Search Path Visualization", fontsize=15)
+        plt.show()
+
+
+def __getattr__(name):
+    # The sample data used to be imported eagerly here; it is now forwarded on first use.
+    if name == 'roads':
+        return getattr(cities_road_ifs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == '__main__':
+    city_graph = CityGraph(cities_road_ifs.roads)
+    searcher = AStarSearch(city_graph)
+    visualizer = AStarVisualizer(city_graph)
+
+    start_city = 'Addis Ababa'
+    goal_city = 'Moyale'
+
+    path = searcher.search(start_city, goal_city)
+
+    if path:
+        print(f"Optimal path from {start_city} to {goal_city}: {' -> '.join(path)}")
+        visualizer.visualize(path)
+    else:
+        print(f"No path found from {start_city} to {goal_city}.")
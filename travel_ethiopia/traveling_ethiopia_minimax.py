@@ -0,0 +1,588 @@
+import random
+import time
+from array import array
+
+from .cities_road_minimax import roads
+from .retrograde import RetrogradeSolver
+from .road_graph import RoadGraph
+from .visualization import cached_layout
+
+EXACT, LOWER, UPPER = 0, 1, 2  # Transposition-table bound flags
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget of iterative deepening runs out."""
+
+
+class TravelEthiopia:
+    """
+    A class implementing the MiniMax search algorithm for decision-making in a graph-based environment.
+    Cycles are handled differently by each method:
+    - minimax and find_best_move (alphabeta, also behind find_best_move_parallel) score a move
+      back onto the current path as 0. They recurse once per ply, so very deep graphs can hit
+      the recursion limit.
+    - minimax_iterative and find_best_move_iterative run on an explicit stack: moving onto the
+      current path is not a legal move, and a node left without legal moves scores its utility.
+    - solve (retrograde analysis) keeps no path, so a game that cycles forever scores the draw
+      value; afterwards every start node is a table lookup.
+    find_best_move adds pruning, a transposition table and optional iterative deepening.
+
+    Attributes:
+        graph (dict): The graph representation of the environment, where nodes have utilities, neighbors, and terminal status.
+        road_graph (RoadGraph): The compiled, integer-indexed graph the search runs on.
+    """
+
+    def __init__(self, graph, road_graph=None):
+        """
+        Initialize the TravelEthiopia object with a graph.
+
+        Args:
+            graph (dict): A dictionary representing the graph.
+            road_graph (RoadGraph, optional): An already compiled copy of the graph. Defaults to compiling ``graph``.
+        """
+        self.graph = graph
+        self.road_graph = road_graph if road_graph is not None else RoadGraph.from_roads(graph)
+        self._moves = None
+        self._moves_ascending = None
+        self._zobrist = None
+        self.solution = None
+
+    def minimax(self, node, depth, maximizing_player, visited):
+        """
+        Perform the MiniMax search algorithm with cycle detection.
+
+        Args:
+            node (str): The current node being evaluated.
+            depth (int): The current depth in the search tree.
+            maximizing_player (bool): True if the current player is maximizing, False if minimizing.
+            visited (set): A set of visited nodes to avoid cycles.
+
+        Returns:
+            int: The utility value of the node.
+        """
+        graph = self.road_graph
+        return self._minimax(graph.node(node), depth, maximizing_player, {graph.node(city) for city in visited})
+
+    def _minimax(self, node, depth, maximizing_player, visited):
+        """
+        MiniMax over node ids of the compiled graph; see ``minimax``.
+        """
+        if node in visited:
+            return 0  # Avoid cycles by returning a neutral value
+
+        graph = self.road_graph
+
+        # If the node is terminal, return its utility
+        if graph.attributes['terminal'][node]:
+            return graph.attributes['utility'][node]
+
+        visited.add(node)
+        offsets, targets, blocked = graph.offsets, graph.targets, graph.blocked
+
+        # Maximizing player's turn
+        if maximizing_player:
+            max_eval = float('-inf')
+            for edge in range(offsets[node], offsets[node + 1]):
+                if not blocked[edge]:
+                    eval = self._minimax(targets[edge], depth + 1, False, visited)
+                    max_eval = max(max_eval, eval)
+            visited.remove(node)
+            return max_eval
+
+        # Minimizing player's turn
+        else:
+            min_eval = float('inf')
+            for edge in range(offsets[node], offsets[node + 1]):
+                if not blocked[edge]:
+                    eval = self._minimax(targets[edge], depth + 1, True, visited)
+                    min_eval = min(min_eval, eval)
+            visited.remove(node)
+            return min_eval
+
+    def _prepare(self):
+        """
+        Build the per-node move lists (unblocked neighbors, sorted by static utility from
+        high to low) and the random Zobrist keys used to fingerprint visited sets.
+        """
+        graph = self.road_graph
+        offsets, targets, blocked = graph.offsets, graph.targets, graph.blocked
+        utility = graph.attributes['utility']
+        self._moves = [
+            sorted((targets[edge] for edge in range(offsets[node], offsets[node + 1]) if not blocked[edge]),
+                   key=lambda child: -utility[child])
+            for node in range(len(graph))
+        ]
+        self._moves_ascending = [moves[::-1] for moves in self._moves]
+        rng = random.Random(len(graph))
+        self._zobrist = array('Q', (rng.getrandbits(64) for _ in range(len(graph))))
+
+    def alphabeta(self, node, depth_left, maximizing_player, alpha, beta, on_path, path_key, table,
+                  deadline=None, stats=None):
+        """
+        MiniMax with alpha-beta pruning and a transposition table, over node ids.
+
+        Values follow ``minimax`` exactly (a node already on the path scores 0). Moves are
+        tried in order of static utility, best first for the side to move, after the best
+        move a previous visit stored for the position. Results are stored in ``table``
+        under (node, side to move, Zobrist fingerprint of the visited set) together with
+        the remaining depth, whether they are exact or a bound, and the best move. A value
+        is only reused when it was searched at least as deep as ``depth_left``; the best
+        move is used for ordering at any depth, so a table shared by iterative-deepening
+        rounds orders each round by the previous one. When ``depth_left`` reaches 0, a
+        non-terminal node scores its static utility.
+
+        Args:
+            node (int): The current node.
+            depth_left (float): Plies left to search (``inf`` for no limit).
+            maximizing_player (bool): True if the maximizing player moves at ``node``.
+            alpha (float): Best value the maximizing player is already assured of.
+            beta (float): Best value the minimizing player is already assured of.
+            on_path (bytearray): 1 for every node on the current path.
+            path_key (int): Zobrist fingerprint of the current path.
+            table (dict): The transposition table.
+            deadline (float, optional): ``time.perf_counter()`` value to stop at.
+            stats (SearchStats, optional): Receives the nodes expanded and branches pruned.
+
+        Returns:
+            float: The value of the node (a bound when it falls outside (alpha, beta)).
+
+        Raises:
+            SearchTimeout: If the deadline passes.
+        """
+        if on_path[node]:
+            return 0  # Avoid cycles by returning a neutral value
+
+        attributes = self.road_graph.attributes
+        if attributes['terminal'][node] or depth_left <= 0:
+            return attributes['utility'][node]
+        if deadline is not None and time.perf_counter() > deadline:
+            raise SearchTimeout
+
+        key = (node, maximizing_player, path_key)
+        moves = self._moves[node] if maximizing_player else self._moves_ascending[node]
+        entry = table.get(key)
+        if entry is not None:
+            searched_depth, value, flag, hash_move = entry
+            if searched_depth >= depth_left and (flag == EXACT or (flag == LOWER and value >= beta)
+                                                 or (flag == UPPER and value <= alpha)):
+                return value
+            if hash_move >= 0 and hash_move != moves[0]:
+                moves = [hash_move] + [child for child in moves if child != hash_move]
+
+        original_alpha, original_beta = alpha, beta
+        on_path[node] = 1
+        child_key = path_key ^ self._zobrist[node]
+        best_child = moves[0] if moves else -1
+        searched = 0
+        if stats is not None:
+            stats.nodes_expanded += 1
+            if stats.on_expand is not None:
+                stats.on_expand(node)
+        try:
+            if maximizing_player:
+                value = float('-inf')
+                for child in moves:
+                    searched += 1
+                    score = self.alphabeta(child, depth_left - 1, False, alpha, beta,
+                                           on_path, child_key, table, deadline, stats)
+                    if score > value:
+                        value, best_child = score, child
+                    alpha = max(alpha, value)
+                    if alpha >= beta:
+                        break
+            else:
+                value = float('inf')
+                for child in moves:
+                    searched += 1
+                    score = self.alphabeta(child, depth_left - 1, True, alpha, beta,
+                                           on_path, child_key, table, deadline, stats)
+                    if score < value:
+                        value, best_child = score, child
+                    beta = min(beta, value)
+                    if alpha >= beta:
+                        break
+        finally:
+            on_path[node] = 0
+        if stats is not None:
+            stats.edges_relaxed += searched
+            stats.pruned += len(moves) - searched
+
+        flag = UPPER if value <= original_alpha else LOWER if value >= original_beta else EXACT
+        table[key] = (depth_left, value, flag, best_child)
+        return value
+
+    def find_best_move(self, start_node, depth_limit=None, time_budget=None, stats=None):
+        """
+        Find the best move for the maximizing player from the start node.
+
+        Uses alpha-beta pruning with a transposition table. Without limits the result is
+        the exact MiniMax value. With ``depth_limit`` and/or ``time_budget`` the search runs
+        by iterative deepening, one ply deeper each round. The rounds share one transposition
+        table, so each round tries the best moves of the previous one first (the root's
+        included) and reuses its values wherever they were searched deep enough. The result
+        is that of the deepest round that finished in time; when not even the first round
+        finishes, the legal move with the best static utility is returned with that utility.
+
+        Args:
+            start_node (str): The starting node.
+            depth_limit (int, optional): Plies to search, counting the root move. Defaults to no limit.
+            time_budget (float, optional): Seconds to search for. Defaults to no limit.
+            stats (SearchStats, optional): Receives the work done by every round. Defaults to None.
+
+        Returns:
+            tuple: The best move and its utility value.
+        """
+        if stats is not None:
+            began = time.perf_counter()
+        if self._moves is None:
+            self._prepare()
+        graph = self.road_graph
+        start = graph.node(start_node)
+        moves = [child for child, _, is_blocked in graph.edges(start) if not is_blocked]
+
+        if depth_limit is None and time_budget is None:
+            best_move, best_value = self._best_root_move(moves, float('inf'), {}, None, stats)
+            if stats is not None:
+                stats.elapsed += time.perf_counter() - began
+            return best_move, best_value
+
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        best_move, best_value = None, float('-inf')
+        if moves:
+            utility = graph.attributes['utility']
+            fallback = max(moves, key=lambda child: utility[child])
+            best_move, best_value = graph.names[fallback], utility[fallback]
+        table = {}
+        depth = 1
+        while depth_limit is None or depth <= depth_limit:
+            try:
+                best_move, best_value = self._best_root_move(moves, depth, table, deadline, stats)
+            except SearchTimeout:
+                break
+            if best_move is not None:
+                best = graph.node(best_move)
+                moves = [best] + [child for child in moves if child != best]
+            depth += 1
+            if depth > len(graph) + 1:
+                break  # Deeper rounds cannot change anything on a path-limited graph
+        if stats is not None:
+            stats.elapsed += time.perf_counter() - began
+        return best_move, best_value
+
+    def minimax_iterative(self, node, maximizing_player, alpha=float('-inf'), beta=float('inf'), on_path=None):
+        """
+        MiniMax with alpha-beta pruning on an explicit stack instead of recursion.
+
+        Each frame on the stack is a small list (node, side, alpha, beta, value, next move),
+        so graphs thousands of plies deep run without raising the recursion limit and
+        without a Python call per node.
+
+        Cycles follow a different rule than ``minimax``: moving to a node already on the
+        current path is not a legal move, instead of scoring 0, and a non-terminal node
+        without legal moves scores its static utility.
+
+        Args:
+            node (int): The node id to evaluate.
+            maximizing_player (bool): True if the maximizing player moves at ``node``.
+            alpha (float, optional): Alpha bound. Defaults to -inf.
+            beta (float, optional): Beta bound. Defaults to inf.
+            on_path (bytearray, optional): Nodes already on the path. Defaults to none.
+
+        Returns:
+            float: The value of the node (a bound when it falls outside (alpha, beta)).
+        """
+        if self._moves is None:
+            self._prepare()
+        attributes = self.road_graph.attributes
+        terminal, utility = attributes['terminal'], attributes['utility']
+        if terminal[node]:
+            return utility[node]
+
+        descending, ascending = self._moves, self._moves_ascending
+        if on_path is None:
+            on_path = bytearray(len(self.road_graph))
+        inf = float('inf')
+
+        # frame: [node, maximizing, alpha, beta, value, next move index, moves, legal moves seen]
+        on_path[node] = 1
+        stack = [[node, maximizing_player, alpha, beta, -inf if maximizing_player else inf, 0,
+                  descending[node] if maximizing_player else ascending[node], 0]]
+        result = None
+
+        while stack:
+            frame = stack[-1]
+            node, maximizing, alpha, beta, value, index, moves, seen = frame
+
+            if result is not None:  # A child just finished
+                if maximizing:
+                    value = max(value, result)
+                    alpha = max(alpha, value)
+                else:
+                    value = min(value, result)
+                    beta = min(beta, value)
+                result = None
+                frame[2], frame[3], frame[4] = alpha, beta, value
+                if alpha >= beta:
+                    index = len(moves)  # Cutoff
+
+            while index < len(moves) and on_path[moves[index]]:
+                index += 1
+
+            if index >= len(moves):
+                stack.pop()
+                on_path[node] = 0
+                result = value if seen else utility[node]
+                continue
+
+            child = moves[index]
+            frame[5] = index + 1
+            frame[7] = seen + 1
+            if terminal[child]:
+                result = utility[child]
+                continue
+
+            on_path[child] = 1
+            stack.append([child, not maximizing, alpha, beta, inf if maximizing else -inf, 0,
+                          ascending[child] if maximizing else descending[child], 0])
+
+        return result
+
+    def find_best_move_iterative(self, start_node):
+        """
+        Find the best move for the maximizing player with the explicit-stack search.
+
+        Uses the cycle rule of ``minimax_iterative``: the start node and every node on
+        the path so far cannot be entered again.
+
+        Args:
+            start_node (str): The starting node.
+
+        Returns:
+            tuple: The best move and its utility value.
+        """
+        graph = self.road_graph
+        start = graph.node(start_node)
+        on_path = bytearray(len(graph))
+        on_path[start] = 1
+        best_move = None
+        best_value = float('-inf')
+
+        for child, _, is_blocked in graph.edges(start):
+            if is_blocked or on_path[child]:
+                continue
+            eval = self.minimax_iterative(child, False, best_value, float('inf'), on_path)
+            if eval > best_value:
+                best_value = eval
+                best_move = graph.names[child]
+
+        return best_move, best_value
+
+    def solve(self, draw_value=0):
+        """
+        Solve every (city, player to move) position at once by retrograde analysis.
+
+        Unlike the searches above, positions do not remember the path: a road may be
+        travelled again, and a game that never reaches a terminal scores ``draw_value``.
+
+        Args:
+            draw_value (float, optional): Score of a game that never ends. Defaults to 0.
+
+        Returns:
+            RetrogradeSolver: The solved value and best-move tables, also kept in ``self.solution``.
+        """
+        self.solution = RetrogradeSolver(self.road_graph, draw_value)
+        return self.solution
+
+    def find_best_move_retrograde(self, start_node):
+        """
+        Look up the best move for the maximizing player in the retrograde solution.
+
+        Args:
+            start_node (str): The starting node.
+
+        Returns:
+            tuple: The best move and its game value.
+        """
+        if self.solution is None:
+            self.solve()
+        return self.solution.best_move(start_node)
+
+    def find_best_move_parallel(self, start_node, workers=None, split_depth=1, depth_limit=None):
+        """
+        Find the best move for the maximizing player, scoring subtrees on a process pool.
+
+        Root moves (with ``split_depth=2``, every reply to every root move) are independent
+        alpha-beta searches spread across worker processes. Each worker receives the
+        compiled graph once when it starts, not with every task. The best exact root value
+        found so far is shared through a ``multiprocessing.Value`` and used as alpha by every
+        task that starts later, so workers prune against each other's results. A task that
+        fails low only proves its move is no better than an already scored one.
+
+        Args:
+            start_node (str): The starting node.
+            workers (int, optional): Worker processes. Defaults to one per CPU.
+            split_depth (int, optional): 1 to split at the root moves, 2 to also split at
+                the replies. Defaults to 1.
+            depth_limit (int, optional): Plies to search, counting the root move. Defaults to no limit.
+
+        Returns:
+            tuple: The best move and its utility value. Among equally good moves, any may be returned.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from multiprocessing import Value
+
+        if split_depth not in (1, 2):
+            raise ValueError("split_depth must be 1 or 2.")
+        if self._moves is None:
+            self._prepare()
+        graph = self.road_graph
+        start = graph.node(start_node)
+        moves = [child for child, _, is_blocked in graph.edges(start) if not is_blocked]
+        depth_left = float('inf') if depth_limit is None else depth_limit
+
+        # task: (root move, node to score, side to move, nodes on the path, plies left)
+        tasks = []
+        for move in moves:
+            replies = self._moves[move]
+            if split_depth == 1 or graph.attributes['terminal'][move] or not replies or depth_left <= 2:
+                tasks.append((move, move, False, (), depth_left - 1))
+            else:
+                tasks.extend((move, reply, True, (move,), depth_left - 2) for reply in replies)
+
+        alpha = Value('d', float('-inf'))
+        pending = {move: 0 for move in moves}
+        for task in tasks:
+            pending[task[0]] += 1
+        values = {move: float('inf') for move in moves}
+        exact = {move: True for move in moves}
+
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(graph, alpha)) as pool:
+            futures = {pool.submit(_score_subtree, task[1:]): task[0] for task in tasks}
+            for future in as_completed(futures):
+                move = futures[future]
+                value, alpha_used = future.result()
+                values[move] = min(values[move], value)
+                exact[move] = exact[move] and value > alpha_used
+                pending[move] -= 1
+                if pending[move] == 0 and exact[move]:
+                    with alpha.get_lock():
+                        alpha.value = max(alpha.value, values[move])
+
+        best_move = None
+        best_value = float('-inf')
+        for move in moves:
+            if exact[move] and values[move] > best_value:
+                best_value = values[move]
+                best_move = graph.names[move]
+        return best_move, best_value
+
+    def _best_root_move(self, moves, depth_left, table, deadline, stats=None):
+        """Score the root moves in order, narrowing the window to the best value so far."""
+        graph = self.road_graph
+        best_move = None
+        best_value = float('-inf')
+        on_path = bytearray(len(graph))
+
+        for child in moves:
+            eval = self.alphabeta(child, depth_left - 1, False, best_value, float('inf'),
+                                  on_path, 0, table, deadline, stats)
+            if eval > best_value:
+                best_value = eval
+                best_move = graph.names[child]
+
+        return best_move, best_value
+
+    def visualize_graph(self, start_node, best_path=None):
+        """
+        Visualize the graph using matplotlib and networkx.
+
+        Args:
+            start_node (str): The starting node for visualization.
+            best_path (list, optional): A list of nodes representing the best path. Defaults to None.
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        G = nx.Graph()
+
+        # Add nodes and edges to the graph
+        for node, data in self.graph.items():
+            for neighbor, is_blocked in data['neighbors']:
+                if not is_blocked:
+                    G.add_edge(node, neighbor)
+
+        # Draw the graph
+        pos = cached_layout(self.road_graph)
+        plt.figure(figsize=(12, 8))
+
+        # Highlight best path if provided
+        if best_path:
+            path_edges = list(zip(best_path, best_path[1:]))
+            nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='red', width=2)
+
+        # Highlight the start node
+        nx.draw_networkx_nodes(G, pos, nodelist=[start_node], node_size=800, node_color='green')
+
+        # Draw other nodes
+        remaining_nodes = set(G.nodes()) - {start_node}
+        nx.draw_networkx_nodes(G, pos, nodelist=list(remaining_nodes), node_size=700, node_color='lightblue')
+
+        # Draw all edges
+        nx.draw_networkx_edges(G, pos)
+
+        # Add node utilities
+        labels = {node: f"{node}\n({data['utility']})" for node, data in self.graph.items()}
+        nx.draw_networkx_labels(G, pos, labels=labels, font_size=8, font_color='black')
+
+        plt.title(f"Traveling Ethiopia Search Graph (Start: {start_node})")
+        plt.show()
+
+_worker_search = None
+_worker_alpha = None
+_worker_table = None
+
+
+def _init_worker(road_graph, alpha):
+    """Process-pool initializer: keep the compiled graph and the shared alpha for all tasks."""
+    global _worker_search, _worker_alpha, _worker_table
+    _worker_search = TravelEthiopia(None, road_graph=road_graph)
+    _worker_search._prepare()
+    _worker_alpha = alpha
+    _worker_table = {}
+
+
+def _score_subtree(task):
+    """
+    Score one subtree in a worker with the current shared alpha.
+
+    Returns:
+        tuple: The value and the alpha it was searched with; a value not above that
+        alpha is only an upper bound.
+    """
+    node, maximizing_player, path, depth_left = task
+    search = _worker_search
+    on_path = bytearray(len(search.road_graph))
+    path_key = 0
+    for visited in path:
+        on_path[visited] = 1
+        path_key ^= search._zobrist[visited]
+
+    alpha = _worker_alpha.value
+    value = search.alphabeta(node, depth_left, maximizing_player, alpha, float('inf'),
+                             on_path, path_key, _worker_table)
+    return value, alpha
+
+
+if __name__ == "__main__":
+    ethiopia_search = TravelEthiopia(roads)
+    start = 'Addis Ababa'
+    best_move, best_value = ethiopia_search.find_best_move(start)
+
+    # Find the best path (for visualization)
+    path = [start, best_move]
+
+    # Display results
+    print(f"Best move from {start}: {best_move} with utility {best_value}")
+
+    # Visualize the graph
+    ethiopia_search.visualize_graph(start, best_path=path)
@@ -0,0 +1,514 @@
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from . import cities_road_ucs
+from .all_pairs import CACHE_DIR, AllPairs
+from .contraction import ContractionHierarchy
+from .dynamic import DynamicRoads
+from .road_data import load_road_graph
+from .road_graph import RoadGraph
+from .shortest_paths import DijkstraSearch, bidirectional_dijkstra, distance_table, k_shortest_paths
+from .tour import EXACT_TOUR_LIMIT, solve_tour
+from .visualization import cached_layout, to_networkx
+
+BUCKET_MIN_SIZE = 32  # 'auto' distance tables use hierarchy buckets once both sides have this many cities
+SEARCH_CACHE_BYTES = 64 * 2 ** 20  # Default memory budget for the cached per-source searches
+SEARCH_BYTES_PER_NODE = 17  # A DijkstraSearch keeps a double distance, a 64-bit parent and a settled byte per node
+
+
+class TravelEthiopia:
+    """
+    Implements Uniform Cost Search (UCS) for finding the optimal path in a weighted graph.
+
+    Attributes:
+        graph (dict): The adjacency list representation of the graph, where keys are nodes and
+                      values are lists of tuples (neighbor, cost).
+        road_graph (RoadGraph): The compiled, integer-indexed graph the searches run on.
+        cache_size (int): How many per-source searches are kept for reuse. Every cached search
+            holds ``SEARCH_BYTES_PER_NODE`` bytes per city plus its frontier heap, so on a
+            million-city network one search takes about 17 MB.
+        all_pairs (AllPairs): Precomputed all-pairs table, once ``precompute_all_pairs`` ran.
+        hierarchy (ContractionHierarchy): Contraction hierarchy, once ``use_hierarchy`` ran.
+        dynamic (DynamicRoads): Road changes applied to ``road_graph``, once a road was changed.
+    """
+
+    def __init__(self, graph, cache_size=None, road_graph=None):
+        """
+        Initialize the UniformCostSearch class.
+
+        Args:
+            graph (dict): The adjacency list of the graph.
+            cache_size (int, optional): How many per-source searches to keep. Defaults to as many
+                as fit in ``SEARCH_CACHE_BYTES`` (at least one).
+            road_graph (RoadGraph, optional): ``graph`` already compiled. Defaults to compiling it.
+        """
+        self.graph = graph
+        self.road_graph = road_graph if road_graph is not None else RoadGraph.from_roads(graph)
+        if cache_size is None:
+            cache_size = max(1, SEARCH_CACHE_BYTES // (SEARCH_BYTES_PER_NODE * max(1, len(self.road_graph))))
+        self.cache_size = cache_size
+        self.all_pairs = None
+        self.hierarchy = None
+        self.dynamic = None
+        self._searches = OrderedDict()
+        self._reverse_graph = None
+        self._network = None
+
+    @classmethod
+    def from_file(cls, path, cache_size=None):
+        """
+        Build the engine from a JSON road file, through the binary graph cache.
+
+        Args:
+            path (str): The JSON road file (see ``road_data.RoadData``).
+            cache_size (int, optional): How many per-source searches to keep. Defaults to as many
+                as fit in ``SEARCH_CACHE_BYTES`` (at least one).
+
+        Returns:
+            TravelEthiopia: The engine, searching the cached compiled graph.
+        """
+        road_graph = load_road_graph(path)
+        return cls(road_graph.adjacency(), cache_size, road_graph)
+
+    def precompute_all_pairs(self, cache_dir=CACHE_DIR, method='auto'):
+        """
+        Precompute (or load from the on-disk cache) shortest paths between every pair of cities.
+
+        Afterwards ``find_path`` answers from the table instead of searching.
+
+        Args:
+            cache_dir (str, optional): Directory of the memory-mapped ``.npy`` cache. Defaults to CACHE_DIR.
+            method (str, optional): ``'floyd-warshall'``, ``'dijkstra'`` or ``'auto'``. Defaults to 'auto'.
+
+        Returns:
+            AllPairs: The loaded table.
+        """
+        self.all_pairs = AllPairs.load(self.road_graph, cache_dir, method)
+        return self.all_pairs
+
+    def use_hierarchy(self, path=None):
+        """
+        Answer ``find_path`` queries from a contraction hierarchy.
+
+        The hierarchy is read from ``path`` when that file was built from the same road
+        data; otherwise it is built and, if a path is given, saved there so other query
+        workers can load it instead of rebuilding it.
+
+        Args:
+            path (str, optional): The ``.npz`` file of the hierarchy. Defaults to building in memory.
+
+        Returns:
+            ContractionHierarchy: The hierarchy in use.
+        """
+        hierarchy = None
+        if path is not None and os.path.exists(path):
+            hierarchy = ContractionHierarchy.load(path)
+            if hierarchy.fingerprint != self.road_graph.fingerprint():
+                hierarchy = None
+        if hierarchy is None:
+            hierarchy = ContractionHierarchy.build(self.road_graph)
+            if path is not None:
+                hierarchy.save(path)
+        self.hierarchy = hierarchy
+        return hierarchy
+
+    def _search_from(self, start):
+        """
+        Return the (possibly partially run) Dijkstra search rooted at a node id.
+
+        Searches are kept in an LRU cache of ``cache_size`` entries, so a later query from the
+        same source resumes the existing expansion instead of starting over.
+        """
+        search = self._searches.get(start)
+        if search is None:
+            search = self._searches[start] = DijkstraSearch(self.road_graph, start)
+            if len(self._searches) > self.cache_size:
+                self._searches.popitem(last=False)
+        else:
+            self._searches.move_to_end(start)
+        return search
+
+    def find_path(self, start, goal, stats=None):
+        """
+        Find the shortest path from start to goal using UCS.
+
+        Args:
+            start (str): The initial state.
+            goal (str): The goal state.
+            stats (SearchStats, optional): Receives the work done; a search resumed from the
+                cache only reports the nodes it settled now. Defaults to None.
+
+        Returns:
+            tuple: The shortest path as a list of nodes and its total cost.
+        """
+        graph = self.road_graph
+        if start not in graph or goal not in graph:
+            return ([start], 0) if start == goal else (None, float('inf'))
+
+        start, goal = graph.node(start), graph.node(goal)
+        if self.all_pairs is not None:
+            path, cost = self.all_pairs.path(start, goal), self.all_pairs.distance(start, goal)
+        elif self.hierarchy is not None:
+            path, cost = self.hierarchy.query(start, goal)
+        else:
+            search = self._search_from(start)
+            if not search.settled[goal]:
+                search.settle_until((goal,), stats)
+            path, cost = search.path(goal), search.distances[goal]
+        if path is None:
+            return None, float('inf')  # Return None if no path is found
+        return graph.path_names(path), graph.cost(cost)
+
+    def find_path_bidirectional(self, start, goal, stats=None):
+        """
+        Find the shortest path from start to goal with bidirectional UCS.
+
+        Frontiers grow from both ends (backwards along reversed roads from the goal) and
+        stop once no path through an unsettled city can beat the best meeting point, which
+        settles far fewer cities than a one-sided search on long routes.
+
+        Args:
+            start (str): The initial state.
+            goal (str): The goal state.
+            stats (SearchStats, optional): Receives the work done by both frontiers. Defaults to None.
+
+        Returns:
+            tuple: The shortest path as a list of nodes and its total cost.
+        """
+        graph = self.road_graph
+        if start not in graph or goal not in graph:
+            return ([start], 0) if start == goal else (None, float('inf'))
+        if self._reverse_graph is None:
+            self._reverse_graph = graph.reversed()
+
+        path, cost = bidirectional_dijkstra(graph, self._reverse_graph, graph.node(start), graph.node(goal),
+                                            stats)
+        if path is None:
+            return None, float('inf')
+        return graph.path_names(path), graph.cost(cost)
+
+    def find_k_shortest_paths(self, start, goal, k=3):
+        """
+        Find up to k alternative routes from start to goal, cheapest first (Yen's algorithm).
+
+        Routes never visit a city twice. One backward search from the goal is shared by
+        every spur search as an exact-on-the-tree A* heuristic, so each alternative costs
+        little more than the cities near its detour.
+
+        Args:
+            start (str): The initial state.
+            goal (str): The goal state.
+            k (int, optional): How many routes to return. Defaults to 3.
+
+        Returns:
+            list: Up to k ``(path, cost)`` tuples, empty if the goal is unreachable.
+        """
+        graph = self.road_graph
+        if start not in graph or goal not in graph:
+            return [([start], 0)] if start == goal and k > 0 else []
+        if self._reverse_graph is None:
+            self._reverse_graph = graph.reversed()
+
+        goal = graph.node(goal)
+        tree = DijkstraSearch(self._reverse_graph, goal).tree()
+        routes = k_shortest_paths(graph, graph.node(start), goal, k, tree)
+        return [(graph.path_names(path), graph.cost(cost)) for path, cost in routes]
+
+    def shortest_path_tree(self, start):
+        """
+        Return the complete shortest-path tree rooted at start.
+
+        The tree answers distance and path queries to every city reachable from start
+        without any further search.
+
+        Args:
+            start (str): The root of the tree.
+
+        Returns:
+            SearchTree: The settled shortest-path tree.
+        """
+        return self._search_from(self.road_graph.node(start)).tree()
+
+    def distance_table(self, sources, targets, paths=False, method='auto'):
+        """
+        Shortest distances from every source to every target, as an origin-destination matrix.
+
+        Methods:
+        - 'dijkstra': one Dijkstra per source, stopped once every target is settled.
+        - 'buckets': bucket-based many-to-many on the contraction hierarchy (built with
+          ``use_hierarchy`` first if needed), which pays one upward search per source and
+          per target rather than per pair.
+        - 'auto': slices the all-pairs table when one is loaded, uses buckets when a
+          hierarchy is loaded and both sides have at least BUCKET_MIN_SIZE cities, and
+          runs Dijkstra otherwise.
+
+        Args:
+            sources (list): Cities of the rows.
+            targets (list): Cities of the columns.
+            paths (bool, optional): Whether to return the paths as well. Defaults to False.
+            method (str, optional): 'auto', 'dijkstra' or 'buckets'. Defaults to 'auto'.
+
+        Returns:
+            numpy.ndarray or tuple: The ``(len(sources), len(targets))`` distance matrix, with
+            ``inf`` where there is no path. With ``paths``, a tuple of the matrix and a list
+            of rows of paths (None where there is no path).
+
+        Raises:
+            KeyError: If a city is not on the map.
+            ValueError: If the method is unknown.
+        """
+        if method not in ('auto', 'dijkstra', 'buckets'):
+            raise ValueError("Invalid method! Use 'auto', 'dijkstra' or 'buckets'.")
+        graph = self.road_graph
+        source_ids = [graph.node(city) for city in sources]
+        target_ids = [graph.node(city) for city in targets]
+
+        if method == 'auto' and self.all_pairs is not None:
+            table = np.array(self.all_pairs.distances[np.ix_(source_ids, target_ids)], dtype=float)
+            routes = [[self.all_pairs.path(s, t) for t in target_ids] for s in source_ids] if paths else None
+        elif method == 'buckets' or (method == 'auto' and self.hierarchy is not None
+                                     and min(len(source_ids), len(target_ids)) >= BUCKET_MIN_SIZE):
+            if self.hierarchy is None:
+                self.use_hierarchy()
+            table, routes = self.hierarchy.many_to_many(source_ids, target_ids, paths)
+        else:
+            table, routes = distance_table(graph, source_ids, target_ids, paths)
+
+        if not paths:
+            return table
+        return table, [[graph.path_names(path) if path is not None else None for path in row] for row in routes]
+
+    def block_edge(self, start, goal, both_ways=True):
+        """
+        Close the road from start to goal and repair the cached results that depend on it.
+
+        Args:
+            start (str): One end of the road.
+            goal (str): The other end of the road.
+            both_ways (bool, optional): Close the goal -> start direction too. Defaults to True.
+
+        Returns:
+            int: The number of cached labels that were repaired.
+        """
+        return self._change_road(start, goal, both_ways, lambda edge: self.dynamic.block(edge))
+
+    def unblock_edge(self, start, goal, both_ways=True):
+        """
+        Reopen the road from start to goal with its last weight and repair the cached results.
+
+        Args:
+            start (str): One end of the road.
+            goal (str): The other end of the road.
+            both_ways (bool, optional): Reopen the goal -> start direction too. Defaults to True.
+
+        Returns:
+            int: The number of cached labels that were repaired.
+        """
+        return self._change_road(start, goal, both_ways, lambda edge: self.dynamic.unblock(edge))
+
+    def set_weight(self, start, goal, weight, both_ways=True):
+        """
+        Change the cost of the road from start to goal and repair the cached results.
+
+        A closed road keeps the new cost for when it is reopened.
+
+        Args:
+            start (str): One end of the road.
+            goal (str): The other end of the road.
+            weight (int or float): The new, positive cost.
+            both_ways (bool, optional): Change the goal -> start direction too. Defaults to True.
+
+        Returns:
+            int: The number of cached labels that were repaired.
+
+        Raises:
+            ValueError: If the weight is not a positive finite number.
+        """
+        return self._change_road(start, goal, both_ways, lambda edge: self.dynamic.set_weight(edge, weight))
+
+    def _change_road(self, start, goal, both_ways, change):
+        """
+        Apply ``change`` to every edge of a road, one edge at a time, and repair the caches
+        after each edge with Ramalingam-Reps updates instead of recomputing them:
+        - exhausted searches (full shortest-path trees) are repaired in place;
+        - partial searches are kept if they have not expanded the edge's tail yet, since
+          nothing they settled or labelled can depend on it, and dropped otherwise;
+        - the all-pairs table is repaired column by column.
+        The contraction hierarchy cannot be patched and is dropped.
+
+        Raises:
+            KeyError: If a city is not on the map.
+            ValueError: If there is no road between the two cities.
+        """
+        graph = self.road_graph
+        u, v = graph.node(start), graph.node(goal)
+        if self.dynamic is None:
+            self.dynamic = DynamicRoads(graph)
+        pairs = [(u, v), (v, u)] if both_ways else [(u, v)]
+        edges = [(a, b, edge) for a, b in pairs for edge in self.dynamic.edges(a, b)]
+        if not edges:
+            raise ValueError(f"There is no road from {start} to {goal}.")
+
+        repaired = 0
+        for a, b, edge in edges:
+            old_weight = change(edge)
+            if graph.weights[edge] == old_weight:
+                continue
+            for source, search in list(self._searches.items()):
+                if search.exhausted:
+                    repaired += self.dynamic.repair_search(search, a, b, edge, old_weight)
+                elif search.settled[a]:
+                    del self._searches[source]
+            if self.all_pairs is not None:
+                repaired += self.dynamic.repair_all_pairs(self.all_pairs, a, b, edge, old_weight)
+            self.hierarchy = None
+            self._reverse_graph = None
+            self._network = None
+        return repaired
+
+    def find_path_to_multiple_goals(self, start, goals, optimize=True, exact_limit=EXACT_TOUR_LIMIT,
+                                    time_budget=1.0, stats=None):
+        """
+        Find a path that visits multiple goal states using UCS.
+
+        By default the visiting order is optimized on a goal-to-goal distance matrix:
+        exactly (Held-Karp) for up to ``exact_limit`` goals, and with 2-opt/Or-opt local
+        search within ``time_budget`` seconds beyond that. With ``optimize=False`` goals
+        are visited greedily, nearest first.
+
+        The exact limit defaults to 16 goals rather than 20: the Held-Karp table grows as
+        ``2^k * k``, and at 20 goals one query takes about 4 s and 235 MiB, against about
+        0.2 s and 12 MiB at 16. Pass a larger ``exact_limit`` to trade that for optimality.
+
+        Args:
+            start (str): The initial state.
+            goals (list): A list of goal states to visit.
+            optimize (bool, optional): Optimize the visiting order. Defaults to True.
+            exact_limit (int, optional): Largest goal count ordered exactly. Defaults to EXACT_TOUR_LIMIT.
+            time_budget (float, optional): Seconds for local search on larger goal sets. Defaults to 1.0.
+            stats (SearchStats, optional): Receives the work of the Dijkstra expansions. Defaults to None.
+
+        Returns:
+            tuple: The shortest path that visits all goals and its total cost.
+        """
+        graph = self.road_graph
+        if not goals:
+            return [start], 0
+        if start not in graph or any(goal not in graph for goal in goals):
+            return None, float('inf')  # Return if any goal is unreachable
+
+        start = graph.node(start)
+        goals = [graph.node(goal) for goal in dict.fromkeys(goals)]
+        if optimize:
+            full_path, total_cost = self._optimal_tour(start, goals, exact_limit, time_budget, stats)
+        else:
+            full_path, total_cost = self._nearest_goal_tour(start, goals, stats)
+
+        if full_path is None:
+            return None, float('inf')
+        return graph.path_names(full_path), graph.cost(total_cost)
+
+    def _nearest_goal_tour(self, start, goals, stats=None):
+        """
+        Visit goals greedily, nearest first. Each round runs a single Dijkstra expansion
+        from the current city that stops as soon as the first remaining goal is settled,
+        since settling order already gives the nearest goal.
+        """
+        remaining_goals = set(goals)
+        current_node = start
+        total_cost = 0
+        full_path = []
+
+        while remaining_goals:
+            search = self._search_from(current_node)
+            settled_goals = [goal for goal in remaining_goals if search.settled[goal]]
+            if settled_goals:
+                nearest = min(settled_goals, key=search.distances.__getitem__)
+            else:
+                nearest = search.settle_until(remaining_goals, stats)
+
+            if nearest is None:
+                return None, float('inf')  # Return if any goal is unreachable
+
+            shortest_path = search.path(nearest)
+            full_path.extend(shortest_path[:-1])  # Append path except the last node to avoid duplicates
+            current_node = nearest
+            total_cost += search.distances[nearest]
+            remaining_goals.remove(current_node)
+
+        full_path.append(current_node)  # Add the final goal
+        return full_path, total_cost
+
+    def _optimal_tour(self, start, goals, exact_limit, time_budget, stats=None):
+        """
+        Order the goals on a precomputed goal-to-goal distance matrix, then stitch the
+        shortest paths between consecutive stops together.
+        """
+        points = [start] + [goal for goal in goals if goal != start]
+        matrix = np.full((len(points), len(points)), np.inf)
+        for row, point in enumerate(points):
+            search = self._search_from(point)
+            for column, other in enumerate(points):
+                matrix[row, column] = search.distance(other, stats)
+        if np.isinf(matrix[0]).any():
+            return None, float('inf')
+
+        order, total_cost = solve_tour(matrix, exact_limit, time_budget)
+        if total_cost == float('inf'):
+            return None, float('inf')
+
+        full_path = [start]
+        for a, b in zip(order, order[1:]):
+            full_path.extend(self._search_from(points[a]).path(points[b])[1:])
+        return full_path, total_cost
+
+    def visualize_path(self, path, title="Path Visualization"):
+        """
+        Visualize the path on the graph using networkx and matplotlib.
+
+        Args:
+            path (list): The path as a list of nodes.
+            title (str): Title of the visualization.
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        if self._network is None:
+            self._network = to_networkx(self.road_graph)
+        G = self._network
+
+        # Highlight the path's roads, in either direction
+        path_edges = set(zip(path, path[1:]))
+        edge_colors = ["red" if (u, v) in path_edges or (v, u) in path_edges else "black" for u, v in G.edges]
+
+        # Draw the graph
+        pos = cached_layout(self.road_graph)
+        nx.draw(G, pos, with_labels=True, node_size=500, font_size=8, edge_color=edge_colors)
+        nx.draw_networkx_edge_labels(G, pos, edge_labels={(u, v): d["weight"] for u, v, d in G.edges(data=True)})
+
+        plt.title(title)
+        plt.show()
+
+
+def __getattr__(name):
+    # The sample data used to be imported eagerly here; it is now forwarded on first use.
+    if name == 'roads':
+        return getattr(cities_road_ucs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    ucs = TravelEthiopia(cities_road_ucs.roads)
+
+    # Task 2.2: Find a path from Addis Ababa to Lalibela
+    path, cost = ucs.find_path("Addis Ababa", "Lalibela")
+    print(f"Path from Addis Ababa to Lalibela: {path}, Cost: {cost}")
+    ucs.visualize_path(path, title="Path from Addis Ababa to Lalibela")
+
+    # Task 2.3: Visit multiple goals from Addis Ababa
+    goals = ["Axum", "Gondar", "Lalibela", "Babile", "Jimma", "Bale", "Sof Oumer", "Arba Minch"]
+    path, cost = ucs.find_path_to_multiple_goals("Addis Ababa", goals)
+    print(f"Path to visit all goals: {path}, Total Cost: {cost}")
+    ucs.visualize_path(path, title="Path to Visit All Goals")
@@ -0,0 +1,397 @@
+import time
+from array import array
+from collections import deque
+
+from . import cities_road_ufs
+from .bitset_bfs import hop_matrix
+from .road_graph import RoadGraph, SearchTree
+from .visualization import cached_layout, to_networkx
+
+
+class TravelEthiopia:
+    """
+    A class for performing search on a graph representation of Ethiopian cities and roads.
+
+    This class supports three search strategies:
+    - Breadth-First Search (BFS)
+    - Depth-First Search (DFS)
+    - Bidirectional Breadth-First Search (BIBFS)
+
+    Both keep only node ids on their frontier and rebuild the path from parent pointers
+    once the goal is reached. ``breadth_first_tree`` returns the whole BFS tree instead.
+
+    The graph is visualized using NetworkX, and the search path is highlighted on the graph.
+    The searches themselves never draw; the spring layout is computed once per road data
+    and cached (see ``visualization.cached_layout``).
+
+    Attrs:
+        cities (list): A list of city names.
+        roads (dict): A dictionary mapping each city to its neighboring cities and weights.
+        initial_state (str): The starting city for the search.
+        goal_state (str): The destination city for the search.
+        strategy (str): The search strategy ("BFS", "DFS" or "BIBFS").
+        graph (dict): The adjacency list representation of the city graph.
+        road_graph (RoadGraph): The compiled, integer-indexed graph the searches run on.
+    """
+    def __init__(self, cities, roads, initial_state, goal_state, strategy):
+        self.graph = self._build_graph(cities, roads)
+        self.road_graph = RoadGraph.from_roads(self.graph, cities)
+        self.initial_state = initial_state
+        self.goal_state = goal_state
+        self.strategy = strategy.upper()
+        self._network = None
+
+    def _build_graph(self, cities, roads):
+        """
+            Q (1.1) Convert Figure 1 into a manageable data structure:
+            Converts city list & roads dictionary into an adjacency list.
+            Args:
+                cities (list): List of city names.
+                roads (dict): Dictionary of roads connecting cities, with weights.
+
+            Returns:
+                dict: Adjacency list representation of the graph.
+        """
+        graph = {city: {} for city in cities}
+        for city, neighbors in roads.items():
+            for neighbor, _ in neighbors:
+                graph[city][neighbor] = None
+                graph[neighbor][city] = None
+        return {city: list(neighbors) for city, neighbors in graph.items()}
+
+    def search(self, stats=None):
+        """
+            Q (1.2) Write a class for the search solution
+            Executes search based on selected strategy.
+            Args:
+                stats (SearchStats, optional): Receives the work done by the search. Defaults to None.
+            Returns:
+                list or None: The solution path from initial_state to goal_state, or None if no path exists.
+            Raises:
+                ValueError: If the strategy is invalid.
+        """
+        if self.strategy == "BFS":
+            return self._breadth_first_search(stats)
+        elif self.strategy == "DFS":
+            return self._depth_first_search(stats)
+        elif self.strategy == "BIBFS":
+            return self._bidirectional_breadth_first_search(stats)
+        else:
+            raise ValueError("Invalid search strategy! Use 'BFS', 'DFS' or 'BIBFS'.")
+
+    def breadth_first_tree(self, source=None, stats=None):
+        """
+        Builds the whole BFS tree from a single traversal.
+
+        The tree holds the hop distance and parent of every reachable city, so paths from
+        the same source to any number of goals can be read off without searching again.
+
+        Args:
+            source (str, optional): The root city. Defaults to initial_state.
+            stats (SearchStats, optional): Receives the work done by the traversal. Defaults to None.
+
+        Returns:
+            SearchTree: The BFS tree, or None if the source is not part of the graph.
+        """
+        start = self.road_graph.index.get(source or self.initial_state)
+        if start is None:
+            return None
+        return self._bfs(start, stats=stats)
+
+    def hop_matrix(self, sources, max_hops=None):
+        """
+        Hop counts from many cities at once, for coverage and reachability reports.
+
+        All sources advance together in one level-synchronous BFS over bitsets (see
+        ``bitset_bfs.hop_matrix``) instead of one Python traversal per source.
+
+        Args:
+            sources (list): The source cities (rows).
+            max_hops (int, optional): Only count cities within this many hops. Defaults to no limit.
+
+        Returns:
+            numpy.ndarray: A ``(len(sources), number of cities)`` int32 matrix whose columns
+            follow ``road_graph.names``, with -1 for cities not reached.
+
+        Raises:
+            KeyError: If a source is not part of the graph.
+        """
+        graph = self.road_graph
+        return hop_matrix(graph, [graph.node(city) for city in sources], max_hops)
+
+    def _bfs(self, start, goal=None, stats=None):
+        """
+        Level-order traversal over node ids with a node-only queue and parent pointers.
+        Stops as soon as ``goal`` is discovered when one is given.
+        """
+        graph = self.road_graph
+        offsets, targets = graph.offsets, graph.targets
+        n = len(graph)
+        hops = array('d', [float('inf')]) * n
+        parents = array('q', [-1]) * n
+        hops[start] = 0
+        queue = deque([start])
+        on_expand = on_push = None
+        if stats is not None:
+            began = time.perf_counter()
+            on_expand, on_push = stats.on_expand, stats.on_push
+
+        while queue:
+            if stats is not None and len(queue) > stats.frontier_peak:
+                stats.frontier_peak = len(queue)
+            node = queue.popleft()
+            if node == goal:
+                break
+            level = hops[node] + 1
+            if stats is not None:
+                stats.nodes_expanded += 1
+                stats.edges_relaxed += offsets[node + 1] - offsets[node]
+                if on_expand is not None:
+                    on_expand(node)
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                if hops[neighbor] == float('inf'):
+                    hops[neighbor] = level
+                    parents[neighbor] = node
+                    if neighbor == goal:
+                        queue.clear()
+                        break
+                    queue.append(neighbor)
+                    if stats is not None:
+                        stats.heap_pushes += 1
+                        if on_push is not None:
+                            on_push(neighbor, level)
+
+        if stats is not None:
+            stats.elapsed += time.perf_counter() - began
+        return SearchTree(graph, start, hops, parents, integral=True)
+
+    def _breadth_first_search(self, stats=None):
+        """
+        Breadth-First Search implementation.
+        Returns:
+            list or None: The solution path from initial_state to goal_state, or None if no path exists.
+        """
+        graph = self.road_graph
+        start = graph.index.get(self.initial_state)
+        goal = graph.index.get(self.goal_state)
+        if start is None or goal is None:
+            return None
+
+        return self._bfs(start, goal, stats).path_to(self.goal_state)
+
+    def _bidirectional_breadth_first_search(self, stats=None):
+        """
+        Bidirectional Breadth-First Search implementation.
+
+        Grows BFS levels from the initial and the goal state at the same time, always
+        expanding the smaller frontier by one whole level. The road graph is undirected,
+        so the backward search walks the same adjacency. Once a level touches the other
+        side, the best meeting point of that level gives a shortest path.
+
+        Returns:
+            list or None: The solution path from initial_state to goal_state, or None if no path exists.
+        """
+        graph = self.road_graph
+        offsets, targets = graph.offsets, graph.targets
+        start = graph.index.get(self.initial_state)
+        goal = graph.index.get(self.goal_state)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return [self.initial_state]
+
+        n = len(graph)
+        hops = (array('q', [-1]) * n, array('q', [-1]) * n)
+        parents = (array('q', [-1]) * n, array('q', [-1]) * n)
+        frontiers = ([start], [goal])
+        hops[0][start] = hops[1][goal] = 0
+        best, meeting = None, None
+        on_expand = on_push = None
+        if stats is not None:
+            began = time.perf_counter()
+            on_expand, on_push = stats.on_expand, stats.on_push
+
+        while frontiers[0] and frontiers[1] and meeting is None:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own_hops, own_parents, other_hops = hops[side], parents[side], hops[1 - side]
+            next_frontier = []
+            if stats is not None:
+                stats.frontier_peak = max(stats.frontier_peak, len(frontiers[0]) + len(frontiers[1]))
+            for node in frontiers[side]:
+                if stats is not None:
+                    stats.nodes_expanded += 1
+                    stats.edges_relaxed += offsets[node + 1] - offsets[node]
+                    if on_expand is not None:
+                        on_expand(node)
+                for edge in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[edge]
+                    if other_hops[neighbor] >= 0:
+                        length = own_hops[node] + 1 + other_hops[neighbor]
+                        if best is None or length < best:
+                            best, meeting = length, (side, node, neighbor)
+                    if own_hops[neighbor] < 0:
+                        own_hops[neighbor] = own_hops[node] + 1
+                        own_parents[neighbor] = node
+                        next_frontier.append(neighbor)
+                        if stats is not None:
+                            stats.heap_pushes += 1
+                            if on_push is not None:
+                                on_push(neighbor, own_hops[neighbor])
+            frontiers[side][:] = next_frontier
+
+        if stats is not None:
+            stats.elapsed += time.perf_counter() - began
+        if meeting is None:
+            return None
+
+        side, node, neighbor = meeting
+        forward_end, backward_start = (node, neighbor) if side == 0 else (neighbor, node)
+        path = []
+        node = forward_end
+        while node >= 0:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = backward_start
+        while node >= 0:
+            path.append(node)
+            node = parents[1][node]
+
+        return graph.path_names(path)
+
+    def _depth_first_search(self, stats=None):
+        """
+            Depth-First Search implementation.
+            Returns:
+                list or None: The solution path from initial_state to goal_state, or None if no path exists.
+        """
+        graph = self.road_graph
+        offsets, targets = graph.offsets, graph.targets
+        start = graph.index.get(self.initial_state)
+        goal = graph.index.get(self.goal_state)
+        if start is None or goal is None:
+            return None
+
+        n = len(graph)
+        parents = array('q', [-1]) * n
+        visited = bytearray(n)
+        stack = [start]
+        via = [-1]  # The node each stack entry was pushed from
+        found = False
+        on_expand = on_push = None
+        if stats is not None:
+            began = time.perf_counter()
+            on_expand, on_push = stats.on_expand, stats.on_push
+
+        while stack:
+            if stats is not None and len(stack) > stats.frontier_peak:
+                stats.frontier_peak = len(stack)
+            node = stack.pop()
+            parent = via.pop()
+            if visited[node]:
+                if stats is not None:
+                    stats.stale_pops += 1
+                continue
+            visited[node] = 1
+            parents[node] = parent
+
+            if node == goal:
+                found = True
+                break
+
+            if stats is not None:
+                stats.nodes_expanded += 1
+                stats.edges_relaxed += offsets[node + 1] - offsets[node]
+                if on_expand is not None:
+                    on_expand(node)
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                if not visited[neighbor]:
+                    stack.append(neighbor)
+                    via.append(node)
+                    if stats is not None:
+                        stats.heap_pushes += 1
+                        if on_push is not None:
+                            on_push(neighbor, len(stack))
+
+        if stats is not None:
+            stats.elapsed += time.perf_counter() - began
+        if not found:
+            return None
+        path = [node]
+        while node != start:
+            node = parents[node]
+            path.append(node)
+        return graph.path_names(reversed(path))
+
+    def _networkx_graph(self):
+        """The NetworkX copy of the road graph, built on first use."""
+        if self._network is None:
+            self._network = to_networkx(self.road_graph)
+        return self._network
+
+    def visualize_graph(self):
+        """
+        Visualizes the full graph using NetworkX.
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        G = self._networkx_graph()
+
+        plt.figure(figsize=(12, 8))
+        pos = cached_layout(self.road_graph)
+        nx.draw(G, pos, with_labels=True, node_size=300, node_color="lightblue", font_size=8, edge_color="gray")
+        plt.title("Ethiopian Cities Road Network")
+        plt.show()
+
+    def visualize_path(self, path):
+        """
+        Visualizes the search path in the graph.
+
+        Args:
+            path (list): The solution path to highlight.
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        G = self._networkx_graph()
+
+        plt.figure(figsize=(12, 8))
+        pos = cached_layout(self.road_graph)
+        nx.draw(G, pos, with_labels=True, node_size=300, node_color="lightgray", font_size=8, edge_color="gray")
+
+        # Highlight path
+        path_edges = list(zip(path, path[1:]))
+        nx.draw_networkx_nodes(G, pos, nodelist=path, node_color="red", node_size=400)
+        nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color="red", width=2)
+
+        plt.title(f"Path from {self.initial_state} to {self.goal_state}")
+        plt.show()
+
+
+def __getattr__(name):
+    # The sample data used to be imported eagerly here; it is now forwarded on first use.
+    if name in ('cities', 'roads'):
+        return getattr(cities_road_ufs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    search_agent_bfs = TravelEthiopia(cities_road_ufs.cities, cities_road_ufs.roads, "Addis Ababa", "Hawassa",
+                                      strategy="BFS")
+    solution_path_bfs = search_agent_bfs.search()
+    print("Solution Path (BFS):", solution_path_bfs)
+    if solution_path_bfs:
+        search_agent_bfs.visualize_path(solution_path_bfs)
+
+    search_agent_dfs = TravelEthiopia(cities_road_ufs.cities, cities_road_ufs.roads, "Addis Ababa", "Hawassa",
+                                      strategy="DFS")
+    solution_path_dfs = search_agent_dfs.search()
+    print("Solution Path (DFS):", solution_path_dfs)
+    if solution_path_dfs:
+        search_agent_dfs.visualize_path(solution_path_dfs)
+
+    # Visualize the full graph
+    search_agent_bfs.visualize_graph()
@@ -0,0 +1,166 @@
+import os
+import tempfile
+
+import numpy as np
+
+from .all_pairs import CACHE_DIR
+
+# NetworkX and matplotlib are imported inside the functions that draw, so importing the
+# search modules (which reference this one) stays cheap.
+
+LAYOUT_SEED = 42  # Seed of the spring layout, for consistent positioning across runs
+
+_layouts = {}  # In-process cache of layouts by graph fingerprint
+
+
+def to_networkx(graph):
+    """
+    Convert a RoadGraph into an undirected ``nx.Graph`` with 'weight' edge attributes.
+
+    Args:
+        graph (RoadGraph): The compiled graph.
+
+    Returns:
+        networkx.Graph: The graph, with every city as a node.
+    """
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(graph.names)
+    for u in range(len(graph)):
+        for v, weight, _ in graph.edges(u):
+            G.add_edge(graph.names[u], graph.names[v], weight=graph.cost(weight))
+    return G
+
+
+def cached_layout(graph, cache_dir=CACHE_DIR):
+    """
+    Return the spring layout of a graph, computing it at most once per road data.
+
+    Layouts are kept in memory and in ``cache_dir`` as ``<fingerprint>.layout.npy``
+    (positions in node-id order), so later runs and other processes reuse them.
+
+    Args:
+        graph (RoadGraph): The compiled graph.
+        cache_dir (str, optional): Directory of the ``.npy`` cache. Defaults to CACHE_DIR.
+
+    Returns:
+        dict: ``{city: numpy.ndarray([x, y])}``, as returned by ``nx.spring_layout``.
+    """
+    key = graph.fingerprint()
+    if key in _layouts:
+        return _layouts[key]
+
+    path = os.path.join(cache_dir, f'{key}.layout.npy')
+    if os.path.exists(path):
+        positions = np.load(path)
+    else:
+        import networkx as nx
+
+        layout = nx.spring_layout(to_networkx(graph), weight=None, seed=LAYOUT_SEED)
+        positions = np.array([layout[name] for name in graph.names]).reshape(len(graph), 2)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.npy')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, positions)
+        os.replace(tmp_path, path)
+
+    _layouts[key] = {name: positions[node] for node, name in enumerate(graph.names)}
+    return _layouts[key]
+
+
+class BatchRenderer:
+    """
+    Headless (Agg) renderer that writes many route PNGs over one base figure.
+
+    The road network, labels and title are drawn once and the rendered pixels are kept.
+    Each route then restores those pixels and draws only the path layer (its edges and
+    cities) on top, instead of redrawing the whole network.
+
+    Attributes:
+        graph (RoadGraph): The compiled graph.
+        layout (dict): City positions, from ``cached_layout``.
+        figure (matplotlib.figure.Figure): The figure every route is drawn on.
+    """
+
+    def __init__(self, graph, title="Ethiopian Cities Road Network", figsize=(12, 8), dpi=100,
+                 edge_labels=False, cache_dir=CACHE_DIR):
+        """
+        Draw the base figure.
+
+        Args:
+            graph (RoadGraph): The compiled graph.
+            title (str, optional): Figure title. Defaults to "Ethiopian Cities Road Network".
+            figsize (tuple, optional): Figure size in inches. Defaults to (12, 8).
+            dpi (int, optional): Resolution of the PNGs. Defaults to 100.
+            edge_labels (bool, optional): Whether to label roads with their weights. Defaults to False.
+            cache_dir (str, optional): Directory of the layout cache. Defaults to CACHE_DIR.
+        """
+        import networkx as nx
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self.graph = graph
+        self.layout = cached_layout(graph, cache_dir)
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self._canvas = FigureCanvasAgg(self.figure)
+        self._axes = self.figure.add_subplot()
+        self._axes.set_title(title)
+        self._axes.set_axis_off()
+
+        G = to_networkx(graph)
+        nx.draw_networkx(G, self.layout, ax=self._axes, node_size=300, node_color="lightgray",
+                         font_size=8, edge_color="gray")
+        if edge_labels:
+            nx.draw_networkx_edge_labels(G, self.layout, ax=self._axes,
+                                         edge_labels=nx.get_edge_attributes(G, 'weight'))
+
+        # The path layer is excluded from the base render and drawn per route.
+        self._path_edges = LineCollection([], colors="red", linewidths=2, animated=True)
+        self._axes.add_collection(self._path_edges)
+        self._path_nodes = self._axes.scatter([], [], s=400, c="red", zorder=3, animated=True)
+
+        self._canvas.draw()
+        self._background = self._canvas.copy_from_bbox(self.figure.bbox)
+
+    def render(self, path, filename):
+        """
+        Write one route as a PNG.
+
+        Args:
+            path (list): The route as a list of cities.
+            filename (str): Destination PNG file.
+        """
+        import matplotlib.image as mpimg
+
+        points = np.array([self.layout[city] for city in path]).reshape(len(path), 2)
+        self._path_edges.set_segments(list(zip(points[:-1], points[1:])))
+        self._path_nodes.set_offsets(points)
+
+        self._canvas.restore_region(self._background)
+        self._axes.draw_artist(self._path_edges)
+        self._axes.draw_artist(self._path_nodes)
+        mpimg.imsave(filename, np.asarray(self._canvas.buffer_rgba()))
+
+    def render_all(self, paths, directory, name="route_{:04d}.png"):
+        """
+        Write every route as a PNG.
+
+        Args:
+            paths (list): Routes as lists of cities; empty or None routes are skipped.
+            directory (str): Output directory, created if missing.
+            name (str, optional): File name pattern, formatted with the route's index.
+
+        Returns:
+            list: The written file names, in route order.
+        """
+        os.makedirs(directory, exist_ok=True)
+        filenames = []
+        for i, path in enumerate(paths):
+            if not path:
+                continue
+            filename = os.path.join(directory, name.format(i))
+            self.render(path, filename)
+            filenames.append(filename)
+        return filenames